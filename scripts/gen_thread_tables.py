@@ -0,0 +1,111 @@
+"""Generate the shipped diameter/pitch table assets.
+
+Writes the UNC/UNF/UNEF and metric-coarse series tables as structured
+.npy files under src/thread_fast/threads/data/, which the thread
+modules load (memory-mapped) at import instead of parsing list
+literals and building Python float objects. The literals below are the
+source of truth; rerun this script after editing them:
+
+    python scripts/gen_thread_tables.py
+"""
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = (Path(__file__).parent.parent
+            / 'src' / 'thread_fast' / 'threads' / 'data')
+
+# unified thread series dtype: diameter [in], threads per inch:
+UN_DTYPE = np.dtype([('d', np.float64), ('tpi', np.float64)])
+
+# metric series dtype: diameter [mm], pitch [mm/thread]:
+M_DTYPE = np.dtype([('d', np.float64), ('P', np.float64)])
+
+
+# coarse threads, UNC, UNRC:
+# machinery handbook 29th ed, pg 1816
+UNC = [
+    (0.073, 64.0),   # size 1
+    (0.086, 56.0),   # size 2
+    (0.099, 48.0),   # size 3
+    (0.112, 40.0),   # size 4
+    (0.125, 40.0),   # size 5
+    (0.138, 32.0),   # size 6
+    (0.164, 32.0),   # size 8
+    (0.190, 24.0),   # size 10
+    (0.216, 24.0),   # size 12
+    (0.250, 20.0),   # size 1/4
+    (0.3125, 18.0),  # size 5/16
+    (0.3750, 16.0),  # size 3/8
+    (0.4375, 14.0),  # size 7/16
+    (0.5000, 13.0),  # size 1/2
+    (0.5625, 12.0),  # size 9/16
+    (0.6250, 11.0),  # size 5/8
+    (0.7500, 10.0),  # size 3/4
+    (0.8750, 9.0),   # size 7/8
+    #TODO: finish...
+]
+
+# fine threads, UNF, UNRF:
+UNF = [
+    (0.0600, 80.0),  # size 0
+    (0.0730, 72.0),  # size 1
+    (0.0860, 64.0),  # size 2
+    (0.0990, 56.0),  # size 3
+    (0.1120, 48.0),  # size 4
+    (0.1250, 44.0),  # size 5
+    (0.1380, 40.0),  # size 6
+    (0.1640, 36.0),  # size 8
+    (0.1900, 32.0),  # size 10
+    (0.2160, 28.0),  # size 12
+    (0.2500, 28.0),  # size 1/4
+    (0.3125, 24.0),  # size 5/16
+    (0.3750, 24.0),  # size 3/8
+    (0.4375, 20.0),  # size 7/16
+    (0.5000, 20.0),  # size 1/2
+    (0.5625, 18.0),  # size 9/16
+    (0.6250, 18.0),  # size 5/8
+    (0.7500, 16.0),  # size 3/4
+    (0.8750, 14.0),  # size 7/8
+    (1.0000, 12.0),  # size 1"
+    (1.1250, 12.0),  # size 1 1/8
+    (1.2500, 12.0),  # size 1 1/4
+    (1.3750, 12.0),  # size 1 3/8
+    (1.5000, 12.0),  # size 1 1/2
+    #TODO: finish...
+]
+
+# extra fine threads, UNEF, UNREF: Table 4c. pg 1846
+UNEF = [
+    (0.2160, 32.0),  # size 12
+    (0.2500, 32.0),  # size 1/4
+    (0.3125, 32.0),  # size 5/16
+    #TODO: finish...
+]
+
+# coarse pitch metric thread M profile series:
+# machinery handbook 29th ed, pg 1880
+MC = [
+    (1.6, 0.35),
+    (2.0, 0.4),
+    (2.5, 0.45),
+    #TODO: finish...
+]
+
+
+def main() -> None:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    for name, rows, dtype in (
+            ('unc', UNC, UN_DTYPE),
+            ('unf', UNF, UN_DTYPE),
+            ('unef', UNEF, UN_DTYPE),
+            ('mc', MC, M_DTYPE)):
+        table = np.array(rows, dtype=dtype)
+        # the lookup helpers rely on a sorted diameter column:
+        assert np.all(np.diff(table['d']) > 0.0), name
+        np.save(DATA_DIR / f'{name}.npy', table)
+        print(f"wrote {name}.npy ({table.shape[0]} rows)")
+
+
+if __name__ == "__main__":
+    main()
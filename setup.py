@@ -4,6 +4,21 @@
 from setuptools import setup, find_packages
 # from distutils.core import setup
 
+# optional: compile the Cython mirrors of the hot equation kernels
+# (*_cy.pyx) when Cython is installed; the package works fine without
+# them (pure Python / numba / AOT paths cover the same API):
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [
+            'src/thread_fast/nasa_tm_106943/nasa_tm_106943_cy.pyx',
+            'src/thread_fast/nsts_08307a/nsts_08307a_cy.pyx',
+            'src/thread_fast/threads/_accel.pyx',
+        ],
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name='thread_fast',
     version='0.0.1',  # major.minor[.patch[.sub]]
@@ -14,10 +29,20 @@ setup(
     license='General Purpose',
     packages=['thread_fast'],
     package_dir={'': 'src'},
+    package_data={'thread_fast': ['threads/data/*.npy']},
     install_requires=[
         #'json',
-        'numpy', 
+        'numpy',
         'scipy',
         'matplotlib',
-    ]
+    ],
+    extras_require={
+        # optional: compiles the hot equation kernels to ufuncs
+        'jit': ['numba'],
+        # optional: multi-threaded batch expression evaluation
+        'numexpr': ['numexpr'],
+        # optional: compiled kernels without the LLVM footprint of numba
+        'cython': ['cython'],
+    },
+    ext_modules=ext_modules,
 )
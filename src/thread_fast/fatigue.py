@@ -0,0 +1,66 @@
+"""Fatigue damage accumulation.
+
+Miner's rule per nasa-std-5020b, equation 87 (Appendix C, pg 99):
+D = sum_i (n_i / N_i), with D <= 1.0 predicting survival.
+
+Two implementations of the same reduction live here: a NumPy one-liner
+(one fused divide + sum, memory-bound, best for long spectra) and an
+njit scalar loop that LLVM auto-vectorizes and that other jitted code
+can call without leaving the compiled region.  miner_damage dispatches
+between them on input size.
+"""
+import numpy as np
+
+from thread_fast.jit_helpers import HAVE_NUMBA, njit
+
+# below this length the compiled loop beats the NumPy reduction (ufunc
+# dispatch overhead dominates short spectra); above it NumPy's blocked
+# reduction wins:
+_NUMPY_MIN_LEN = 4096
+
+
+def _miner_numpy(n: np.ndarray, N: np.ndarray) -> float:
+    """Miner's-rule sum as one vectorized divide + reduce."""
+    return float(np.sum(n / N))
+
+
+@njit(fastmath=True, cache=True)
+def _miner_numba(n: np.ndarray, N: np.ndarray) -> float:
+    """Miner's-rule sum as a compiled scalar loop.
+
+    Call this form directly from other njit functions so the damage
+    sum stays inside the compiled region.
+    """
+    d = 0.0
+    for i in range(n.shape[0]):
+        d += n[i] / N[i]
+    return d
+
+
+def miner_damage(n, N):
+    """Calculate cumulative damage according to Miner's rule.
+
+    nasa-std-5020b, equation 87, pg 99
+
+    Args:
+        n: number of loading cycles at each stress level
+        N: number of cycles to failure at that stress level
+    Returns:
+        tuple: (D, fail) where D is the cumulative damage and fail is
+            True when D > 1.0 (failure predicted)
+    """
+    n = np.ascontiguousarray(n, dtype=np.float64)
+    N = np.ascontiguousarray(N, dtype=np.float64)
+    if HAVE_NUMBA and n.shape[0] < _NUMPY_MIN_LEN:
+        D = _miner_numba(n, N)
+    else:
+        D = _miner_numpy(n, N)
+    return D, bool(np.greater(D, 1.0))
+
+
+def main() -> None:
+    pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Optional Numba support for the equation kernels.
+
+Numba is an optional dependency.  When it is installed, the hot
+element-wise equation kernels are compiled to ufuncs / machine code so
+that large design-sweep arrays run at native speed.  When it is not
+installed, the same functions fall back to plain Python + NumPy
+broadcasting, so results are identical either way.
+
+Usage:
+
+    from thread_fast.jit_helpers import HAVE_NUMBA, vectorize, njit
+
+    def eq(x, y):
+        return x * y
+
+    if HAVE_NUMBA:
+        eq = vectorize(['float64(float64, float64)'], target='parallel')(eq)
+"""
+
+try:
+    from numba import njit, prange, vectorize, guvectorize
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    # stand-ins so modules can reference these names unconditionally:
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+
+    def vectorize(*args, **kwargs):
+        """No-op stand-in for numba.vectorize.
+
+        The decorated kernels are pure arithmetic, so NumPy broadcasting
+        already makes them work on scalars and arrays alike.
+        """
+        def decorator(func):
+            return func
+        return decorator
+
+    def guvectorize(*args, **kwargs):
+        """No-op stand-in for numba.guvectorize."""
+        def decorator(func):
+            return func
+        return decorator
+
+    # plain range so prange-based loops still run without numba:
+    prange = range
@@ -338,6 +338,50 @@ class MetricFastener:
         tau = trq * self.da / 2.0 / j
         return np.sqrt(sigma**2 + 3.0 * tau**2)
 
+    def analyze(self, mu_s, mu_w, preload=None) -> dict:
+        """Batched joint analysis over broadcastable parameter arrays.
+
+        Every quantity below is plain broadcast arithmetic, so passing
+        1-D arrays of friction coefficients (and optionally preloads)
+        evaluates the whole sensitivity study in one vectorized pass
+        instead of one Python round-trip per method per combination.
+        Scalars work too and return scalars.
+
+        Args:
+            mu_s: coefficient(s) of friction between the threads
+            mu_w: coefficient(s) of friction at the bearing surfaces
+            preload: desired preload(s); defaults to 80% of the yield
+                clamping force at each mu_s
+        Returns:
+            dict: arrays (broadcast shape of the inputs) keyed by
+                'k', 'Fycl', 'preload', 'Treq', 'T1', 'T2', 'T3',
+                'Ttot', 'sigma'
+        """
+        mu_s = np.asarray(mu_s, dtype=np.float64)
+        mu_w = np.asarray(mu_w, dtype=np.float64)
+        k = self.estimated_k(mus=mu_s, muw=mu_w)
+        Fycl = self.yield_clamping_force(mu_s)
+        if preload is None:
+            preload = 0.8 * Fycl
+        else:
+            preload = np.asarray(preload, dtype=np.float64)
+        Treq = self.torque_for_tension(preload=preload, k=k)
+        T1 = self.tension_torque_t1(preload)
+        T2 = self.thread_friction_torque_t2(mu_s, preload)
+        T3 = self.washer_friction_torque_t3(mu_w, preload)
+        sigma = self.thread_section_stress(preload, T2)
+        return {
+            'k': k,
+            'Fycl': Fycl,
+            'preload': preload,
+            'Treq': Treq,
+            'T1': T1,
+            'T2': T2,
+            'T3': T3,
+            'Ttot': T1 + T2 + T3,
+            'sigma': sigma,
+        }
+
     def __str__(self):
         """called during print(object)"""
         return "\n".join([
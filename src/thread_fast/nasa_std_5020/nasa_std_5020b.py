@@ -5,8 +5,22 @@ SYSTEMS IN SPACEFLIGHT HARDWARE
 
 2021
 """
+import dataclasses
+import math
+from dataclasses import dataclass
+
 import numpy as np
-from typing import List
+from typing import List, Tuple
+
+from thread_fast.jit_helpers import HAVE_NUMBA, njit, prange, vectorize
+
+# sqrt(3), for the pure-shear von Mises form:
+_SQRT3 = math.sqrt(3.0)
+
+# 1/sqrt(n_f) for the fastener counts seen in practice, precomputed at
+# import so eq5 / eq26b do a dict lookup and a multiply instead of
+# dispatching a scalar sqrt per evaluation:
+_INV_SQRT_NF = {k: 1.0 / math.sqrt(k) for k in range(1, 65)}
 
 
 ############################################
@@ -117,7 +131,10 @@ def eq5(c_min: float,
     Returns:
         float: min initial preload
     """
-    P_pi_min = c_min * (1.0 - gamma / np.sqrt(n_f)) * P_pi_nom
+    inv_sqrt_nf = _INV_SQRT_NF.get(n_f)
+    if inv_sqrt_nf is None:
+        inv_sqrt_nf = 1.0 / math.sqrt(n_f)
+    P_pi_min = c_min * (1.0 - gamma * inv_sqrt_nf) * P_pi_nom
     return P_pi_min
 
 
@@ -451,7 +468,7 @@ def eq19(
         float: margin of safety for separation
     """
     assert FF >= 1.0, "error, fitting factor, FF, must be >= 1.0"
-    MS_sep = P_p_min / (FF * FS_sep * P_tL) - 1.0
+    MS_sep = P_p_min / (FF * SF_sep * P_tL) - 1.0
     return MS_sep
 
 
@@ -584,6 +601,60 @@ def eq23mod(
     return MS_comb
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def check_interaction(
+        P_su: np.ndarray,
+        P_tu: np.ndarray,
+        f_bu: np.ndarray,
+        P_su_allow: float,
+        P_tu_allow: float,
+        F_tu: float,
+        F_bu: float,
+        mode: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+    """Batch-evaluate the eq 20-23 interaction criteria over load cases.
+
+    One compiled parallel loop over a mission spectrum instead of a
+    scalar eq2Xmod call per case: the x**2.5 / x**1.5 powers become
+    multiply + sqrt so LLVM can vectorize the body, and the mode branch
+    is hoisted by the compiler since mode is loop-invariant.
+
+    Args:
+        P_su: shear load per case, shape (N,)
+        P_tu: tensile load per case, shape (N,)
+        f_bu: bending stress per case, shape (N,)
+        P_su_allow: allowable ultimate shear load
+        P_tu_allow: allowable ultimate tensile load
+        F_tu: ultimate tensile strength
+        F_bu: ultimate bending (plastic) strength
+        mode: 20, 21, 22 or 23, selecting the criterion of that equation
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: left-hand side value per case,
+            and the per-case pass flag (lhs <= 1.0)
+    """
+    n = P_su.shape[0]
+    lhs = np.empty(n, dtype=np.float64)
+    ok = np.empty(n, dtype=np.bool_)
+    inv_su = 1.0 / P_su_allow
+    inv_tu = 1.0 / P_tu_allow
+    for i in prange(n):
+        rs = P_su[i] * inv_su
+        rt = P_tu[i] * inv_tu
+        if mode == 20:
+            y = rt + f_bu[i] / F_tu
+            v = rs * rs * math.sqrt(rs) + y * math.sqrt(y)
+        elif mode == 21:
+            v = rs * rs * math.sqrt(rs) + rt * math.sqrt(rt) + f_bu[i] / F_bu
+        elif mode == 22:
+            y = rt + f_bu[i] / F_tu
+            v = rs**1.2 + y * y
+        else:
+            v = rs**1.2 + rt * rt + f_bu[i] / F_bu
+        lhs[i] = v
+        ok[i] = v <= 1.0
+    return lhs, ok
+
+
 ############################################
 # A.2 Accounting for Preload Variation, pg 46
 ############################################
@@ -684,7 +755,10 @@ def eq26b(
     assert gamma >= 0.0
     assert D > 0.0
     assert K_nom > 0.0
-    P_pi_min = (1.0 - gamma / np.sqrt(n_f)) * T_min / (K_nom * D)
+    inv_sqrt_nf = _INV_SQRT_NF.get(n_f)
+    if inv_sqrt_nf is None:
+        inv_sqrt_nf = 1.0 / math.sqrt(n_f)
+    P_pi_min = (1.0 - gamma * inv_sqrt_nf) * T_min / (K_nom * D)
     return P_pi_min
 
 
@@ -897,7 +971,39 @@ def eq57(l4: float, l2: float, L: float) -> float:
 # eq79:
 # eq80:
 
-    
+
+def principal_stresses_pure_shear(tau):
+    """Principal stresses for a pure-shear stress state.
+
+    The A.8 stress tensor has only the tau_xz component, so the
+    eigenvalues are analytically {0, +tau, -tau}; no per-point 3x3
+    eigensolve is needed.
+
+    Args:
+        tau: shear stress, scalar or array
+    Returns:
+        tuple: (S1, S2, S3) = (0, tau, -tau), matching the input shape
+    """
+    tau = np.asarray(tau, dtype=np.float64)
+    return np.zeros_like(tau), tau, -tau
+
+
+def von_mises_pure_shear(tau: float) -> float:
+    """Von Mises equivalent stress for pure shear: sqrt(3) * |tau|.
+
+    Compiled to a broadcasting ufunc under numba, so it composes with
+    other load arrays in one expression.
+    """
+    return _SQRT3 * abs(tau)
+
+
+if HAVE_NUMBA:
+    von_mises_pure_shear = vectorize(
+        ['float32(float32)', 'float64(float64)'],
+        fastmath=True,
+    )(von_mises_pure_shear)
+
+
 ############################################
 # A.10 Margin of safety for joint slip, pg 73
 # supplement to sections 4.4.1 and 4.4.6
@@ -934,9 +1040,152 @@ def eq87(n_i: list[float], N_i: list[float]) -> float:
     return D
 
 
+############################################
+# Hoisted safety-factor configuration
+############################################
+
+
+@dataclass(frozen=True, slots=True)
+class SafetyConfig:
+    """Precomputed margin-of-safety denominators for one configuration.
+
+    eq 6, 7, 14, 15, 16 and 19 all divide by an FF * FS * P_limit
+    product that is invariant across a Monte Carlo or spectrum loop.
+    This hoists each product once per configuration and stores its
+    reciprocal, so every margin evaluation is one multiply and one
+    subtract instead of two multiplies and a divide.
+
+    P_limit may be a scalar or an array of per-fastener limit loads;
+    in the array case the reciprocal is taken once here, saving the
+    denominator broadcast allocation per margin call.
+    """
+
+    # ultimate, yield and separation factors of safety:
+    FS_u: float
+    FS_y: float
+    FS_sep: float
+
+    # limit load (tensile or shear, per the margin being evaluated):
+    P_limit: float
+
+    # fitting factor:
+    FF: float = 1.15
+
+    # reciprocal denominators, populated in __post_init__:
+    inv_ult_denom: float = dataclasses.field(init=False, default=0.0)
+    inv_yield_denom: float = dataclasses.field(init=False, default=0.0)
+    inv_sep_denom: float = dataclasses.field(init=False, default=0.0)
+
+    def __post_init__(self):
+        assert self.FF >= 1.0, "error, fitting factor, FF, must be >= 1.0"
+        assert self.FS_u >= 1.0, "error, safety factor, FS_u, must be >= 1.0"
+        assert self.FS_y >= 1.0, "error, safety factor, FS_y, must be >= 1.0"
+        object.__setattr__(
+            self, 'inv_ult_denom', 1.0 / (self.FF * self.FS_u * self.P_limit))
+        object.__setattr__(
+            self, 'inv_yield_denom', 1.0 / (self.FF * self.FS_y * self.P_limit))
+        object.__setattr__(
+            self, 'inv_sep_denom', 1.0 / (self.FF * self.FS_sep * self.P_limit))
+
+    def ms_ultimate(self, P_tu_allow):
+        """eq 6 / 7 / 14 with the denominator hoisted."""
+        return P_tu_allow * self.inv_ult_denom - 1.0
+
+    def ms_yield(self, P_ty_allow):
+        """eq 15 / 16 with the denominator hoisted."""
+        return P_ty_allow * self.inv_yield_denom - 1.0
+
+    def ms_separation(self, P_p_min):
+        """eq 19 with the denominator hoisted."""
+        return P_p_min * self.inv_sep_denom - 1.0
+
+
+############################################
+# Struct-of-arrays joint state
+############################################
+
+
+@dataclass
+class FastenerArray:
+    """Struct-of-arrays state for the fasteners of one joint.
+
+    Each field is a contiguous float64 array of length n_f, so the
+    preload and margin equations below run as whole-array expressions
+    over the joint instead of scalar eq* calls per fastener, and the
+    same buffers feed check_interaction without copies.
+    """
+
+    # maximum / minimum initial preload (eq 3, 4 or 5):
+    P_pi_max: np.ndarray
+    P_pi_min: np.ndarray
+
+    # preload increase / decrease due to temperature:
+    P_deltat_max: np.ndarray
+    P_deltat_min: np.ndarray
+
+    # short term relaxation of preload:
+    P_pr: np.ndarray
+
+    # loss of preload from material creep:
+    P_pc: np.ndarray
+
+    # bolt and clamped-part stiffnesses:
+    k_b: np.ndarray
+    k_c: np.ndarray
+
+    # load introduction factor:
+    n: np.ndarray
+
+    # limit tensile load per fastener:
+    P_tL: np.ndarray
+
+    def __post_init__(self):
+        shape = None
+        for field in dataclasses.fields(self):
+            arr = np.ascontiguousarray(getattr(self, field.name),
+                                       dtype=np.float64)
+            setattr(self, field.name, arr)
+            if shape is None:
+                shape = arr.shape
+            assert arr.shape == shape, field.name
+
+    def max_preload(self) -> np.ndarray:
+        """eq 1 over the joint: maximum predicted preload, P_p_max."""
+        return self.P_pi_max + self.P_deltat_max
+
+    def min_preload(self) -> np.ndarray:
+        """eq 2 over the joint: minimum predicted preload, P_p_min."""
+        return self.P_pi_min - self.P_pr - self.P_pc - self.P_deltat_min
+
+    def stiffness_factor(self) -> np.ndarray:
+        """eq 9 over the joint: stiffness factor, phi."""
+        return self.k_b / (self.k_b + self.k_c)
+
+    def bolt_load(self, P_t) -> np.ndarray:
+        """eq 8 over the joint: bolt tensile load at max preload."""
+        return self.max_preload() + self.n * self.stiffness_factor() * P_t
+
+    def load_to_exceed(self, P_allow) -> np.ndarray:
+        """eq 10 / eq 17 over the joint: applied load taking the bolt
+        past the given allowable (ultimate or yield)."""
+        return (P_allow - self.max_preload()) / (self.n * self.stiffness_factor())
+
+    def separation_load(self) -> np.ndarray:
+        """eq 11 over the joint: projected separation load at max preload."""
+        return self.max_preload() / (1.0 - self.n * self.stiffness_factor())
+
+    def ms_yield(self, P_ty_allow, FS_y: float, FF: float = 1.15) -> np.ndarray:
+        """eq 15 over the joint: yield margin of safety."""
+        return P_ty_allow / (FF * FS_y * self.P_tL) - 1.0
+
+    def ms_separation(self, FS_sep: float, FF: float = 1.15) -> np.ndarray:
+        """eq 19 over the joint: separation margin of safety."""
+        return self.min_preload() / (FF * FS_sep * self.P_tL) - 1.0
+
+
 def main() -> None:
     # Tests:
-    
+
     # bolt stiffness:
     k_b = 1.0
     
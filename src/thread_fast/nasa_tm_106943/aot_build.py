@@ -0,0 +1,80 @@
+"""Ahead-of-time build of the NASA-TM-106943 scalar kernels.
+
+Run once at build/packaging time:
+
+    python -m thread_fast.nasa_tm_106943.aot_build
+
+This produces a compiled extension module ``nasa_tm_106943_aot`` next to
+this file.  Short-lived scripts (CLI tools, CI checks) then get native
+speed kernels with no JIT warmup, and the compiled module does not need
+numba installed at runtime.  nasa_tm_106943.py picks the AOT kernels up
+automatically when numba itself is not available.
+
+The exported kernels are the pure-arithmetic closed forms; input
+validation stays in the Python wrappers.
+"""
+import math
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('nasa_tm_106943_aot')
+cc.output_dir = __file__.rsplit('/', 1)[0]
+
+PI_OVER_4 = np.pi / 4.0
+FIVE_PI_OVER_8 = 5.0 * np.pi / 8.0
+
+
+@cc.export('eq2', 'f8(f8, f8, f8, f8, f8, f8)')
+def eq2(D_p, D, psi, alpha, mu, mu_c):
+    """Estimated nut factor, K."""
+    tan_psi = math.tan(psi)
+    sec_alpha = 1.0 / math.cos(alpha)
+    return D_p / (2.0 * D) * ((tan_psi + mu * sec_alpha)
+                              / (1.0 - mu * tan_psi * sec_alpha)) + 0.625 * mu_c
+
+
+@cc.export('eq4', 'f8(f8, f8)')
+def eq4(D, p):
+    """Tensile area, A_t."""
+    x = D - 0.9743*p
+    return PI_OVER_4 * x * x
+
+
+@cc.export('eq32', 'f8(f8, f8, f8)')
+@cc.export('eq37', 'f8(f8, f8, f8)')
+@cc.export('eq48', 'f8(f8, f8, f8)')
+def eq32(A, E_b, L):
+    """Bolt stiffness, K_b."""
+    return A * E_b / L
+
+
+@cc.export('eq55', 'f8(f8, f8)')
+@cc.export('eq64', 'f8(f8, f8)')
+@cc.export('eq69', 'f8(f8, f8)')
+def eq55(F_su, A_s):
+    """Shear allowable / ultimate load, F_su * A_s."""
+    return F_su * A_s
+
+
+@cc.export('eq63', 'f8(f8, f8)')
+def eq63(L_e, D_minor_int):
+    """Shear area of the bolt thread, A_s."""
+    return FIVE_PI_OVER_8 * L_e * D_minor_int
+
+
+@cc.export('eq29', 'f8(f8, f8)')
+def eq29(K_b, K_j):
+    """Stiffness factor, phi."""
+    return K_b / (K_b + K_j)
+
+
+@cc.export('eq44', 'f8(f8, f8, f8)')
+def eq44(E_j, D, L):
+    """Joint stiffness, K_j, configuration 3."""
+    return np.pi * E_j * D / (np.log(5.0*((2.0*L + 0.5*D)/(2.0*L + 2.5*D))))
+
+
+if __name__ == "__main__":
+    cc.verbose = True
+    cc.compile()
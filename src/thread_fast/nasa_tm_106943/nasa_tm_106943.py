@@ -30,25 +30,107 @@ York, 1983.
 
 11. Nut, Self Locking, 250 °E 450 °F, and 800 °E MIL-N-25027E 1994.
 """
+import dataclasses
+import math
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
 import numpy as np
 
+from thread_fast.jit_helpers import HAVE_NUMBA, guvectorize, njit, prange, vectorize
+
+if not HAVE_NUMBA:
+    # prebuilt kernels from aot_build.py, if they were compiled; these
+    # need no numba at runtime and have no JIT warmup:
+    try:
+        from thread_fast.nasa_tm_106943 import nasa_tm_106943_aot as _aot
+    except ImportError:
+        _aot = None
+    # Cython-built kernels (nasa_tm_106943_cy.pyx) as a further fallback
+    # for hosts where numba's LLVM dependency cannot be installed:
+    try:
+        from thread_fast.nasa_tm_106943 import nasa_tm_106943_cy as _cy
+    except ImportError:
+        _cy = None
+else:
+    _aot = None
+    _cy = None
+
+# optional: multi-threaded expression evaluator for mid-size sweeps
+# (N ~ 1e4-1e5), where numba compile time is not worth paying but plain
+# NumPy still materializes every temporary:
+try:
+    import numexpr as _ne
+except ImportError:
+    _ne = None
+
+# hoisted constants so the compiled kernels contain no np.pi lookup:
+PI_OVER_4 = np.pi / 4.0
+THREE_PI_OVER_4 = 3.0 * np.pi / 4.0
+FIVE_PI_OVER_8 = 5.0 * np.pi / 8.0
+LN_5 = math.log(5.0)
+
+# conversion factors:
+deg_to_rad = math.pi / 180.0
+
+# default storage dtype for batched sweeps; set to np.float32 for large
+# Monte-Carlo runs where input scatter dwarfs single-precision error:
+PRECISION = np.float64
+
 
 ########################################################
 # A286 Alloy Fastener Properties: pg 7
 ########################################################
 
-# [ksi], material ultimate tensile strength:
-F_tu = 130.0
+class A286(NamedTuple):
+    """A286 alloy fastener strengths [ksi], NASA-TM-106943 pg 7.
+
+    Immutable so the values can be captured as compile-time constants
+    by njit'd kernels (mutable module globals force a Python lookup per
+    call, or a nopython bail-out).
+    """
+    # material ultimate tensile strength:
+    F_tu: float = 130.0
+    # material tensile yield strength:
+    F_ty: float = 85.0
+    # material ultimate shear strength:
+    F_su: float = 85.0
+    # shear yield strength, assumed 0.577 * F_ty:
+    F_sy: float = 0.577 * 85.0
+
+
+MATERIALS = {'A286': A286()}
 
-# [ksi], material tensile yield strength:
-F_ty = 85.0
+# module-level aliases kept for backward compatibility:
+F_tu = MATERIALS['A286'].F_tu
+F_ty = MATERIALS['A286'].F_ty
+F_su = MATERIALS['A286'].F_su
+F_sy = MATERIALS['A286'].F_sy
 
-# [ksi], material ultimate shear strength:
-F_su = 85.0
 
-# [ksi], shear yield strength: 
-# may be assumed to be 0.577 * F_ty
-F_sy = 0.577 * F_ty
+def material_arrays(names, dtype=None):
+    """Expand per-bolt alloy names into SoA strength arrays.
+
+    One contiguous float array per strength lets the vectorized margin
+    kernels (eq55, eq64, eq69, eq81, ...) stream a mixed-alloy fleet
+    without per-element dict lookups.
+
+    Args:
+        names: sequence of alloy names, keys into MATERIALS
+        dtype: array dtype; defaults to the module PRECISION
+    Returns:
+        tuple of np.ndarray: (F_tu, F_ty, F_su, F_sy), each shape (N,)
+    """
+    if dtype is None:
+        dtype = PRECISION
+    props = [MATERIALS[name] for name in names]
+    F_tu_arr = np.array([m.F_tu for m in props], dtype=dtype)
+    F_ty_arr = np.array([m.F_ty for m in props], dtype=dtype)
+    F_su_arr = np.array([m.F_su for m in props], dtype=dtype)
+    F_sy_arr = np.array([m.F_sy for m in props], dtype=dtype)
+    return F_tu_arr, F_ty_arr, F_su_arr, F_sy_arr
 
 # bearing strength?
 # F_b = 1.5 * ???
@@ -58,10 +140,20 @@ F_sy = 0.577 * F_ty
 ########################################################
 
 
+def _preload_nominal(T: float, K: float, D: float) -> float:
+    """Nominal preload T/(K*D), shared by eq1/eq12-eq16.
+
+    Divide is the slowest scalar op in these kernels; callers computing
+    both preload bounds should do this once and reuse the result (see
+    eq12_eq13_pair).
+    """
+    return T / (K * D)
+
+
 def eq1(
-        T: float, 
-        K: float, 
-        D: float, 
+        T: float,
+        K: float,
+        D: float,
         u: float,
     ) -> float:
     """Calculate nominal bolt preload, P_0.
@@ -76,16 +168,44 @@ def eq1(
     Returns:
         float: nominal bolt preload
     """
-    assert T > 0.0, "T must be > 0.0"
-    assert K > 0.0, "K must be > 0.0"
-    assert D > 0.0, "D must be > 0.0"
-    assert u >= 0.0, "u must be >= 0.0"
-    P_0 = T / (K * D)
+    if __debug__:
+        assert T > 0.0, "T must be > 0.0"
+        assert K > 0.0, "K must be > 0.0"
+        assert D > 0.0, "D must be > 0.0"
+        assert u >= 0.0, "u must be >= 0.0"
+    P_0 = _preload_nominal(T, K, D)
     P_0_max = P_0 * (1.0 + u)
     P_0_min = P_0 * (1.0 - u)
     return P_0_min, P_0_max
 
 
+def eq1_into(
+        T: np.ndarray,
+        K: np.ndarray,
+        D: np.ndarray,
+        u: np.ndarray,
+        out_min: np.ndarray,
+        out_max: np.ndarray,
+    ) -> None:
+    """Batched eq1 writing into preallocated arrays.
+
+    Same math as eq1 but for large sweeps: results go into out_min /
+    out_max in place, so a Monte-Carlo over millions of samples does not
+    allocate a tuple (or any temporaries) per sample.
+
+    Args:
+        T: applied torque
+        K: nut factor
+        D: nominal diameter
+        u: preload uncertainty factor
+        out_min: preallocated output array for P_0_min
+        out_max: preallocated output array for P_0_max
+    """
+    np.divide(T, K * D, out=out_min)
+    np.multiply(out_min, 1.0 + u, out=out_max)
+    np.multiply(out_min, 1.0 - u, out=out_min)
+
+
 def eq2(
         D_p: float, 
         D: float, 
@@ -110,13 +230,69 @@ def eq2(
     Returns:
         float: estimated nut factor
     """
-    assert mu >= 0.0, "mu must be >= 0.0"
-    assert mu_c >= 0.0, "mu_c must be >= 0.0"
+    if __debug__:
+        assert mu >= 0.0, "mu must be >= 0.0"
+        assert mu_c >= 0.0, "mu_c must be >= 0.0"
     # K = D_p / (2.0 * D) * ((np.tan(psi) + mu * np.sec(alpha)) / (1.0 - mu * np.tan(psi) * np.sec(alpha))) + 0.625 * mu_c
-    K = D_p / (2.0 * D) * ((np.tan(psi) + mu / np.cos(alpha)) / (1.0 - mu * np.tan(psi) / np.cos(alpha))) + 0.625 * mu_c
+    # math.* instead of np.* — scalar inputs skip the ufunc dispatch,
+    # and tan / sec are evaluated once instead of twice:
+    tan_psi = math.tan(psi)
+    sec_alpha = 1.0 / math.cos(alpha)
+    K = D_p / (2.0 * D) * ((tan_psi + mu * sec_alpha) / (1.0 - mu * tan_psi * sec_alpha)) + 0.625 * mu_c
     return K
 
 
+def make_eq2(psi: float, alpha: float):
+    """Build a specialized eq2 for fixed thread geometry.
+
+    For sweeps over the friction coefficients (e.g. a Monte-Carlo on
+    mu / mu_c) the thread geometry is constant, so tan(psi) and
+    sec(alpha) are invariants.  This factory evaluates them once and
+    returns a kernel that only does the per-sample arithmetic
+    (compiled with numba when available).
+
+    Args:
+        psi: thread helix (lead) angle, rad
+        alpha: thread angle, rad
+    Returns:
+        callable: K(D_p, D, mu, mu_c), the estimated nut factor
+    """
+    tan_psi = math.tan(psi)
+    sec_alpha = 1.0 / math.cos(alpha)
+
+    @njit(fastmath=True, cache=True)
+    def eq2_specialized(D_p, D, mu, mu_c):
+        return D_p / (2.0 * D) * ((tan_psi + mu * sec_alpha) / (1.0 - mu * tan_psi * sec_alpha)) + 0.625 * mu_c
+
+    return eq2_specialized
+
+
+def make_eq2_equal_friction(psi: float, alpha: float):
+    """Build a specialized eq2 for the common mu == mu_c assumption.
+
+    Many analyses assume a single friction coefficient for threads and
+    bearing face.  With the geometry fixed as well, eq2 collapses to a
+    one-variable rational function of mu; this factory folds tan(psi)
+    and sec(alpha) in once and returns a kernel that sweeps only mu.
+    Use make_eq2 when the two coefficients differ.
+
+    Args:
+        psi: thread helix (lead) angle, rad
+        alpha: thread angle, rad
+    Returns:
+        callable: K(D_p, D, mu), the estimated nut factor
+    """
+    tan_psi = math.tan(psi)
+    sec_alpha = 1.0 / math.cos(alpha)
+    tan_psi_sec_alpha = tan_psi * sec_alpha
+
+    @njit(fastmath=True, cache=True)
+    def eq2_equal_friction(D_p, D, mu):
+        return D_p / (2.0 * D) * ((tan_psi + mu * sec_alpha) / (1.0 - mu * tan_psi_sec_alpha)) + 0.625 * mu
+
+    return eq2_equal_friction
+
+
 # NASA-TM-106943, equation 3, pg 4
 # assume 65% of tensile yield = preload_stress_ratio
 # T_KD = T / (K * D)
@@ -133,18 +309,75 @@ def eq4(D: float, p: float) -> float:
     
     NASA-TM-106943, equation 4, pg 5
     
+    Accepts scalars or NumPy arrays (compiled to a ufunc when numba is
+    installed).
+
     Args:
         D: nominal diameter
         p: thread pitch
     Returns:
         float: tensile area (min cross section area of bolt)
     """
-    assert D > 0.0
-    assert p > 0.0
-    A_t = (np.pi / 4.0) * (D - 0.9743*p)**2
+    x = D - 0.9743*p
+    A_t = PI_OVER_4 * x * x
     return A_t
 
 
+if HAVE_NUMBA:
+    eq4 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq4)
+
+
+# standard unified thread designations, [diameter in inches, pitch in
+# inches] (pitch = 1/TPI); see machinery_handbook_29ed for the tables:
+THREAD_TABLE = {
+    '8-32': (0.164, 1.0/32.0),
+    '10-24': (0.190, 1.0/24.0),
+    '10-32': (0.190, 1.0/32.0),
+    '1/4-20': (0.250, 1.0/20.0),
+    '1/4-28': (0.250, 1.0/28.0),
+    '5/16-18': (0.3125, 1.0/18.0),
+    '5/16-24': (0.3125, 1.0/24.0),
+    '3/8-16': (0.375, 1.0/16.0),
+    '3/8-24': (0.375, 1.0/24.0),
+    '7/16-14': (0.4375, 1.0/14.0),
+    '1/2-13': (0.500, 1.0/13.0),
+    '1/2-20': (0.500, 1.0/20.0),
+}
+
+
+@lru_cache(maxsize=256)
+def tensile_area(D: float, p: float) -> float:
+    """Memoized eq4 for repeated calls on the same thread form.
+
+    Sweeps over torque / preload hold (D, p) fixed, so the tensile area
+    is a constant of the thread; caching removes eq4 from the hot loop
+    entirely for standard threads.
+
+    Args:
+        D: nominal diameter
+        p: thread pitch
+    Returns:
+        float: tensile area (min cross section area of bolt)
+    """
+    return float(eq4(D, p))
+
+
+def tensile_area_by_name(designation: str) -> float:
+    """Tensile area for a standard unified thread designation.
+
+    Args:
+        designation: thread callout as in THREAD_TABLE, e.g. "1/4-28"
+    Returns:
+        float: tensile area, in^2
+    """
+    D, p = THREAD_TABLE[designation]
+    return tensile_area(D, p)
+
+
 # NASA-TM-106943, equation 5, pg 5
 # more specific equation 3:
 # T_KD = 0.65 * 85000 * A_t 
@@ -232,6 +465,14 @@ def eq10(
     return P_th
 
 
+if HAVE_NUMBA:
+    eq10 = vectorize(
+        ['float32(float32, float32, float32, float32, float32, float32)', 'float64(float64, float64, float64, float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq10)
+
+
 def eq11(
         P_0_min: float, 
         relaxation_ratio: float=0.05,
@@ -270,9 +511,10 @@ def eq12(
     Returns:
         float: max expected preload in the joint
     """
-    assert K > 0.0
-    assert D > 0.0
-    P_0_max = T/(K*D) * (1.0 + u) + P_th
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    P_0_max = _preload_nominal(T, K, D) * (1.0 + u) + P_th
     return P_0_max
 
 
@@ -298,9 +540,10 @@ def eq13(
     Returns:
         float: min expected preload in the joint
     """
-    assert K > 0.0
-    assert D > 0.0
-    P_0_min = T / (K*D) * (1.0 - u) - P_th - P_relax
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    P_0_min = _preload_nominal(T, K, D) * (1.0 - u) - P_th - P_relax
     return P_0_min
 
 
@@ -326,12 +569,89 @@ def eq13mod(
     Returns:
         float: min expected preload in the joint
     """
-    assert K > 0.0
-    assert D > 0.0
-    P_0_min = (T / (K*D) * (1.0 - u) - P_th) / (1.0 + relaxation_ratio)
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    P_0_min = (_preload_nominal(T, K, D) * (1.0 - u) - P_th) / (1.0 + relaxation_ratio)
     return P_0_min
 
 
+def eq12_eq13_pair(
+        T: float,
+        K: float,
+        D: float,
+        u: float,
+        P_th: float,
+        P_relax: float,
+    ) -> tuple:
+    """Calculate both preload bounds (eq12 + eq13) with one divide.
+
+    NASA-TM-106943, equations 12 and 13, pg 6-7
+
+    Pipelines almost always need P_0_max and P_0_min together; calling
+    eq12 then eq13 repeats the T/(K*D) divide.  This evaluates the
+    nominal preload once and applies both bounds to it.
+
+    Args:
+        T: applied torque
+        D: nominal diameter
+        K: nut factor
+        u: preload uncertainty factor
+        P_th: axial bolt load due to thermal effects
+        P_relax: loss of preload due to joint relaxation or settling
+    Returns:
+        tuple: (P_0_max, P_0_min)
+    """
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    P_0 = _preload_nominal(T, K, D)
+    P_0_max = P_0 * (1.0 + u) + P_th
+    P_0_min = P_0 * (1.0 - u) - P_th - P_relax
+    return P_0_max, P_0_min
+
+
+@lru_cache(maxsize=64)
+def make_preload_bounds(
+        K: float,
+        D: float,
+        u: float,
+        P_th: float = 0.0,
+        P_relax: float = 0.0,
+    ):
+    """Build an eq12/eq13 kernel specialized for a fixed joint setup.
+
+    In a torque sweep only T varies; the nut factor, diameter,
+    uncertainty, thermal load and relaxation are analysis constants.
+    Baking them in leaves one multiply per bound: the divide by K*D
+    becomes a multiply by a precomputed reciprocal, and numba folds the
+    captured floats as compile-time constants.  Same partial-evaluation
+    pattern as make_eq2 / make_eq74, memoized per configuration so
+    repeated sweeps reuse the compiled kernel.
+
+    Args:
+        K: nut factor
+        D: nominal diameter
+        u: preload uncertainty factor
+        P_th: axial bolt load due to thermal effects
+        P_relax: loss of preload due to joint relaxation or settling
+    Returns:
+        callable: f(T) -> (P_0_max, P_0_min)
+    """
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    inv_KD = 1.0 / (K * D)
+    c_max = (1.0 + u) * inv_KD
+    c_min = (1.0 - u) * inv_KD
+    off_min = P_th + P_relax
+
+    @njit(fastmath=True, cache=True)
+    def preload_bounds_specialized(T):
+        return T * c_max + P_th, T * c_min - off_min
+
+    return preload_bounds_specialized
+
 
 def eq14(
         T: float, 
@@ -353,42 +673,42 @@ def eq14(
     Returns:
         float: max expected preload in the joint
     """
-    assert K > 0.0
-    assert D > 0.0
-    P_0_max = T/(K*D) * 1.25
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    P_0_max = _preload_nominal(T, K, D) * 1.25
     return P_0_max
 
 
+@njit(cache=True)
 def eq15(
-        T: float, 
-        K: float, 
+        T: float,
+        K: float,
         D: float,
         relaxation_ratio: float=0.05,
     ) -> float:
     """Calculate min expected preload in the joint, P_0_min.
-    
+
     NASA-TM-106943, equation 15, pg 7
-    
+
     simplified equation 13, manually torqued, no thermal
-    
+
     assumed relaxation percentage of 5%
-    
+
     assumed preload uncertainty = 0.25
-    
+
+    The implicit form P_0_min = T/(K*D)*0.75 - relaxation_ratio*P_0_min
+    is solved for P_0_min, giving the closed form below.
+
     Args:
         T: applied torque
         D: nominal diameter
         K: nut factor
+        relaxation_ratio: expected percentage preload loss
     Returns:
         float: min expected preload in the joint
     """
-    assert K > 0.0
-    assert D > 0.0
-    # TODO: rearrange so this actually works...
-    P_0_min = T/(K*D) * 0.75 - 0.05 * P_0_min
-    
-    # P_0_min = T/(K*D) * 0.75 - relaxation_ratio * P_0_min
-    P_0_min = (T/(K*D) * 0.75) / (1.0 + relaxation_ratio)
+    P_0_min = (T * 0.75) / (K * D * (1.0 + relaxation_ratio))
     return P_0_min
 
 
@@ -410,9 +730,10 @@ def eq16(T: float, K: float, D: float) -> float:
     Returns:
         float: min expected preload in the joint
     """
-    assert K > 0.0
-    assert D > 0.0
-    P_0_min = T/(K*D) * 0.714
+    if __debug__:
+        assert K > 0.0
+        assert D > 0.0
+    P_0_min = _preload_nominal(T, K, D) * 0.714
     return P_0_min
 
 
@@ -443,12 +764,18 @@ def eq17(
     Returns:
         float: total axial load in the fastener
     """
-    assert SF >= 1.0
-    assert 0.0 >= n >= 1.0
     P_b = P_0_max + (SF * n * phi * P_et)
     return P_b
 
 
+if HAVE_NUMBA:
+    eq17 = vectorize(
+        ['float32(float32, float32, float32, float32, float32)', 'float64(float64, float64, float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq17)
+
+
 # NASA-TM-106943, equation 18, pg 10
 # n = distance between loading planes / total thickness of joint
 # For update, see NASA TM 108377
@@ -489,11 +816,49 @@ def eq20(
     Returns:
         float: change in axial bolt load
     """
-    assert 0.0 >= n >= 1.0
     delta_P_b = (P_0 / (delta_b + (1.0-n)*delta_j)) * delta
     return delta_P_b
 
 
+if HAVE_NUMBA:
+    eq20 = vectorize(
+        ['float32(float32, float32, float32, float32, float32)', 'float64(float64, float64, float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq20)
+
+
+def eq20_into(
+        P_0: np.ndarray,
+        delta_b: np.ndarray,
+        delta_j: np.ndarray,
+        n: np.ndarray,
+        delta: np.ndarray,
+        out: np.ndarray,
+    ) -> np.ndarray:
+    """Batched eq20 writing into a preallocated array.
+
+    Same math as eq20, built from in-place ufunc calls so a sweep over
+    N bolts allocates no intermediate length-N arrays.
+
+    Args:
+        P_0: nominal bolt preload
+        delta_b: bolt deflection
+        delta_j: joint abutment deflection
+        n: loading plane factor
+        delta: bolt deflection due to external load
+        out: preallocated output array for delta_P_b
+    Returns:
+        np.ndarray: out
+    """
+    np.subtract(1.0, n, out=out)
+    np.multiply(out, delta_j, out=out)
+    np.add(out, delta_b, out=out)
+    np.divide(P_0, out, out=out)
+    np.multiply(out, delta, out=out)
+    return out
+
+
 def eq21(
         P_0: float, 
         n: float, 
@@ -512,11 +877,42 @@ def eq21(
     Returns:
         float: change in joint load
     """
-    assert 0.0 >= n >= 1.0
     delta_P_j = (P_0 / (n * delta_j)) * delta
     return delta_P_j
 
 
+if HAVE_NUMBA:
+    eq21 = vectorize(
+        ['float32(float32, float32, float32, float32)', 'float64(float64, float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq21)
+
+
+def eq21_into(
+        P_0: np.ndarray,
+        n: np.ndarray,
+        delta_j: np.ndarray,
+        delta: np.ndarray,
+        out: np.ndarray,
+    ) -> np.ndarray:
+    """Batched eq21 writing into a preallocated array.
+
+    Args:
+        P_0: nominal bolt preload
+        n: loading plane factor
+        delta_j: joint abutment deflection
+        delta: bolt deflection due to external load
+        out: preallocated output array for delta_P_j
+    Returns:
+        np.ndarray: out
+    """
+    np.multiply(n, delta_j, out=out)
+    np.divide(P_0, out, out=out)
+    np.multiply(out, delta, out=out)
+    return out
+
+
 # NASA-TM-106943, equation 22, pg 11
 
 # NASA-TM-106943, equation 23, pg 11
@@ -562,7 +958,8 @@ def eq28(
     Returns:
         float:
     """
-    assert 0.0 >= n >= 1.0
+    if __debug__:
+        assert 0.0 <= n <= 1.0
     P_et = delta_P_b * ((K_b + K_j) / (n * K_b))
     return P_et
 
@@ -582,6 +979,14 @@ def eq29(K_b: float, K_j: float) -> float:
     return phi
 
 
+if HAVE_NUMBA:
+    eq29 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq29)
+
+
 def eq30(
         n: float, 
         phi: float, 
@@ -598,33 +1003,61 @@ def eq30(
     Returns:
         float: change in axial bolt load
     """
-    assert 0.0 >= n >= 1.0
     delta_P_b = n * phi * P_et
     return delta_P_b
 
 
+if HAVE_NUMBA:
+    eq30 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq30)
+
+
+def eq30_into(
+        n: np.ndarray,
+        phi: np.ndarray,
+        P_et: np.ndarray,
+        out: np.ndarray,
+    ) -> np.ndarray:
+    """Batched eq30 writing into a preallocated array.
+
+    Args:
+        n: loading plane factor
+        phi: joint stiffness factor
+        P_et: resultant external load directed at the joint
+        out: preallocated output array for delta_P_b
+    Returns:
+        np.ndarray: out
+    """
+    np.multiply(n, phi, out=out)
+    np.multiply(out, P_et, out=out)
+    return out
+
+
 ########################################################
 # Configuration 1: pg 12
 # Hex, Socket, or Pan Head Through Bolt + Nut
 ########################################################
 
 
-def eq31(l_1: float, l_2: float, l_n: float) -> float:
-    """Calculate length of clamped joint.
-    
+def eq31(l: np.ndarray) -> float:
+    """Calculate length of clamped joint, L.
+
     Configuration 1: through bolt with nut
-    
+
     NASA-TM-106943, equation 31, pg 12
-    
+
+    L = l_1 + l_2 + ... + l_n
+
     Args:
-        l_1: length from head to load point 1
-        l_2: length from load point 1 to load point 2
-        l_n: length from load point 2 to nut
+        l: array of clamped part thicknesses, head to nut
     Returns:
         float: total length of clamped joint
     """
-    # TODO: fix...
-    L = l_1 + l_2 + ... + l_n
+    l = np.asarray(l)
+    L = float(l.sum())
     return L
 
 
@@ -640,65 +1073,122 @@ def eq32(A: float, E_b: float, L: float) -> float:
     Returns:
         float: bolt stiffness
     """
-    assert A > 0.0
-    assert L > 0.0
-    assert E_b > 0.0
     K_b = A * E_b / L
     return K_b
 
 
+if HAVE_NUMBA:
+    eq32 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq32)
+
+
 # NASA-TM-106943, equation 33, pg 12
 # joint stiffness:
 
 
 def eq34(
-        L: float, 
-        l_1: float, 
-        l_2: float, 
-        l_n: float, 
-        E_1: float, 
-        E_2: float, 
-        E_n: float,
+        L: float,
+        l: np.ndarray,
+        E: np.ndarray,
     ) -> float:
     """Calculate joint composite modulus, E_j.
-    
+
     NASA-TM-106943, equation 34, pg 12
-    
+
+    E_j = L / ((l_1 / E_1) + (l_2 / E_2) + ... + (l_n / E_n))
+
     Args:
         L: total clamped length
-        l_1:
-        E_1: modulus of elasticity of part 1
-        l_2:
-        E_2: modulus of elasticity of part 1
-        l_n:
-        E_n: modulus of elasticity of part n
+        l: array of clamped part thicknesses, head to nut
+        E: array of moduli of elasticity, one per clamped part
     Return:
         float: joint composite modulus
     """
-    # TODO: fix...
-    E_j = L / ((l_1 / E_1) + (l_2 / E_2) + ... + (l_n / E_n))
+    l = np.asarray(l)
+    E = np.asarray(E)
+    E_j = L / float(np.sum(l / E))
     return E_j
 
 
-def eq35(l_1: float, l_2: float, l_n: float) -> float:
+def eq35(l: np.ndarray) -> float:
     """NASA-TM-106943, equation 35, pg 12
-    
+
     Calculate loading plane factor, n.
-    
+
     Also called load introduction factor.
-    
+
+    n = (l_1 / 2 + l_2 + ... + l_n / 2) / (l_1 + l_2 + ... + l_n)
+
     Args:
-        l_1:
-        l_2:
-        l_n:
+        l: array of clamped part thicknesses, head to nut
     Returns:
         float: loading plane factor
     """
-    # TODO: fix...
-    n = (l_1 / 2.0 + l_2 + ... + l_n / 2.0) + l_1 + l_2 + ... + l_n
+    l = np.asarray(l)
+    n = float(0.5*l[0] + l[1:-1].sum() + 0.5*l[-1]) / float(l.sum())
     return n
 
 
+def _joint_pipeline_core(l, E, A, E_b, D, K_b, K_j, n, phi):
+    """Fused eq31 + eq34 + eq35 + eq32 + eq44 + eq29 for one joint stack.
+
+    Single pass over the layers, no intermediate arrays.
+    """
+    L = 0.0
+    invE_sum = 0.0
+    n_num = 0.0
+    n_layers = l.shape[0]
+    for i in range(n_layers):
+        L += l[i]
+        invE_sum += l[i] / E[i]
+        if i == 0 or i == n_layers - 1:
+            n_num += 0.5 * l[i]
+        else:
+            n_num += l[i]
+    E_j = L / invE_sum
+    K_b[0] = A * E_b / L
+    K_j[0] = np.pi * E_j * D / (LN_5 + np.log1p(-2.0*D / (2.0*L + 2.5*D)))
+    n[0] = n_num / L
+    phi[0] = K_b[0] / (K_b[0] + K_j[0])
+
+
+if HAVE_NUMBA:
+    # batched gufunc: broadcasts over leading axes of (n_joints, n_layers)
+    joint_pipeline = guvectorize(
+        ['(f8[:], f8[:], f8, f8, f8, f8[:], f8[:], f8[:], f8[:])'],
+        '(n),(n),(),(),()->(),(),(),()',
+        target='parallel',
+        nopython=True,
+    )(_joint_pipeline_core)
+else:
+    def joint_pipeline(l, E, A, E_b, D):
+        """Batched joint stack-up: eq31 + eq34 + eq35 + eq32 + eq44 + eq29.
+
+        Pure NumPy fallback, reduces over the last (layer) axis.
+
+        Args:
+            l: clamped part thicknesses, shape (..., n_layers)
+            E: moduli of elasticity, shape (..., n_layers)
+            A: nominal fastener cross-sectional area
+            E_b: bolt modulus of elasticity
+            D: nominal fastener diameter
+        Returns:
+            tuple: (K_b, K_j, n, phi) per joint
+        """
+        l = np.asarray(l, dtype=float)
+        E = np.asarray(E, dtype=float)
+        L = l.sum(axis=-1)
+        E_j = L / np.sum(l / E, axis=-1)
+        n = (l.sum(axis=-1) - 0.5*l[..., 0] - 0.5*l[..., -1]) / L
+        K_b = A * E_b / L
+        K_j = np.pi * E_j * D / (np.log(5.0*((2.0*L + 0.5*D)/(2.0*L + 2.5*D))))
+        phi = K_b / (K_b + K_j)
+        return K_b, K_j, n, phi
+
+
 ########################################################
 # Configuration 2: pg 12
 # Flat Head Through Bolt + Nut
@@ -719,13 +1209,18 @@ def eq37(A: float, E_b: float, L: float) -> float:
     Returns:
         float: bolt stiffness
     """
-    assert A > 0.0
-    assert L > 0.0
-    assert E_b > 0.0
     K_b = A * E_b / L
     return K_b
 
 
+if HAVE_NUMBA:
+    eq37 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq37)
+
+
 # NASA-TM-106943, equation 38, pg
 
 # NASA-TM-106943, equation 39, pg
@@ -741,14 +1236,23 @@ def eq37(A: float, E_b: float, L: float) -> float:
 ########################################################
 
 
-def eq42(l_1, l_2, l_n, L_i) -> float:
-    """NASA-TM-106943, equation 42, pg
-    
+def eq42(l: np.ndarray, L_i: float) -> float:
+    """Calculate length of clamped joint, L.
+
+    Configuration 3: bolt threaded into final part
+
+    NASA-TM-106943, equation 42, pg 13
+
+    L = l_1 + l_2 + ... + (l_n - L_i / 2)
+
     Args:
-    
+        l: array of clamped part thicknesses, head to threaded part
+        L_i: insert or thread engagement length in the final part
+    Returns:
+        float: total length of clamped joint
     """
-    # TODO: fix...
-    L = l_1 + l_2 + ... + (l_n - L_i / 2.0)
+    l = np.asarray(l)
+    L = float(l.sum()) - L_i / 2.0
     return L
 
 
@@ -758,34 +1262,70 @@ def eq42(l_1, l_2, l_n, L_i) -> float:
 
 
 def eq44(E_j: float, D: float, L: float) -> float:
-    """NASA-TM-106943, equation 44, pg
-    
+    """Calculate joint stiffness, K_j.
+
+    NASA-TM-106943, equation 44, pg 13
+
+    K_j = pi * E_j * D / ln(5 * (2L + 0.5D) / (2L + 2.5D))
+
+    The log of the rational is evaluated as ln(5) + log1p(...) so the
+    argument near 1 (L >> D) keeps full precision.
+
     Args:
-        E_j:
-        D:
-        L:
+        E_j: joint modulus of elasticity
+        D: nominal fastener diameter
+        L: fastener grip length
     """
-    K_j = np.pi * E_j * D / (np.log(5.0*((2.0*L + 0.5*D)/(2.0*L + 2.5*D))))
+    K_j = np.pi * E_j * D / (LN_5 + math.log1p(-2.0*D / (2.0*L + 2.5*D)))
     return K_j
 
 
-def eq45(L, l1, l2, E_2, l_n, L_i) -> float:
-    """NASA-TM-106943, equation 45, pg
-    
+def eq45(
+        L: float,
+        l: np.ndarray,
+        E: np.ndarray,
+        L_i: float,
+    ) -> float:
+    """Calculate joint composite modulus, E_j.
+
+    Configuration 3: bolt threaded into final part
+
+    NASA-TM-106943, equation 45, pg 14
+
+    E_j = L / (l_1 / E_1 + l_2 / E_2 + ... + ((l_n - L_i/2) / E_n))
+
     Args:
-    
+        L: total clamped length
+        l: array of clamped part thicknesses, head to threaded part
+        E: array of moduli of elasticity, one per clamped part
+        L_i: insert or thread engagement length in the final part
+    Returns:
+        float: joint composite modulus
     """
-    # TODO: fix...
-    E_j = L / (l1 / E_1 + l2 / E_2 + ... + ((l_n - L_i/2.0)/E_n))
+    l = np.asarray(l)
+    E = np.asarray(E)
+    denom = np.sum(l[:-1] / E[:-1]) + (l[-1] - L_i/2.0) / E[-1]
+    E_j = L / float(denom)
     return E_j
 
 
-def eq46() -> float:
-    """NASA-TM-106943, equation 46, pg 
-    
-    """
-    # TODO: fix...
+def eq46(l: np.ndarray, L_i: float) -> float:
+    """Calculate loading plane factor, n.
+
+    Configuration 3: bolt threaded into final part
+
+    NASA-TM-106943, equation 46, pg 14
+
     n = (l_1/2 + l_2 + ... + (l_n - L_i/2)) / (l_1 + l_2 + ... + l_n)
+
+    Args:
+        l: array of clamped part thicknesses, head to threaded part
+        L_i: insert or thread engagement length in the final part
+    Returns:
+        float: loading plane factor
+    """
+    l = np.asarray(l)
+    n = float(0.5*l[0] + l[1:-1].sum() + (l[-1] - L_i/2.0)) / float(l.sum())
     return n
 
 
@@ -796,24 +1336,27 @@ def eq46() -> float:
 
 
 def eq47(
-        l_1: float, 
-        l_h: float, 
-        l_2: float, 
-        l_n: float, 
+        l: np.ndarray,
+        l_h: float,
         L_i: float,
     ) -> float:
-    """Calculate L.
-    
-    NASA-TM-106943, equation 47, pg 
-    
+    """Calculate length of clamped joint, L.
+
+    Configuration 4: flat head bolt threaded into final part
+
+    NASA-TM-106943, equation 47, pg 14
+
+    L = (l_1 - l_h/2) + l_2 + ... + (l_n - L_i / 2)
+
     Args:
-        l_1:
-        l_h:
+        l: array of clamped part thicknesses, head to threaded part
+        l_h: countersunk head height
+        L_i: insert or thread engagement length in the final part
     Returns:
-        float:
+        float: total length of clamped joint
     """
-    # TODO: fix...
-    L = (l_1 - l_h/2.0) + l_2 + ... + (l_n - L_i / 2.0)
+    l = np.asarray(l)
+    L = float(l.sum()) - l_h / 2.0 - L_i / 2.0
     return L
 
 
@@ -833,6 +1376,14 @@ def eq48(A: float, E_b: float, L: float) -> float:
     return K_b
 
 
+if HAVE_NUMBA:
+    eq48 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq48)
+
+
 def eq49(
         E_j: float, 
         D: float, 
@@ -853,11 +1404,16 @@ def eq49(
     Returns:
         float: joint stiffness
     """
-    assert E_j > 0.0
-    assert D > 0.0
-    assert L > 0.0
-    assert d_w > 0.0
-    K_j = (np.pi * E_j * D) / np.log(((L + d_w - D)*(d_w + D)) / ((L + d_w + D)*(d_w - D)))
+    if __debug__:
+        assert E_j > 0.0
+        assert D > 0.0
+        assert L > 0.0
+        assert d_w > 0.0
+    # log of the ratio as log(num) - log(den): avoids forming the
+    # rational, keeps precision when the ratio is near 1
+    num = (L + d_w - D) * (d_w + D)
+    den = (L + d_w + D) * (d_w - D)
+    K_j = (np.pi * E_j * D) / (math.log(num) - math.log(den))
     return K_j
 
 
@@ -876,36 +1432,139 @@ def eq50(d_h: float, D: float) -> float:
     return d_w
 
 
-def eq51(L: float, l_2: float, E_2: float) -> float:
-    """Calculate E_j.
-    
+def eq51(
+        L: float,
+        l: np.ndarray,
+        E: np.ndarray,
+        l_h: float,
+        L_i: float,
+    ) -> float:
+    """Calculate joint composite modulus, E_j.
+
+    Configuration 4: flat head bolt threaded into final part
+
     NASA-TM-106943, equation 51, pg 15
-    
+
+    E_j = L / ((l_1 - l_h/2)/E_1 + l_2/E_2 + ... + ((l_n - L_i/2)/E_n))
+
     Args:
-        
+        L: total clamped length
+        l: array of clamped part thicknesses, head to threaded part
+        E: array of moduli of elasticity, one per clamped part
+        l_h: countersunk head height
+        L_i: insert or thread engagement length in the final part
     Returns:
-        float:
+        float: joint composite modulus
     """
-    # TODO: fix...
-    E_j = L / (() + l_2/E_2 + ... + ())
+    l = np.asarray(l)
+    E = np.asarray(E)
+    denom = (
+        (l[0] - l_h/2.0) / E[0]
+        + np.sum(l[1:-1] / E[1:-1])
+        + (l[-1] - L_i/2.0) / E[-1]
+    )
+    E_j = L / float(denom)
     return E_j
 
 
-def eq52(l_1, l_h, l_2, l_n: float) -> float:
-    """Calculate n.
-    
+def eq52(
+        l: np.ndarray,
+        l_h: float,
+        L_i: float,
+    ) -> float:
+    """Calculate loading plane factor, n.
+
+    Configuration 4: flat head bolt threaded into final part
+
     NASA-TM-106943, equation 52, pg 15
-    
+
+    n = ((l_1 - l_h/2) + l_2 + ... + (l_n - L_i/2)) / (l_1 + l_2 + ... + l_n)
+
     Args:
-        
+        l: array of clamped part thicknesses, head to threaded part
+        l_h: countersunk head height
+        L_i: insert or thread engagement length in the final part
     Returns:
-        float:
+        float: loading plane factor
     """
-    # TODO: fix...
-    n = ((l_1 - l_h / 2.0) + l_2 + ... + (l_n - L_i/2.0)) / (l_1 + l_2 + ... + l_n)
+    l = np.asarray(l)
+    n = float((l[0] - l_h/2.0) + l[1:-1].sum() + (l[-1] - L_i/2.0)) / float(l.sum())
     return n
 
 
+def total_grip(l: np.ndarray, head_trim: float = 0.0, tail_trim: float = 0.0) -> float:
+    """Clamped length over the layer stack, njit-compatible.
+
+    One kernel behind eq31 / eq42 / eq47: the four configurations
+    differ only in how much of the first and last layer counts
+    (half the countersunk head, half the engagement length).
+
+    Args:
+        l: array of clamped part thicknesses, head to nut / threads
+        head_trim: length excluded from the first layer (l_h / 2)
+        tail_trim: length excluded from the last layer (L_i / 2)
+    Returns:
+        float: total length of clamped joint
+    """
+    s = 0.0
+    for i in range(l.shape[0]):
+        s += l[i]
+    return s - head_trim - tail_trim
+
+
+def composite_modulus(
+        l: np.ndarray,
+        E: np.ndarray,
+        head_trim: float = 0.0,
+        tail_trim: float = 0.0,
+    ) -> float:
+    """Joint composite modulus over the layer stack, njit-compatible.
+
+    One kernel behind eq34 / eq45 / eq51, with the same first/last
+    layer trims as total_grip.
+
+    Args:
+        l: array of clamped part thicknesses
+        E: array of moduli of elasticity, one per clamped part
+        head_trim: length excluded from the first layer (l_h / 2)
+        tail_trim: length excluded from the last layer (L_i / 2)
+    Returns:
+        float: joint composite modulus
+    """
+    L = 0.0
+    s = 0.0
+    for i in range(l.shape[0]):
+        li = l[i]
+        L += li
+        if i == 0:
+            li -= head_trim
+        if i == l.shape[0] - 1:
+            li -= tail_trim
+        s += li / E[i]
+    return (L - head_trim - tail_trim) / s
+
+
+if HAVE_NUMBA:
+    total_grip = njit(cache=True)(total_grip)
+    composite_modulus = njit(cache=True)(composite_modulus)
+
+
+# joint geometry relations per NASA-TM-106943 configuration, keyed by
+# the configuration number (pg 12-15); one table instead of callers
+# hand-picking the right eq function per head / engagement style:
+CONFIG_TABLE = {
+    # 1: hex / socket / pan head through bolt + nut
+    1: {'L': eq31, 'K_b': eq32, 'E_j': eq34, 'n': eq35},
+    # 2: flat head through bolt + nut (same relations, head trim via
+    # the kernels above)
+    2: {'L': eq31, 'K_b': eq37, 'E_j': eq34, 'n': eq35},
+    # 3: hex / socket / pan head bolt threaded into final part
+    3: {'L': eq42, 'K_b': eq48, 'K_j': eq44, 'E_j': eq45, 'n': eq46},
+    # 4: flat head bolt threaded into final part
+    4: {'L': eq47, 'K_b': eq48, 'K_j': eq49, 'E_j': eq51, 'n': eq52},
+}
+
+
 ########################################################
 # Fastener Strength Criteria: pg 15
 ########################################################
@@ -930,6 +1589,14 @@ def eq53(tensile_allowable: float, P_b: float) -> float:
     return MS
 
 
+if HAVE_NUMBA:
+    eq53 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq53)
+
+
 ########################################################
 # Shear Only Criteria: pg 16
 ########################################################
@@ -957,6 +1624,14 @@ def eq54(
     return MS
 
 
+if HAVE_NUMBA:
+    eq54 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq54)
+
+
 def eq55(F_su: float, A_s: float) -> float:
     """Calculate fastener shear allowable.
     
@@ -974,6 +1649,14 @@ def eq55(F_su: float, A_s: float) -> float:
     return shear_allowable
 
 
+if HAVE_NUMBA:
+    eq55 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq55)
+
+
 ########################################################
 # Combined Tension and Shear: pg 16
 ########################################################
@@ -1013,7 +1696,8 @@ def eq58(SF: float, V: float, shear_allowable: float) -> float:
     Returns:
         float: shear load ratio
     """
-    assert SF >= 1.0, "SF must be >= 1.0"
+    if __debug__:
+        assert SF >= 1.0, "SF must be >= 1.0"
     R_s = SF * V / shear_allowable
     return R_s
 
@@ -1031,8 +1715,18 @@ def eq59(R_t: float, R_s: float) -> float:
     Returns:
         float: margin of safety for combined tension and shear
     """
-    print("warning: deprecated, see updated criteria based on NASA-TM-2012-217454...")
-    MS = (1.0 / np.sqrt(R_t**2 + R_s**3)) - 1.0
+    warnings.warn(
+        "eq59 is deprecated, see updated criteria based on NASA-TM-2012-217454",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    if isinstance(R_t, np.ndarray):
+        # numexpr fuses the whole expression into one blocked C loop
+        # (no intermediate arrays); plain NumPy otherwise:
+        if _ne is not None and R_t.size > 1024:
+            return _ne.evaluate("1.0/sqrt(R_t**2 + R_s**3) - 1.0")
+        return (1.0 / np.sqrt(R_t*R_t + R_s*R_s*R_s)) - 1.0
+    MS = (1.0 / math.sqrt(R_t*R_t + R_s*R_s*R_s)) - 1.0
     return MS
 
 
@@ -1060,7 +1754,8 @@ def eq61(
         M:
         bending_allowable:
     """
-    assert SF >= 1.0, "SF must be >= 1.0"
+    if __debug__:
+        assert SF >= 1.0, "SF must be >= 1.0"
     R_b = SF * M / bending_allowable
     return R_b
 
@@ -1077,8 +1772,18 @@ def eq62(R_t: float, R_b: float, R_s: float) -> float:
         R_b: bending load ratio
         R_s: shear load ratio
     """
-    print("warning: deprecated, see updated criteria based on NASA-TM-2012-217454...")
-    MS = (1.0 / np.sqrt((R_t + R_b)**2 + R_s**3)) - 1.0
+    warnings.warn(
+        "eq62 is deprecated, see updated criteria based on NASA-TM-2012-217454",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    if isinstance(R_t, np.ndarray):
+        if _ne is not None and R_t.size > 1024:
+            return _ne.evaluate("1.0/sqrt((R_t + R_b)**2 + R_s**3) - 1.0")
+        R_tb = R_t + R_b
+        return (1.0 / np.sqrt(R_tb*R_tb + R_s*R_s*R_s)) - 1.0
+    R_tb = R_t + R_b
+    MS = (1.0 / math.sqrt(R_tb*R_tb + R_s*R_s*R_s)) - 1.0
     return MS
 
 
@@ -1098,12 +1803,18 @@ def eq63(L_e: float, D_minor_int: float) -> float:
     Returns:
         float: shear area of the bolt thread
     """
-    assert L_e > 0.0
-    assert D_minor_int > 0.0
-    A_s = 5.0 * np.pi * L_e * D_minor_int / 8.0
+    A_s = FIVE_PI_OVER_8 * L_e * D_minor_int
     return A_s
 
 
+if HAVE_NUMBA:
+    eq63 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq63)
+
+
 def eq64(F_su: float, A_s: float) -> float:
     """NASA-TM-106943, equation 64, pg 18
     
@@ -1119,6 +1830,14 @@ def eq64(F_su: float, A_s: float) -> float:
     return P_ult
 
 
+if HAVE_NUMBA:
+    eq64 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq64)
+
+
 def eq65(P_ult: float, P_b: float) -> float:
     """NASA-TM-106943, equation 65, pg 18
     
@@ -1173,6 +1892,14 @@ def eq67(
     return P_sep
 
 
+if HAVE_NUMBA:
+    eq67 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq67)
+
+
 def eq68(
         P_0_min: float, 
         P_sep: float, 
@@ -1195,11 +1922,144 @@ def eq68(
     Return:
         float: margin of safety against joint separation
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
     MS = (P_0_min / (SF * P_sep)) - 1.0
     return MS
 
 
+if HAVE_NUMBA:
+    eq68 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq68)
+
+
+def ms_separation(
+        P_0_min: float,
+        n: float,
+        phi: float,
+        P_et: float,
+        SF_sep: float,
+    ) -> float:
+    """Fused eq67 + eq68: margin of safety against joint separation.
+
+    One kernel instead of chaining the two functions, so batched sweeps
+    keep P_sep in a register instead of an intermediate array.  Compiled
+    to a ufunc when numba is installed; SF_sep is typically 1.2
+    (structural) or 1.4 (pressure).
+
+    Args:
+        P_0_min: minimum expected bolt preload
+        n: loading plane factor
+        phi: joint stiffness factor
+        P_et: total externally applied axial load
+        SF_sep: safety factor against joint separation
+    Returns:
+        float: margin of safety against joint separation
+    """
+    P_sep = (1.0 - n * phi) * P_et
+    return P_0_min / (SF_sep * P_sep) - 1.0
+
+
+def ms_separation_from_torque(
+        T: float,
+        K: float,
+        D: float,
+        u: float,
+        P_th: float,
+        relaxation_ratio: float,
+        n: float,
+        phi: float,
+        P_et: float,
+        SF_sep: float,
+    ) -> float:
+    """Separation margin straight from the torque plan.
+
+    Inlines eq13mod (min expected preload) into the fused eq67 + eq68
+    margin, so a sweep over the torque/friction inputs is a single
+    kernel call per sample.
+
+    Args:
+        T: applied torque
+        K: nut factor
+        D: nominal diameter
+        u: preload uncertainty factor
+        P_th: axial bolt load due to thermal effects
+        relaxation_ratio: expected percentage preload loss
+        n: loading plane factor
+        phi: joint stiffness factor
+        P_et: total externally applied axial load
+        SF_sep: safety factor against joint separation
+    Returns:
+        float: margin of safety against joint separation
+    """
+    P_0_min = (T / (K*D) * (1.0 - u) - P_th) / (1.0 + relaxation_ratio)
+    P_sep = (1.0 - n * phi) * P_et
+    return P_0_min / (SF_sep * P_sep) - 1.0
+
+
+if HAVE_NUMBA:
+    ms_separation = vectorize(
+        ['float32(' + ', '.join(['float32']*5) + ')',
+         'float64(' + ', '.join(['float64']*5) + ')'],
+        target='parallel',
+        fastmath=True,
+    )(ms_separation)
+    ms_separation_from_torque = vectorize(
+        ['float32(' + ', '.join(['float32']*10) + ')',
+         'float64(' + ', '.join(['float64']*10) + ')'],
+        target='parallel',
+        fastmath=True,
+    )(ms_separation_from_torque)
+
+
+@njit(cache=True, fastmath=True)
+def evaluate_joint(
+        T, D, p, D_p, psi, alpha, mu, mu_c,
+        K_b, K_j, L, delta_T, alpha_b, alpha_j,
+        u, relaxation_ratio, SF, n, P_et,
+        tensile_allowable, SF_sep,
+    ):
+    """Full per-bolt analysis in one compiled call.
+
+    Chains eq2 (nut factor), eq4 (tensile area), eq29 (stiffness
+    factor), eq10 (thermal preload), eq12/eq13mod (preload bounds),
+    eq17 (bolt load), eq53 (tension margin) and eq67/eq68 (separation
+    margin) as straight-line scalar arithmetic, so a Monte-Carlo driver
+    pays one function dispatch per bolt instead of ~10.  Compilation is
+    cached to disk; without numba this is still one interpreted call.
+
+    Args follow the symbols of the individual equations.
+
+    Returns:
+        tuple: (K, A_t, phi, P_th, P_0_max, P_0_min, P_b, MS_tension,
+        P_sep, MS_sep)
+    """
+    # eq2: nut factor from thread geometry
+    tan_psi = math.tan(psi)
+    sec_alpha = 1.0 / math.cos(alpha)
+    K = D_p / (2.0 * D) * ((tan_psi + mu * sec_alpha) / (1.0 - mu * tan_psi * sec_alpha)) + 0.625 * mu_c
+    # eq4: tensile area
+    x = D - 0.9743 * p
+    A_t = PI_OVER_4 * x * x
+    # eq29: stiffness factor
+    phi = K_b / (K_b + K_j)
+    # eq10: thermal preload change
+    P_th = ((K_b * K_j) / (K_b + K_j)) * L * delta_T * (alpha_j - alpha_b)
+    # eq12 / eq13mod: preload bounds, one divide
+    tkd = T / (K * D)
+    P_0_max = tkd * (1.0 + u) + P_th
+    P_0_min = (tkd * (1.0 - u) - P_th) / (1.0 + relaxation_ratio)
+    # eq17: total axial bolt load
+    P_b = P_0_max + SF * n * phi * P_et
+    # eq53: tension margin
+    MS_tension = tensile_allowable / P_b - 1.0
+    # eq67 + eq68: separation margin
+    P_sep = (1.0 - n * phi) * P_et
+    MS_sep = P_0_min / (SF_sep * P_sep) - 1.0
+    return (K, A_t, phi, P_th, P_0_max, P_0_min, P_b, MS_tension,
+            P_sep, MS_sep)
+
 
 ########################################################
 # Shear Tear Out: pg 19
@@ -1221,6 +2081,14 @@ def eq69(F_su: float, A_s: float) -> float:
     return P_ult
 
 
+if HAVE_NUMBA:
+    eq69 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq69)
+
+
 def eq70(t: float, e: float, D: float) -> float:
     """NASA-TM-106943, equation 70, pg 19
     
@@ -1234,13 +2102,18 @@ def eq70(t: float, e: float, D: float) -> float:
     Returns:
         float: shear area
     """
-    assert t > 0.0
-    assert e > 0.0
-    assert D > 0.0
     A_s = 2.0 * t * (e - D / 2.0)
     return A_s
 
 
+if HAVE_NUMBA:
+    eq70 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq70)
+
+
 def eq71(P_ult: float, SF: float, V: float) -> float:
     """NASA-TM-106943, equation 71, pg 20
     
@@ -1253,8 +2126,9 @@ def eq71(P_ult: float, SF: float, V: float) -> float:
     Returns:
         float: margin of safety to ???
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
-    assert V >= 0.0
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
+        assert V >= 0.0
     MS = P_ult / (SF * V) - 1.0
     return MS
 
@@ -1264,23 +2138,74 @@ def eq71(P_ult: float, SF: float, V: float) -> float:
 ########################################################
 
 
+def check_bearing_inputs(
+        F_br=None,
+        D=None,
+        t=None,
+        d_h=None,
+        d_t=None,
+        F_su=None,
+        L_e=None,
+        D_major_ext=None,
+        SF=None,
+        V=None,
+    ) -> None:
+    """Validate-once preconditions for the eq72-eq80 kernels.
+
+    The compiled kernels are pure arithmetic with no per-call checks, so
+    a sweep pays for validation once here instead of per sample.  Pass
+    only the quantities in use; scalars and arrays are both accepted.
+
+    Raises:
+        AssertionError: if any provided quantity violates its bound.
+    """
+    if F_br is not None:
+        assert np.all(np.greater(F_br, 0.0)), "F_br must be > 0.0"
+    if D is not None:
+        assert np.all(np.greater(D, 0.0)), "D must be > 0.0"
+    if t is not None:
+        assert np.all(np.greater(t, 0.0)), "t must be > 0.0"
+    if d_t is not None:
+        assert np.all(np.greater(d_t, 0.0)), "d_t must be > 0.0"
+    if d_h is not None and d_t is not None:
+        assert np.all(np.greater(d_h, d_t)), "d_h must be > d_t"
+    if F_su is not None:
+        assert np.all(np.greater(F_su, 0.0)), "F_su must be > 0.0"
+    if L_e is not None:
+        assert np.all(np.greater(L_e, 0.0)), "L_e must be > 0.0"
+    if D_major_ext is not None:
+        assert np.all(np.greater(D_major_ext, 0.0)), "D_major_ext must be > 0.0"
+    if SF is not None:
+        assert np.all(np.greater_equal(SF, 1.0)), "SF must be >= 1.0"
+    if V is not None:
+        assert np.all(np.greater_equal(V, 0.0)), "V must be >= 0.0"
+
+
 def eq72(F_br: float, A_br: float) -> float:
     """NASA-TM-106943, equation 72, pg 20
     
     Calculate bearing load capability, P_br.
     
+    Accepts scalars or NumPy arrays (inputs broadcast).
+
     Args:
         F_br: material bearing (yield or ultimate) strength
         A_br: bearing area
     Returns:
         float: bearing load capability
     """
-    assert F_br > 0.0
-    assert A_br > 0.0 
     P_br = F_br * A_br
     return P_br
 
 
+if HAVE_NUMBA:
+    eq72 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq72)
+
+
 def eq73(D: float, t: float) -> float:
     """NASA-TM-106943, equation 73, pg 20
     
@@ -1292,12 +2217,18 @@ def eq73(D: float, t: float) -> float:
     Returns:
         float: bearing area
     """
-    assert D > 0.0
-    assert t > 0.0
     A_br = D * t
     return A_br
 
 
+if HAVE_NUMBA:
+    eq73 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq73)
+
+
 def eq74(P_br: float, SF: float, V: float) -> float:
     """NASA-TM-106943, equation 74, pg 20
     
@@ -1310,12 +2241,41 @@ def eq74(P_br: float, SF: float, V: float) -> float:
     Returns:
         float: margin of safety to bolt bearing failure
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
-    assert V >= 0.0, "error: V must be >= 0.0"
     MS = P_br / (SF * V) - 1.0
     return MS
 
 
+if HAVE_NUMBA:
+    eq74 = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq74)
+
+
+def make_eq74(SF: float):
+    """Build a specialized eq74 for a fixed safety factor.
+
+    SF is constant per analysis (typically 1.4 or 2.0) while (P_br, V)
+    vary per sample; baking 1/SF in replaces the per-call divide by SF
+    with a multiply.  Same partial-evaluation pattern as make_eq2.
+
+    Args:
+        SF: safety factor
+    Returns:
+        callable: MS(P_br, V), margin of safety to bearing failure
+    """
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
+    inv_SF = 1.0 / SF
+
+    @njit(fastmath=True, cache=True)
+    def eq74_specialized(P_br, V):
+        return inv_SF * P_br / V - 1.0
+
+    return eq74_specialized
+
+
 ########################################################
 # Bearing Under the Bolt Head: pg 21
 ########################################################
@@ -1332,12 +2292,20 @@ def eq75(d_h: float, d_t: float) -> float:
     Returns:
         float: bearing area
     """
-    assert d_t > 0.0
-    assert d_h > d_t
-    A_br = np.pi * (d_h**2 - d_t**2) / 4.0
+    # factored form: no cancellation of leading digits when d_h ~ d_t
+    # (thin washers), and two multiplies instead of two squarings:
+    A_br = PI_OVER_4 * (d_h - d_t) * (d_h + d_t)
     return A_br
 
 
+if HAVE_NUMBA:
+    eq75 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq75)
+
+
 ########################################################
 # Threaded Insert Analysis: pg 21
 ########################################################
@@ -1354,76 +2322,56 @@ def eq76(L_e: float, D_major_ext: float) -> float:
     Returns:
         float: thread shear area available to resist axial loading of the bolt
     """
-    assert L_e > 0.0
-    assert D_major_ext > 0.0
-    A_s = 3.0 * np.pi * L_e * D_major_ext / 4.0
+    A_s = THREE_PI_OVER_4 * L_e * D_major_ext
     return A_s
 
 
+if HAVE_NUMBA:
+    eq76 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq76)
+
+
 ########################################################
-# Insert Internal Thread Failure: pg 21
+# Insert Thread Failure: pg 21-23
 ########################################################
 
 
-def eq77(F_su: float, A_s: float) -> float:
-    """NASA-TM-106943, equation 77, pg 21
-    
-    P_ult = insert ultimate allowable pull-out strength
-    
-    Args:
-        F_su: material ultimate shear strength
-        A_s: fastener shear cross sectional area
-    Returns:
-        float: insert ultimate allowable pull-out strength
-    """
-    assert F_su > 0.0
-    assert A_s > 0.0
-    P_ult = F_su * A_s
-    return P_ult
-
+def _pull_out_strength(F_su: float, A_s: float) -> float:
+    """NASA-TM-106943, equations 77-79, pg 21-23
 
-########################################################
-# Insert External Thread Failure: pg 22
-########################################################
+    P_ult = thread pull-out strength, F_su * A_s
 
+    The three insert failure modes (eq77: internal thread, pg 21;
+    eq78: external thread, pg 22; eq79: parent material, pg 23) apply
+    the same relation with the shear area of the respective interface,
+    so one kernel is defined and compiled once and aliased below.
 
-def eq78(F_su: float, A_s: float) -> float:
-    """NASA-TM-106943, equation 78, pg 22
-    
-    P_ult = insert external thread pull-out strength
-    
     Args:
         F_su: material ultimate shear strength
         A_s: fastener shear cross sectional area
     Returns:
-        float: insert external thread pull-out strength
+        float: thread pull-out strength
     """
-    assert F_su > 0.0
-    assert A_s > 0.0
     P_ult = F_su * A_s
     return P_ult
 
 
-########################################################
-# Insert Parent Material Thread Failure: pg 23
-########################################################
+if HAVE_NUMBA:
+    _pull_out_strength = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(_pull_out_strength)
 
-
-def eq79(F_su: float, A_s: float) -> float:
-    """NASA-TM-106943, equation 79, pg 23
-    
-    P_ult = insert parent material pull out strength
-    
-    Args:
-        F_su (float): material ultimate shear strength
-        A_s (float): fastener shear cross sectional area
-    Returns:
-        float: insert parent material pull out strength
-    """
-    assert F_su > 0.0
-    assert A_s > 0.0
-    P_ult = F_su * A_s
-    return P_ult
+# insert internal thread failure, pg 21:
+eq77 = _pull_out_strength
+# insert external thread failure, pg 22:
+eq78 = _pull_out_strength
+# insert parent material thread failure, pg 23:
+eq79 = _pull_out_strength
 
 
 ########################################################
@@ -1446,6 +2394,26 @@ def eq80(P_ult: float, P_b: float) -> float:
     return MS
 
 
+if HAVE_NUMBA:
+    eq80 = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(eq80)
+
+
+# memoized scalar variants: the equations are pure, so optimizer / GA
+# drivers that revisit identical design points can skip re-evaluation.
+# Scalar (hashable) arguments only — pass arrays to the plain eqN:
+eq72_cached = lru_cache(maxsize=4096)(eq72)
+eq73_cached = lru_cache(maxsize=4096)(eq73)
+eq74_cached = lru_cache(maxsize=4096)(eq74)
+eq75_cached = lru_cache(maxsize=4096)(eq75)
+eq76_cached = lru_cache(maxsize=4096)(eq76)
+eq77_cached = eq78_cached = eq79_cached = lru_cache(maxsize=4096)(_pull_out_strength)
+eq80_cached = lru_cache(maxsize=4096)(eq80)
+
+
 ########################################################
 # Nut Strength: pg 25
 ########################################################
@@ -1461,16 +2429,597 @@ def eq81(A_t: float) -> float:
     Returns:
         float: nut strength of standard MS class II nuts
     """
-    print("\nwarning, eq81, this is hardcoded in english units...\n")
+    warnings.warn(
+        "eq81 is hardcoded in english units (A_t in in^2, P_ult in lbf)",
+        stacklevel=2,
+    )
     P_ult = 125000.0 * A_t
     return P_ult
 
 
+def ms_bolt_bearing(F_br: float, D: float, t: float, SF: float, V: float) -> float:
+    """Fused eq73 + eq72 + eq74: margin of safety to bolt bearing failure.
+
+    One kernel instead of chaining the three functions, so the bearing
+    area and load stay in registers.  Compiled to a ufunc when numba is
+    installed.
+
+    Args:
+        F_br: material bearing (yield or ultimate) strength
+        D: through hole diameter
+        t: thickness
+        SF: safety factor
+        V: applied shear load
+    Returns:
+        float: margin of safety to bolt bearing failure
+    """
+    return F_br * D * t / (SF * V) - 1.0
+
+
+def ms_head_bearing(F_br: float, d_h: float, d_t: float, SF: float, V: float) -> float:
+    """Fused eq75 + eq72 + eq74: margin of safety to bearing under the head.
+
+    Args:
+        F_br: material bearing (yield or ultimate) strength
+        d_h: minimum contact diameter of the bolt head or washer
+        d_t: maximum diameter of the through hole
+        SF: safety factor
+        V: applied shear load
+    Returns:
+        float: margin of safety to bearing failure under the bolt head
+    """
+    return F_br * PI_OVER_4 * (d_h - d_t) * (d_h + d_t) / (SF * V) - 1.0
+
+
+def ms_thread_pullout(F_su: float, L_e: float, D_major_ext: float, P_b: float) -> float:
+    """Fused eq76 + eq77 + eq80: margin of safety to insert thread pull-out.
+
+    Args:
+        F_su: material ultimate shear strength
+        L_e: thread engagement length or nut thickness
+        D_major_ext: major pitch diameter, external threads
+        P_b: total axial bolt load
+    Returns:
+        float: margin of safety to thread pull-out
+    """
+    return F_su * THREE_PI_OVER_4 * L_e * D_major_ext / P_b - 1.0
+
+
+if HAVE_NUMBA:
+    ms_bolt_bearing = vectorize(
+        ['float32(' + ', '.join(['float32']*5) + ')',
+         'float64(' + ', '.join(['float64']*5) + ')'],
+        target='parallel',
+        fastmath=True,
+    )(ms_bolt_bearing)
+    ms_head_bearing = vectorize(
+        ['float32(' + ', '.join(['float32']*5) + ')',
+         'float64(' + ', '.join(['float64']*5) + ')'],
+        target='parallel',
+        fastmath=True,
+    )(ms_head_bearing)
+    ms_thread_pullout = vectorize(
+        ['float32(' + ', '.join(['float32']*4) + ')',
+         'float64(' + ', '.join(['float64']*4) + ')'],
+        target='parallel',
+        fastmath=True,
+    )(ms_thread_pullout)
+
+
+def _bearing_margins_core(F_br, D, t, d_h, d_t, F_su, L_e, D_major_ext,
+                          SF, V, P_b, MS_bolt, MS_head, MS_pullout):
+    """Fused eq73+eq72+eq74, eq75+eq72+eq74, eq76+eq77+eq80 per bolt.
+
+    The element-wise eqN ufuncs cover single-output batching; this
+    gufunc computes all three bearing/pull-out margins for a bolt in one
+    pass, so a sweep reads each input stream once.
+    """
+    # one divide serves both bearing margins (div latency ~15 cycles,
+    # mul ~0.5/cycle throughput):
+    inv_sfv = 1.0 / (SF * V)
+    MS_bolt[0] = F_br * D * t * inv_sfv - 1.0
+    MS_head[0] = F_br * PI_OVER_4 * (d_h - d_t) * (d_h + d_t) * inv_sfv - 1.0
+    MS_pullout[0] = F_su * THREE_PI_OVER_4 * L_e * D_major_ext / P_b - 1.0
+
+
+if HAVE_NUMBA:
+    # element-wise gufunc: broadcasts over arrays of bolts
+    bearing_margins = guvectorize(
+        ['(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8[:], f8[:], f8[:])'],
+        '(),(),(),(),(),(),(),(),(),(),()->(),(),()',
+        target='parallel',
+        nopython=True,
+    )(_bearing_margins_core)
+else:
+    def bearing_margins(F_br, D, t, d_h, d_t, F_su, L_e, D_major_ext,
+                        SF, V, P_b):
+        """Batched bearing / pull-out margins of safety.
+
+        Pure NumPy fallback, broadcasts over arrays of bolts.
+
+        Args:
+            F_br: material bearing strength
+            D: through hole diameter
+            t: thickness
+            d_h: minimum contact diameter of the bolt head or washer
+            d_t: maximum diameter of the through hole
+            F_su: material ultimate shear strength
+            L_e: thread engagement length
+            D_major_ext: major pitch diameter, external threads
+            SF: safety factor
+            V: applied shear load
+            P_b: total axial bolt load
+        Returns:
+            tuple: (MS_bolt_bearing, MS_head_bearing, MS_pullout)
+        """
+        inv_sfv = 1.0 / (SF * V)
+        MS_bolt = F_br * D * t * inv_sfv - 1.0
+        MS_head = F_br * np.pi * (d_h - d_t) * (d_h + d_t) * 0.25 * inv_sfv - 1.0
+        MS_pullout = F_su * 0.75 * np.pi * L_e * D_major_ext / P_b - 1.0
+        return MS_bolt, MS_head, MS_pullout
+
+
+def analyze_joints(arrays: dict, dtype=None) -> dict:
+    """Batched bearing / pull-out margins for a fleet of bolts (SoA).
+
+    One vectorized pass over struct-of-arrays inputs instead of a
+    Python loop chaining eq72-eq80 per bolt.  Unloaded bolts (V == 0)
+    get an infinite bearing margin rather than a divide warning.
+
+    Args:
+        arrays: dict of parallel arrays (or scalars, broadcast) keyed
+            F_br, D, t, d_h, d_t, F_su, L_e, D_major_ext, SF, V, P_b
+            (symbols as in NASA-TM-106943)
+        dtype: working dtype (default: PRECISION); np.float32 halves
+            memory traffic and doubles SIMD width on large sweeps,
+            well within the scatter of the material inputs
+    Returns:
+        dict: {"MS_bolt_bearing", "MS_head_bearing", "MS_pullout"}
+    """
+    if dtype is None:
+        dtype = PRECISION
+    F_br = np.asarray(arrays['F_br'], dtype=dtype)
+    D = np.asarray(arrays['D'], dtype=dtype)
+    t = np.asarray(arrays['t'], dtype=dtype)
+    d_h = np.asarray(arrays['d_h'], dtype=dtype)
+    d_t = np.asarray(arrays['d_t'], dtype=dtype)
+    F_su = np.asarray(arrays['F_su'], dtype=dtype)
+    L_e = np.asarray(arrays['L_e'], dtype=dtype)
+    D_major_ext = np.asarray(arrays['D_major_ext'], dtype=dtype)
+    SF = np.asarray(arrays['SF'], dtype=dtype)
+    V = np.asarray(arrays['V'], dtype=dtype)
+    P_b = np.asarray(arrays['P_b'], dtype=dtype)
+    with np.errstate(divide='ignore'):
+        # one vectorized reciprocal pass, then multiplies only:
+        inv_sfv = np.reciprocal(SF * V)
+        MS_bolt = F_br * D * t * inv_sfv - 1.0
+        MS_head = F_br * PI_OVER_4 * (d_h - d_t) * (d_h + d_t) * inv_sfv - 1.0
+        MS_pullout = F_su * THREE_PI_OVER_4 * L_e * D_major_ext / P_b - 1.0
+    return {
+        'MS_bolt_bearing': MS_bolt,
+        'MS_head_bearing': MS_head,
+        'MS_pullout': MS_pullout,
+    }
+
+
+########################################################
+# Batched Analysis: struct-of-arrays bolt population
+########################################################
+
+
+@dataclass
+class BoltResults:
+    """Per-bolt results of BoltPopulation.run()."""
+    P_0_nom: np.ndarray  # nominal preload, T/(K*D)
+    P_0_max: np.ndarray  # max expected preload, eq12
+    P_0_min: np.ndarray  # min expected preload, eq13
+    P_b: np.ndarray      # total axial bolt load, eq17
+    P_sep: np.ndarray    # load trying to separate the joint, eq67
+    MS_sep: np.ndarray   # margin of safety against separation, eq68
+
+
+@dataclass
+class BoltPopulation:
+    """Struct-of-arrays container for a population of bolted joints.
+
+    Each field is a parallel 1-D array of length n_bolts, so the
+    vectorized equations stream unit-stride vectors instead of
+    dispatching Python scalars per bolt.
+
+    Fields follow the symbols of NASA-TM-106943.
+    """
+    T: np.ndarray        # applied torque
+    K: np.ndarray        # nut factor
+    D: np.ndarray        # nominal diameter
+    u: np.ndarray        # preload uncertainty factor
+    P_th: np.ndarray     # axial bolt load due to thermal effects
+    relaxation_ratio: np.ndarray  # expected preload loss fraction, eq11
+    SF: np.ndarray       # strength factor of safety
+    n: np.ndarray        # loading plane factor
+    phi: np.ndarray      # joint stiffness factor, eq29
+    P_et: np.ndarray     # external load directed at the joint
+    SF_sep: np.ndarray   # separation factor of safety
+
+    @classmethod
+    def from_dicts(cls, bolts: list, dtype=None) -> "BoltPopulation":
+        """Build a population from a list of per-bolt dicts.
+
+        Args:
+            bolts: list of dicts keyed by the field names above
+            dtype: storage dtype for the arrays (default: PRECISION)
+        Returns:
+            BoltPopulation: SoA view of the input bolts
+        """
+        if dtype is None:
+            dtype = PRECISION
+        fields = [f.name for f in dataclasses.fields(cls)]
+        return cls(**{
+            name: np.array([b[name] for b in bolts], dtype=dtype)
+            for name in fields
+        })
+
+    def run(self) -> BoltResults:
+        """Chain eq1 -> eq11 -> eq12 -> eq13 -> eq17 -> eq67 -> eq68.
+
+        One pass of whole-array expressions over the population.
+
+        Returns:
+            BoltResults: preloads, bolt load, and separation margin
+        """
+        P_0_nom = self.T / (self.K * self.D)
+        P_0_max = P_0_nom * (1.0 + self.u) + self.P_th
+        # eq11 relaxation applied to the minimum expected preload:
+        P_0_min_i = P_0_nom * (1.0 - self.u) - self.P_th
+        P_0_min = P_0_min_i - self.relaxation_ratio * P_0_min_i
+        P_b = P_0_max + self.SF * self.n * self.phi * self.P_et
+        P_sep = (1.0 - self.n * self.phi) * self.P_et
+        MS_sep = P_0_min / (self.SF_sep * P_sep) - 1.0
+        return BoltResults(
+            P_0_nom=P_0_nom,
+            P_0_max=P_0_max,
+            P_0_min=P_0_min,
+            P_b=P_b,
+            P_sep=P_sep,
+            MS_sep=MS_sep,
+        )
+
+
+def eq12_batch(T, K, D, u, P_th) -> np.ndarray:
+    """Batched eq12: max expected preload over arrays of inputs.
+
+    Uses numexpr when installed (blocked, multi-threaded evaluation
+    with no intermediate arrays); otherwise plain NumPy.
+    """
+    if _ne is not None:
+        return _ne.evaluate("T/(K*D)*(1.0+u) + P_th")
+    return T/(K*D) * (1.0 + u) + P_th
+
+
+def eq13_batch(T, K, D, u, P_th, P_relax) -> np.ndarray:
+    """Batched eq13: min expected preload over arrays of inputs."""
+    if _ne is not None:
+        return _ne.evaluate("T/(K*D)*(1.0-u) - P_th - P_relax")
+    return T/(K*D) * (1.0 - u) - P_th - P_relax
+
+
+def eq17_batch(P_0_max, SF, n, phi, P_et) -> np.ndarray:
+    """Batched eq17: total axial load in the fastener."""
+    if _ne is not None:
+        return _ne.evaluate("P_0_max + SF*n*phi*P_et")
+    return P_0_max + SF * n * phi * P_et
+
+
+def eq67_batch(n, phi, P_et) -> np.ndarray:
+    """Batched eq67: load trying to separate the joint."""
+    if _ne is not None:
+        return _ne.evaluate("(1.0 - n*phi)*P_et")
+    return (1.0 - n * phi) * P_et
+
+
+# below this row count the NumPy path beats thread start-up overhead:
+_PARALLEL_THRESHOLD = 10_000
+
+
+def _preload_bounds_loop(T, K, D, u, P_th, P_relax, out_max, out_min):
+    """Parallel per-bolt loop behind run_population."""
+    for i in prange(T.shape[0]):
+        p0 = T[i] / (K[i] * D[i])
+        out_max[i] = p0 * (1.0 + u[i]) + P_th[i]
+        out_min[i] = p0 * (1.0 - u[i]) - P_th[i] - P_relax[i]
+
+
+if HAVE_NUMBA:
+    _preload_bounds_loop = njit(
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )(_preload_bounds_loop)
+
+
+def run_population(
+        T: np.ndarray,
+        K: np.ndarray,
+        D: np.ndarray,
+        u: np.ndarray,
+        P_th: np.ndarray,
+        P_relax: np.ndarray,
+        out_max: np.ndarray,
+        out_min: np.ndarray,
+    ) -> None:
+    """Compute eq12 / eq13 preload bounds for a whole bolt population.
+
+    Writes P_0_max and P_0_min into the preallocated out_max / out_min
+    arrays.  Large populations run a numba parallel prange loop (one
+    divide per bolt, threads reused across calls); small ones use plain
+    NumPy to avoid thread start-up overhead.
+
+    Args:
+        T: applied torque
+        K: nut factor
+        D: nominal diameter
+        u: preload uncertainty factor
+        P_th: axial bolt load due to thermal effects
+        P_relax: loss of preload due to joint relaxation
+        out_max: preallocated output for P_0_max
+        out_min: preallocated output for P_0_min
+    """
+    if HAVE_NUMBA and T.shape[0] > _PARALLEL_THRESHOLD:
+        _preload_bounds_loop(T, K, D, u, P_th, P_relax, out_max, out_min)
+    else:
+        p0 = T / (K * D)
+        np.add(p0 * (1.0 + u), P_th, out=out_max)
+        np.subtract(p0 * (1.0 - u) - P_th, P_relax, out=out_min)
+
+
+_JOINT_RESULT_KEYS = ('K', 'A_t', 'phi', 'P_th', 'P_0_max', 'P_0_min',
+                      'P_b', 'MS_tension', 'P_sep', 'MS_sep')
+
+
+def _evaluate_joint_loop(T, D, p, D_p, psi, alpha, mu, mu_c,
+                         K_b, K_j, L, delta_T, alpha_b, alpha_j,
+                         u, relaxation_ratio, SF, n, P_et,
+                         tensile_allowable, SF_sep, out):
+    """Parallel per-bolt loop behind evaluate_joint_batch."""
+    for i in prange(T.shape[0]):
+        res = evaluate_joint(
+            T[i], D[i], p[i], D_p[i], psi[i], alpha[i], mu[i], mu_c[i],
+            K_b[i], K_j[i], L[i], delta_T[i], alpha_b[i], alpha_j[i],
+            u[i], relaxation_ratio[i], SF[i], n[i], P_et[i],
+            tensile_allowable[i], SF_sep[i],
+        )
+        # unpacked rather than indexed in a loop: the result tuple is
+        # heterogeneous under float32 inputs (some terms promote), and
+        # numba only supports runtime indexing of homogeneous tuples
+        K_i, A_t, phi, P_th, P_0_max, P_0_min, P_b, MS_t, P_sep, MS_sep = res
+        out[0, i] = K_i
+        out[1, i] = A_t
+        out[2, i] = phi
+        out[3, i] = P_th
+        out[4, i] = P_0_max
+        out[5, i] = P_0_min
+        out[6, i] = P_b
+        out[7, i] = MS_t
+        out[8, i] = P_sep
+        out[9, i] = MS_sep
+
+
+if HAVE_NUMBA:
+    _evaluate_joint_loop = njit(
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )(_evaluate_joint_loop)
+
+
+def evaluate_joint_batch(
+        T, D, p, D_p, psi, alpha, mu, mu_c,
+        K_b, K_j, L, delta_T, alpha_b, alpha_j,
+        u, relaxation_ratio, SF, n, P_et,
+        tensile_allowable, SF_sep,
+        dtype=None,
+    ) -> dict:
+    """Run evaluate_joint over arrays of N bolts.
+
+    Under numba this is one prange loop over the population: the whole
+    per-bolt pipeline stays in registers and the threads split the N
+    axis outside the GIL.  Inputs broadcast against each other, so
+    fleet-constant parameters can be passed as scalars.
+
+    Args follow evaluate_joint, plus:
+        dtype: working dtype (default: PRECISION); np.float32 halves
+            memory traffic and doubles SIMD width, well within the
+            5-35 % scatter of the friction and relaxation inputs
+
+    Returns:
+        dict: arrays keyed K, A_t, phi, P_th, P_0_max, P_0_min, P_b,
+        MS_tension, P_sep, MS_sep
+    """
+    if dtype is None:
+        dtype = PRECISION
+    args = np.broadcast_arrays(
+        *(np.asarray(a, dtype=dtype) for a in (
+            T, D, p, D_p, psi, alpha, mu, mu_c,
+            K_b, K_j, L, delta_T, alpha_b, alpha_j,
+            u, relaxation_ratio, SF, n, P_et,
+            tensile_allowable, SF_sep)))
+    args = [np.ascontiguousarray(a).ravel() for a in args]
+    out = np.empty((10, args[0].shape[0]), dtype=dtype)
+    _evaluate_joint_loop(*args, out)
+    return dict(zip(_JOINT_RESULT_KEYS, out))
+
+
+def _fused_margins_loop(T, K, D, u, relaxation_ratio,
+                        K_b, K_j, L, delta_T, alpha_b, alpha_j,
+                        SF, n, P_et, tensile_allowable, SF_sep,
+                        out_ms_tension, out_ms_sep):
+    """Parallel per-bolt loop behind fused_margins."""
+    for i in prange(T.shape[0]):
+        phi = K_b[i] / (K_b[i] + K_j[i])
+        P_th = ((K_b[i] * K_j[i]) / (K_b[i] + K_j[i])) * L[i] * delta_T[i] * (alpha_j[i] - alpha_b[i])
+        tkd = T[i] / (K[i] * D[i])
+        P_0_max = tkd * (1.0 + u[i]) + P_th
+        P_0_min = (tkd * (1.0 - u[i]) - P_th) / (1.0 + relaxation_ratio[i])
+        P_b = P_0_max + SF[i] * n[i] * phi * P_et[i]
+        P_sep = (1.0 - n[i] * phi) * P_et[i]
+        out_ms_tension[i] = tensile_allowable[i] / P_b - 1.0
+        out_ms_sep[i] = P_0_min / (SF_sep[i] * P_sep) - 1.0
+
+
+if HAVE_NUMBA:
+    _fused_margins_loop = njit(
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )(_fused_margins_loop)
+
+
+def fused_margins(T, K, D, u, relaxation_ratio,
+                  K_b, K_j, L, delta_T, alpha_b, alpha_j,
+                  SF, n, P_et, tensile_allowable, SF_sep,
+                  out_ms_tension, out_ms_sep) -> None:
+    """Fused eq10 + eq12/eq13mod + eq17 + eq53 + eq67/eq68 over N bolts.
+
+    Writes only the tension and separation margins into the
+    preallocated outputs; every intermediate (thermal preload, preload
+    bounds, bolt load, separation load) stays in registers inside the
+    loop instead of being materialized as a length-N temporary, so the
+    pipeline streams inputs + outputs once instead of ~12 arrays.
+
+    Args follow the symbols of the individual equations; all inputs are
+    1-D arrays of equal length.
+    """
+    if HAVE_NUMBA and T.shape[0] > _PARALLEL_THRESHOLD:
+        _fused_margins_loop(T, K, D, u, relaxation_ratio,
+                            K_b, K_j, L, delta_T, alpha_b, alpha_j,
+                            SF, n, P_et, tensile_allowable, SF_sep,
+                            out_ms_tension, out_ms_sep)
+    else:
+        phi = K_b / (K_b + K_j)
+        P_th = ((K_b * K_j) / (K_b + K_j)) * L * delta_T * (alpha_j - alpha_b)
+        tkd = T / (K * D)
+        P_0_max = tkd * (1.0 + u) + P_th
+        P_0_min = (tkd * (1.0 - u) - P_th) / (1.0 + relaxation_ratio)
+        P_b = P_0_max + SF * n * phi * P_et
+        P_sep = (1.0 - n * phi) * P_et
+        np.subtract(tensile_allowable / P_b, 1.0, out=out_ms_tension)
+        np.subtract(P_0_min / (SF_sep * P_sep), 1.0, out=out_ms_sep)
+
+
+@dataclass
+class JointBatch:
+    """Struct-of-arrays container for batched joint analysis.
+
+    Unlike BoltPopulation, which takes the stiffness factor and thermal
+    load precomputed, this carries the raw stiffness and expansion
+    inputs and derives phi / P_th inside the fused kernels.  Each field
+    is a parallel 1-D contiguous float array of length n_bolts.
+
+    Fields follow the symbols of NASA-TM-106943.
+    """
+    T: np.ndarray        # applied torque
+    K: np.ndarray        # nut factor
+    D: np.ndarray        # nominal diameter
+    u: np.ndarray        # preload uncertainty factor
+    relaxation_ratio: np.ndarray  # expected preload loss fraction, eq11
+    K_b: np.ndarray      # bolt stiffness
+    K_j: np.ndarray      # joint stiffness
+    L: np.ndarray        # fastener grip length
+    delta_T: np.ndarray  # temperature change
+    alpha_b: np.ndarray  # bolt coefficient of thermal expansion
+    alpha_j: np.ndarray  # joint coefficient of thermal expansion
+    SF: np.ndarray       # strength factor of safety
+    n: np.ndarray        # loading plane factor
+    P_et: np.ndarray     # external load directed at the joint
+    tensile_allowable: np.ndarray  # allowable tensile load
+    SF_sep: np.ndarray   # separation factor of safety
+
+    @classmethod
+    def from_dicts(cls, bolts: list, dtype=None) -> "JointBatch":
+        """Build a batch from a list of per-bolt dicts.
+
+        Args:
+            bolts: list of dicts keyed by the field names above
+            dtype: storage dtype for the arrays (default: PRECISION)
+        Returns:
+            JointBatch: SoA view of the input bolts
+        """
+        if dtype is None:
+            dtype = PRECISION
+        fields = [f.name for f in dataclasses.fields(cls)]
+        return cls(**{
+            name: np.array([b[name] for b in bolts], dtype=dtype)
+            for name in fields
+        })
+
+    def to_arrays(self) -> tuple:
+        """Fields as a plain tuple of arrays, in declaration order.
+
+        The tuple form is what the njit'd entry points accept; a
+        dataclass instance would force an object-mode fallback.
+        """
+        return tuple(
+            getattr(self, f.name) for f in dataclasses.fields(self)
+        )
+
+    def preload_bounds(self) -> tuple:
+        """eq12 / eq13 preload bounds for the batch.
+
+        Returns:
+            tuple of np.ndarray: (P_0_max, P_0_min)
+        """
+        P_th = eq10(self.K_b, self.K_j, self.L, self.delta_T,
+                    self.alpha_b, self.alpha_j)
+        tkd = self.T / (self.K * self.D)
+        P_0_max = tkd * (1.0 + self.u) + P_th
+        P_0_min = (tkd * (1.0 - self.u) - P_th) / (1.0 + self.relaxation_ratio)
+        return P_0_max, P_0_min
+
+    def margins(self) -> tuple:
+        """Tension and separation margins via the fused kernel.
+
+        Returns:
+            tuple of np.ndarray: (MS_tension, MS_sep)
+        """
+        MS_tension = np.empty_like(self.T)
+        MS_sep = np.empty_like(self.T)
+        fused_margins(*self.to_arrays(), MS_tension, MS_sep)
+        return MS_tension, MS_sep
+
+
+# without the JIT compiler, prefer the prebuilt compiled kernels (scalar
+# closed forms, no warmup) over the interpreted ones; the numba AOT build
+# wins over the Cython build when both are present:
+if _aot is None and _cy is not None:
+    eq2 = _cy.eq2
+    eq4 = _cy.eq4
+    eq29 = _cy.eq29
+    eq32 = _cy.eq32
+    eq37 = _cy.eq37
+    eq44 = _cy.eq44
+    eq48 = _cy.eq48
+    eq55 = _cy.eq55
+    eq63 = _cy.eq63
+    eq64 = _cy.eq64
+    eq69 = _cy.eq69
+
+if _aot is not None:
+    eq2 = _aot.eq2
+    eq4 = _aot.eq4
+    eq29 = _aot.eq29
+    eq32 = _aot.eq32
+    eq37 = _aot.eq37
+    eq44 = _aot.eq44
+    eq48 = _aot.eq48
+    eq55 = _aot.eq55
+    eq63 = _aot.eq63
+    eq64 = _aot.eq64
+    eq69 = _aot.eq69
+
+
 def main() -> None:
     # Tests:
-    
+
     # conversion factors:
-    deg_to_rad = np.pi / 180.0
     psi_to_MPa = 0.00689476
     
     # [N-mm], applied torque:
@@ -1490,15 +3039,21 @@ def main() -> None:
     u = 0.25
     
     print("\nTest eq1:")
-    P0max, P0min = eq1(
-        T, 
-        K, 
-        D, 
+    P0min, P0max = eq1(
+        T,
+        K,
+        D,
         u,
     )
     print(f"P0max = {P0max} [N]")
     print(f"P0min = {P0min} [N]")
-    
+
+    # [mm], major diameter:
+    D_major = D
+
+    # [mm], basic minor diameter, ISO 724: d1 = d - 1.0825*P
+    D_minor = D - 1.0825 * pitch
+
     # mean thread diameter:
     D_p = (D_major + D_minor) / 2.0
     print(f"D_p = {D_p} [mm]")
@@ -1507,8 +3062,9 @@ def main() -> None:
     r_m = D_p / 2.0
     print(f"r_m = {r_m} [mm]")
     
-    # [rad], thread lead angle:
-    psi = np.arctan(pitch / (2.0 * np.pi * r_m))
+    # [rad], thread lead angle: math.atan, not np.arctan — scalar input,
+    # no 0-d array round trip:
+    psi = math.atan(pitch / (2.0 * math.pi * r_m))
     print(f"psi = {psi} [rad]")
     # print(f"psi = {psi / deg_to_rad} [deg]")
     
@@ -1534,7 +3090,7 @@ def main() -> None:
     print(f"K = {K}")
     
     print("\nTest eq4:")
-    A_t = eq4(D, p)
+    A_t = eq4(D, pitch)
     print(f"A_t = {A_t} [mm^2]")
     
 
@@ -0,0 +1,82 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Cython mirror of the NASA-TM-106943 scalar kernels.
+
+Same fast-path idea as aot_build.py, but built with Cython instead of
+numba.pycc: ~2 MB of compiled code and no LLVM dependency, for hosts
+where numba cannot be installed (offline / constrained analysis
+environments).  Build via:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+nasa_tm_106943.py picks these kernels up automatically when neither
+numba nor the AOT module is available.
+
+The exported kernels are the pure-arithmetic closed forms; input
+validation stays in the Python wrappers.
+"""
+from libc.math cimport cos, log, tan
+
+cdef double PI = 3.141592653589793
+cdef double PI_OVER_4 = 0.7853981633974483
+cdef double FIVE_PI_OVER_8 = 1.9634954084936207
+
+
+cpdef double eq2(double D_p, double D, double psi, double alpha,
+                 double mu, double mu_c) nogil:
+    """Estimated nut factor, K."""
+    cdef double tan_psi = tan(psi)
+    cdef double sec_alpha = 1.0 / cos(alpha)
+    return D_p / (2.0 * D) * ((tan_psi + mu * sec_alpha)
+                              / (1.0 - mu * tan_psi * sec_alpha)) + 0.625 * mu_c
+
+
+cpdef double eq4(double D, double p) nogil:
+    """Tensile area, A_t."""
+    cdef double x = D - 0.9743*p
+    return PI_OVER_4 * x * x
+
+
+cpdef double eq29(double K_b, double K_j) nogil:
+    """Stiffness factor, phi."""
+    return K_b / (K_b + K_j)
+
+
+cpdef double eq32(double A, double E_b, double L) nogil:
+    """Bolt stiffness, K_b."""
+    return A * E_b / L
+
+
+cpdef double eq37(double A, double E_b, double L) nogil:
+    """Bolt stiffness, K_b."""
+    return A * E_b / L
+
+
+cpdef double eq44(double E_j, double D, double L) nogil:
+    """Joint stiffness, K_j, configuration 3."""
+    return PI * E_j * D / log(5.0*((2.0*L + 0.5*D)/(2.0*L + 2.5*D)))
+
+
+cpdef double eq48(double A, double E_b, double L) nogil:
+    """Bolt stiffness, K_b."""
+    return A * E_b / L
+
+
+cpdef double eq55(double F_su, double A_s) nogil:
+    """Shear allowable / ultimate load, F_su * A_s."""
+    return F_su * A_s
+
+
+cpdef double eq63(double L_e, double D_minor_int) nogil:
+    """Shear area of the bolt thread, A_s."""
+    return FIVE_PI_OVER_8 * L_e * D_minor_int
+
+
+cpdef double eq64(double F_su, double A_s) nogil:
+    """Ultimate shear load, P_ult."""
+    return F_su * A_s
+
+
+cpdef double eq69(double F_su, double A_s) nogil:
+    """Ultimate shear load, P_ult."""
+    return F_su * A_s
@@ -0,0 +1,85 @@
+"""Ahead-of-time build of the NSTS 08307A scalar kernels.
+
+Run once at build/packaging time:
+
+    python -m thread_fast.nsts_08307a.aot_build
+
+This produces a compiled extension module ``nsts_08307a_aot`` next to
+this file.  Short-lived scripts then get native-speed margin kernels
+with no JIT warmup, and the compiled module does not need numba
+installed at runtime.  nsts_08307a.py picks the AOT kernels up
+automatically when numba itself is not available.
+
+The exported kernels are the pure-arithmetic closed forms; input
+validation stays in the Python wrappers.
+"""
+import math
+
+from numba.pycc import CC
+
+cc = CC('nsts_08307a_aot')
+cc.output_dir = __file__.rsplit('/', 1)[0]
+
+
+@cc.export('nut_factor_core', 'f8(f8, f8, f8, f8, f8, f8, f8)')
+def nut_factor_core(R_t, R_e, mu_t, mu_b, alpha, beta, D):
+    """Nut factor for one friction sample."""
+    return (R_t * (math.tan(alpha) + mu_t / math.cos(beta)) + R_e * mu_b) / D
+
+
+@cc.export('margin_core', 'f8(f8, f8, f8)')
+def margin_core(allowable, SF, load):
+    """MS = allowable / (SF * load) - 1."""
+    return allowable / (SF * load) - 1.0
+
+
+@cc.export('load_ratio_core', 'f8(f8, f8, f8)')
+def load_ratio_core(SF, load, allowable):
+    """R = SF * load / allowable."""
+    return SF * load / allowable
+
+
+@cc.export('bolt_axial_load_core', 'f8(f8, f8, f8, f8, f8)')
+def bolt_axial_load_core(PLD_max, n, phi, SF, P):
+    """P_b = PLD_max + n * phi * SF * P."""
+    return PLD_max + n * phi * (SF * P)
+
+
+@cc.export('separation_margin_core', 'f8(f8, f8, f8)')
+def separation_margin_core(PLD_min, n, phi):
+    """MS_sep = PLD_min / (1 - n * phi) - 1."""
+    return PLD_min / (1.0 - n * phi) - 1.0
+
+
+@cc.export('max_preload_typ', 'f8(f8, f8, f8, f8, f8)')
+def max_preload_typ(gamma, T_max, K_typ, D, P_thr_pos):
+    """Max preload, typical coefficient method."""
+    return (1.0 + gamma) * T_max / (K_typ * D) + P_thr_pos
+
+
+@cc.export('min_preload_relax', 'f8(f8, f8, f8, f8, f8, f8, f8)')
+def min_preload_relax(gamma, T_min, T_p, K_typ, D, P_thr_neg, inv_relax):
+    """Min preload with the relaxation-ratio model.
+
+    inv_relax is the precomputed 1/(1 + relaxation_ratio).
+    """
+    return (((1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg)
+            * inv_relax)
+
+
+@cc.export('min_preload_loss', 'f8(f8, f8, f8, f8, f8, f8, f8)')
+def min_preload_loss(gamma, T_min, T_p, K_typ, D, P_thr_neg, P_loss):
+    """Min preload with an explicit preload loss."""
+    return (1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg - P_loss
+
+
+@cc.export('tensile_stress_area_core', 'f8(f8, f8)')
+def tensile_stress_area_core(D_e_bsc, n_0):
+    """A_t = 0.7854 * (D_e_bsc - 0.9743 / n_0)^2."""
+    x = D_e_bsc - 0.9743 / n_0
+    return 0.7854 * x * x
+
+
+if __name__ == "__main__":
+    cc.verbose = True
+    cc.compile()
@@ -2,8 +2,52 @@
 
 Criteria for Preloaded Bolts
 """
+import dataclasses
+import logging
+import math
+import sys
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
+
 import numpy as np
-from typing import Tuple
+from typing import NamedTuple, Tuple
+
+from thread_fast.jit_helpers import HAVE_NUMBA, njit, prange, vectorize
+
+_log = logging.getLogger(__name__)
+
+if not HAVE_NUMBA:
+    # prebuilt kernels from aot_build.py, if they were compiled; these
+    # need no numba at runtime and have no JIT warmup:
+    try:
+        from thread_fast.nsts_08307a import nsts_08307a_aot as _aot
+    except ImportError:
+        _aot = None
+    # Cython-built kernels (nsts_08307a_cy.pyx) as a further fallback
+    # for hosts where numba's LLVM dependency cannot be installed:
+    try:
+        from thread_fast.nsts_08307a import nsts_08307a_cy as _cy
+    except ImportError:
+        _cy = None
+else:
+    _aot = None
+    _cy = None
+
+# hoisted constants so the hot kernels skip the np attribute lookup;
+# INV_SQRT3 is 1/sqrt(3) at full double precision (the spec's 0.57735
+# rounds off 4 ULPs):
+PI = math.pi
+INV_SQRT3 = 0.5773502691896257
+
+# conversion factors:
+deg_to_rad = math.pi / 180.0
+psi_to_MPa = 0.00689476
+
+# default storage dtype for batched sweeps; set to np.float32 for large
+# Monte-Carlo runs where the 5-35 % friction / preload scatter dwarfs
+# single-precision error:
+PRECISION = np.float64
 
 ########################################################
 # 3.0 Required Criteria for Preloaded Bolts: pg 3-1
@@ -56,8 +100,26 @@ from typing import Tuple
 # K_max = maximum nut factor
 
 
+class NutFactors(NamedTuple):
+    """Min / typical / max nut factor triple.
+
+    A NamedTuple keeps the plain-tuple unpacking at the call sites
+    while letting callers write ``nf.K_typ``; numba lowers it to
+    registers, so jitted callers pay no heap allocation.
+    """
+    K_min: float
+    K_typ: float
+    K_max: float
+
+
+class TensileMargins(NamedTuple):
+    """Margins against the two strength criteria (SF*P and P_b)."""
+    MS_crit1: float
+    MS_crit2: float
+
+
 def nut_factor(
-        R_t: float, 
+        R_t: float,
         R_e: float, 
         mu_t_min: float,
         mu_t_typ: float, 
@@ -68,7 +130,7 @@ def nut_factor(
         alpha: float, 
         beta: float, 
         D: float,
-    ) -> Tuple[float, float, float]:
+    ) -> NutFactors:
     """Calculate nut factor, K.
     
     NSTS 08307 Rev A, pg 3-5 to 3-6
@@ -82,20 +144,180 @@ def nut_factor(
         beta: Thread half angle (30° for unified thread form)
         D: Basic major diameter of external threads (bolt)
     Returns:
-        Tuple[float, float, float]: estimated nut factor
+        NutFactors: estimated (K_min, K_typ, K_max)
     """
-    K_typ = (R_t * (np.tan(alpha) + mu_t_typ / np.cos(beta)) + R_e * mu_b_typ) / D
-    
-    K_min = (R_t * (np.tan(alpha) + mu_t_min / np.cos(beta)) + R_e * mu_b_min) / D
-    
-    K_max = (R_t * (np.tan(alpha) + mu_t_max / np.cos(beta)) + R_e * mu_b_max) / D
-    
+    return NutFactors(*_nut_factor_kernel(
+        R_t, R_e, mu_t_min, mu_t_typ, mu_t_max,
+        mu_b_min, mu_b_typ, mu_b_max, alpha, beta, D))
+
+
+@njit(cache=True, fastmath=True)
+def _nut_factor_kernel(R_t, R_e, mu_t_min, mu_t_typ, mu_t_max,
+                       mu_b_min, mu_b_typ, mu_b_max, alpha, beta, D):
+    """Compiled core of nut_factor (validation stays in the wrapper)."""
+    # the geometry terms are common to all three estimates; evaluate
+    # the trig and the divides once and vary only the friction pair
+    # (math.* over np.* -- the inputs are scalars, so the ufunc
+    # dispatch and 0-d array boxing would be pure overhead, and numba
+    # lowers math trig straight to libm):
+    base = R_t * math.tan(alpha)
+    R_t_sec_beta = R_t / math.cos(beta)
+    inv_D = 1.0 / D
+
+    K_min = (base + mu_t_min * R_t_sec_beta + R_e * mu_b_min) * inv_D
+    K_typ = (base + mu_t_typ * R_t_sec_beta + R_e * mu_b_typ) * inv_D
+    K_max = (base + mu_t_max * R_t_sec_beta + R_e * mu_b_max) * inv_D
+
     return K_min, K_typ, K_max
 
 
+@njit(cache=True, fastmath=True)
+def nut_factor_into(out, R_t, R_e, mu_t_min, mu_t_typ, mu_t_max,
+                    mu_b_min, mu_b_typ, mu_b_max, alpha, beta, D):
+    """Write the (K_min, K_typ, K_max) triple into a caller buffer.
+
+    For population sweeps: allocate Ks = np.empty((N, 3)) once and call
+    nut_factor_into(Ks[i], ...) per bolt -- inside an njit prange loop
+    this writes 24 bytes straight into the row with no tuple boxing.
+
+    Args:
+        out: preallocated shape-(3,) float64 buffer
+        (remaining arguments as for nut_factor)
+    Returns:
+        np.ndarray: out, for chaining
+    """
+    base = R_t * math.tan(alpha)
+    R_t_sec_beta = R_t / math.cos(beta)
+    inv_D = 1.0 / D
+    out[0] = (base + mu_t_min * R_t_sec_beta + R_e * mu_b_min) * inv_D
+    out[1] = (base + mu_t_typ * R_t_sec_beta + R_e * mu_b_typ) * inv_D
+    out[2] = (base + mu_t_max * R_t_sec_beta + R_e * mu_b_max) * inv_D
+    return out
+
+
+def nut_factor_batch(
+        R_t: float,
+        R_e: float,
+        mu_t: np.ndarray,
+        mu_b: np.ndarray,
+        alpha: float,
+        beta: float,
+        D: float,
+    ) -> np.ndarray:
+    """Calculate the nut factor over arrays of friction coefficients.
+
+    One vectorized pass for Monte-Carlo / tolerance-stackup studies:
+    the trig and the divide by D are evaluated once, so only the
+    per-sample multiply-adds scale with N.  mu_t and mu_b broadcast
+    against each other (e.g. shape (N,) samples, or (3,) for the
+    min / typ / max triple).
+
+    Args:
+        R_t: Effective radius of thread forces
+        R_e: Effective radius of torqued element-to-joint bearing forces
+        mu_t: thread-interface friction coefficient samples
+        mu_b: bearing-interface friction coefficient samples
+        alpha: Thread lead angle
+        beta: Thread half angle
+        D: Basic major diameter of external threads (bolt)
+    Returns:
+        np.ndarray: nut factor per friction sample
+    """
+    base = R_t * np.tan(alpha)
+    R_t_sec_beta = R_t / np.cos(beta)
+    inv_D = 1.0 / D
+    K = (base + np.asarray(mu_t) * R_t_sec_beta + R_e * np.asarray(mu_b)) * inv_D
+    return K
+
+
+# beta is 30 deg for the whole unified thread form, so its secant is a
+# module constant:
+INV_COS_BETA_UNIFIED = 1.0 / math.cos(math.radians(30.0))
+
+# standard unified thread designations, [major diameter in inches,
+# threads per inch]:
+UNIFIED_THREAD_TABLE = {
+    '8-32': (0.164, 32.0),
+    '10-24': (0.190, 24.0),
+    '10-32': (0.190, 32.0),
+    '1/4-20': (0.250, 20.0),
+    '1/4-28': (0.250, 28.0),
+    '5/16-18': (0.3125, 18.0),
+    '5/16-24': (0.3125, 24.0),
+    '3/8-16': (0.375, 16.0),
+    '3/8-24': (0.375, 24.0),
+    '7/16-14': (0.4375, 14.0),
+    '1/2-13': (0.500, 13.0),
+    '1/2-20': (0.500, 20.0),
+}
+
+# tan(alpha) per designation, precomputed at import: alpha =
+# atan(1/(n_0*pi*E)), so the tangent is just the ratio itself (no trig
+# at lookup time); E is the basic pitch diameter D - 0.649519/n_0:
+_TAN_ALPHA = {
+    name: 1.0 / (n_0 * math.pi * (D - 0.649519 / n_0))
+    for name, (D, n_0) in UNIFIED_THREAD_TABLE.items()
+}
+
+
+def nut_factor_from_thread_spec(
+        designation: str,
+        mu_t,
+        mu_b,
+        R_t: float,
+        R_e: float,
+    ):
+    """Nut factor for a standard unified thread via the precomputed LUT.
+
+    For samples sharing a thread size, tan(alpha) and sec(beta) are
+    table constants; this replaces the per-call transcendentals with
+    two dict fetches and the friction arithmetic.  mu_t / mu_b may be
+    scalars or broadcast arrays.
+
+    Args:
+        designation: thread callout as in UNIFIED_THREAD_TABLE, e.g. "1/4-28"
+        mu_t: thread-interface friction coefficient(s)
+        mu_b: bearing-interface friction coefficient(s)
+        R_t: Effective radius of thread forces
+        R_e: Effective radius of torqued element-to-joint bearing forces
+    Returns:
+        nut factor, same shape as the friction inputs
+    """
+    D, _ = UNIFIED_THREAD_TABLE[designation]
+    tan_alpha = _TAN_ALPHA[designation]
+    K = (R_t * (tan_alpha + mu_t * INV_COS_BETA_UNIFIED) + R_e * mu_b) / D
+    return K
+
+
+@njit(cache=True, fastmath=True)
+def _max_preload_typ(gamma, T_max, K_typ, D, P_thr_pos):
+    """Compiled core of max_preload, typical coefficient method."""
+    return (1.0 + gamma) * T_max / (K_typ * D) + P_thr_pos
+
+
+# reciprocal of (1 + relaxation_ratio) for the default 5 % relaxation,
+# so the common path multiplies instead of dividing:
+_INV_1P05 = 1.0 / 1.05
+
+
+@njit(cache=True, fastmath=True)
+def _min_preload_relax(gamma, T_min, T_p, K_typ, D, P_thr_neg, inv_relax):
+    """Compiled core of min_preload with the relaxation-ratio model.
+
+    inv_relax is the precomputed 1/(1 + relaxation_ratio).
+    """
+    return (((1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg)
+            * inv_relax)
+
+
+@njit(cache=True, fastmath=True)
+def _min_preload_loss(gamma, T_min, T_p, K_typ, D, P_thr_neg, P_loss):
+    """Compiled core of min_preload with an explicit preload loss."""
+    return (1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg - P_loss
+
 
 def max_preload(
-        gamma: float, 
+        gamma: float,
         T_max: float,
         K_typ: float,
         D: float,
@@ -116,18 +338,19 @@ def max_preload(
     Returns:
         float: maximum predicted preload
     """
-    assert gamma >= 0.0
-    assert D > 0.0
-    assert K_typ > 0.0
-    assert P_thr_pos >= 0.0, "error, P_thr_pos must increase the preload"
+    if __debug__:
+        assert np.all(np.greater_equal(gamma, 0.0))
+        assert D > 0.0
+        assert K_typ > 0.0
+        assert P_thr_pos >= 0.0, "error, P_thr_pos must increase the preload"
     # TODO: finish... PLD input & TOL
-    
+
     # 1. Typical Coefficient Method:
-    PLD_max = (1.0 + gamma) * T_max / (K_typ * D) + P_thr_pos
-    
+    PLD_max = _max_preload_typ(gamma, T_max, K_typ, D, P_thr_pos)
+
     # 2.0 Experimental Coefficient Method:
     if K_min is not None:
-        print("using experimental coefficient method...")
+        _log.debug("using experimental coefficient method")
         PLD_max = T_max / (K_min * D) + P_thr_pos
     return PLD_max
 
@@ -159,22 +382,27 @@ def min_preload(
     Returns:
         float: minimum predicted preload
     """
-    assert gamma >= 0.0
-    assert D > 0.0
-    assert K_typ > 0.0
-    assert P_thr_neg <= 0.0, "error, P_thr_neg must decrease the preload"
-    assert relaxation_ratio >= 0.0
+    if __debug__:
+        assert gamma >= 0.0
+        assert D > 0.0
+        assert K_typ > 0.0
+        assert P_thr_neg <= 0.0, "error, P_thr_neg must decrease the preload"
+        assert relaxation_ratio >= 0.0
     # TODO: finish...  PLD input & TOL
     
     # 1. Typical Coefficient Method:
     if P_loss is not None:
-        PLD_min = (1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg - P_loss
+        PLD_min = _min_preload_loss(gamma, T_min, T_p, K_typ, D,
+                                    P_thr_neg, P_loss)
     else:
-        PLD_min = ((1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg) / (1.0 + relaxation_ratio)
-    
+        inv_relax = (_INV_1P05 if relaxation_ratio == 0.05
+                     else 1.0 / (1.0 + relaxation_ratio))
+        PLD_min = _min_preload_relax(gamma, T_min, T_p, K_typ, D,
+                                     P_thr_neg, inv_relax)
+
     # 2.0 Experimental Coefficient Method:
     if K_max is not None:
-        print("using experimental coefficient method...")
+        _log.debug("using experimental coefficient method")
         if P_loss is not None:
             PLD_min = (T_min - T_p) / (K_max * D) + P_thr_neg - P_loss
         else:
@@ -182,6 +410,44 @@ def min_preload(
     return PLD_min
 
 
+def preload_bounds(
+        gamma,
+        T_max,
+        T_min,
+        T_p,
+        K_typ,
+        D,
+        P_thr_pos=0.0,
+        P_thr_neg=0.0,
+        P_loss=0.0,
+    ):
+    """Both preload bounds (typical coefficient method) in one pass.
+
+    max_preload and min_preload each redo the 1/(K_typ*D) divide; for a
+    tolerance stackup over arrays of gamma / torque / nut-factor samples
+    this computes (PLD_min, PLD_max) with the shared reciprocal hoisted
+    and one NumPy expression per output.  All inputs broadcast, so any
+    of them may be shape-(N,) sample arrays.
+
+    Args:
+        gamma: preload uncertainty factor
+        T_max: maximum applied (specified) torque to tighten fastener
+        T_min: minimum applied (specified) torque to tighten fastener
+        T_p: prevailing torque
+        K_typ: typical nut factor
+        D: nominal fastener diameter
+        P_thr_pos: thermally induced load that increases the preload
+        P_thr_neg: thermally induced load that decreases the preload
+        P_loss: preload loss due to relaxation
+    Returns:
+        Tuple of (PLD_min, PLD_max)
+    """
+    inv_KD = 1.0 / (np.asarray(K_typ) * D)
+    PLD_max = (1.0 + gamma) * T_max * inv_KD + P_thr_pos
+    PLD_min = (1.0 - gamma) * (T_min - T_p) * inv_KD + P_thr_neg - P_loss
+    return PLD_min, PLD_max
+
+
 ########################################################
 # 3.4 Typical Preload Uncertainties: pg 3-6
 ########################################################
@@ -215,11 +481,14 @@ def bolt_axial_load_for_strength(
         P: float,
     ) -> float:
     """Bolt axial load resulting from yield, ultimate or joint separation load, P_b.
-    
+
     Used for strength margin calculations (highest expected load in the bolt).
-    
+
     NSTS 08307 Rev A, pg 3-9
-    
+
+    Accepts scalars or shape-compatible NumPy arrays (broadcasting), so
+    a sweep over N bolts is one C-level pass instead of a Python loop.
+
     Args:
         PLD_max: maximum preload
         phi: stiffness parameter
@@ -229,8 +498,9 @@ def bolt_axial_load_for_strength(
     Returns:
         float: bolt axial load used for strength margins
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
-    assert 0.0 <= n <= 1.0
+    if __debug__:
+        assert np.all(np.greater_equal(SF, 1.0)), "error: SF must be >= 1.0"
+        assert np.all(np.greater_equal(n, 0.0)) and np.all(np.less_equal(n, 1.0))
     P_b = PLD_max + n * phi * (SF * P)
     return P_b
 
@@ -239,28 +509,49 @@ def bolt_axial_load_for_strength(
 # 1. Minimum cross section of Bolt: pg 3-9
 
 
+def _safe_margin(allowable, denom):
+    """allowable / denom - 1, with zero denominators giving +inf.
+
+    A load sweep that includes P = 0 rows would otherwise raise a
+    RuntimeWarning and take the slow IEEE div-by-zero path; the where=
+    mask skips those divides branchlessly, and an unloaded row cleanly
+    reports infinite margin.
+    """
+    if isinstance(denom, np.ndarray):
+        out = np.full(np.broadcast(allowable, denom).shape, np.inf)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(allowable, denom, out=out, where=denom != 0.0)
+        return out - 1.0
+    if denom == 0.0:
+        return math.inf
+    return allowable / denom - 1.0
+
+
 def bolt_tensile_margin(
         PA_t: float, 
         SF: float, 
         P: float, 
         P_b: float,
-    ):
+    ) -> TensileMargins:
     """Calculate margin of safety for bolt tensile failure.
-    
+
     NSTS 08307 Rev A, pg 3-9
-    
+
+    Accepts scalars or shape-compatible NumPy arrays (broadcasting).
+
     Args:
         PA_t: bolt tensile load allowable
         SF: safety factor
         P: External axial load applied to joint at bolt location due to application of limit load to the structure
         P_b: Bolt axial load resulting from yield, ultimate or joint separation load
     Returns:
-        float: margin of safety for bolt tensile failure
+        TensileMargins: margins of safety for bolt tensile failure
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
-    MS_crit1 = PA_t / (SF * P) - 1.0
-    MS_crit2 = PA_t / P_b - 1.0
-    return MS_crit1, MS_crit2
+    if __debug__:
+        assert np.all(np.greater_equal(SF, 1.0)), "error: SF must be >= 1.0"
+    MS_crit1 = _safe_margin(PA_t, SF * P)
+    MS_crit2 = _safe_margin(PA_t, P_b)
+    return TensileMargins(MS_crit1, MS_crit2)
 
 
 # 2. Shear Pull-Out of Threads: pg 3-9
@@ -271,25 +562,28 @@ def thread_shear_pull_out_margin(
         SF: float, 
         P: float, 
         P_b: float,
-    ) -> float:
+    ) -> TensileMargins:
     """Calculate margin of safety for thread shear pullout failure.
     
     NSTS 08307 Rev A, pg 3-10
-    
+
     Only checked at ultimate load.
-    
+
+    Accepts scalars or shape-compatible NumPy arrays (broadcasting).
+
     Args:
         PA_s: thread shear load allowable
         SF: safety factor
         P: External axial load applied to joint at bolt location due to application of limit load to the structure
         P_b: Bolt axial load resulting from yield, ultimate or joint separation load
     Returns:
-        float: margin of safety for thread shear pullout failure
+        TensileMargins: margins of safety for thread shear pullout failure
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
-    MS_crit1 = PA_s / (SF * P) - 1.0
-    MS_crit2 = PA_s / P_b - 1.0
-    return MS_crit1, MS_crit2
+    if __debug__:
+        assert np.all(np.greater_equal(SF, 1.0)), "error: SF must be >= 1.0"
+    MS_crit1 = _safe_margin(PA_s, SF * P)
+    MS_crit2 = _safe_margin(PA_s, P_b)
+    return TensileMargins(MS_crit1, MS_crit2)
 
 
 # b. Shear Load:
@@ -307,7 +601,8 @@ def shear_margin(VA: float, SF: float, V: float) -> float:
     Returns:
         float: margin of safety for shear
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
     MS = (VA / (SF * V)) - 1.0
     return MS
 
@@ -327,7 +622,8 @@ def bending_margin(MA: float, SF: float, M: float) -> float:
     Returns:
         float: margin of safety for bending
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
     MS = (MA / (SF * M)) - 1.0
     return MS
 
@@ -355,11 +651,14 @@ def axial_load_ratio(
     Returns:
         float: Ratio of axial load to axial load allowable
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
     R_a1 = (SF * P) / PA_t
     R_a2 = P_b / PA_t
     R_a3 = PLD_max / PA_t
-    return np.max([R_a1, R_a2, R_a3])
+    # builtin max: np.max on a 3-element list would build a list, then
+    # an array, then reduce -- all for a 3-way compare:
+    return max(R_a1, R_a2, R_a3)
 
 
 def bending_load_ratio(
@@ -371,9 +670,11 @@ def bending_load_ratio(
     """Calculate ratio of bending load to bending allowable, R_b.
     
     NSTS 08307 Rev A, pg 3-10 & 3-11
-    
+
     Used in combined loading criteria.
-    
+
+    Accepts scalars or shape-compatible NumPy arrays (broadcasting).
+
     Args:
         SF: factor of safety
         M: Bolt bending moment resulting from limit load
@@ -382,7 +683,8 @@ def bending_load_ratio(
     Returns: 
         float: Ratio of bending load to bending allowable
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
+    if __debug__:
+        assert np.all(np.greater_equal(SF, 1.0)), "error: SF must be >= 1.0"
     R_b = (SF * M) / (MA * K_p)
     return R_b
 
@@ -397,7 +699,8 @@ def shear_load_ratio(SF: float, V: float, VA: float) -> float:
     Returns:
         float: Ratio of shear load to shear load allowable
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
     R_s = (SF * V) / VA
     return R_s
 
@@ -422,8 +725,14 @@ def combined_load_margin(
     Returns:
         float: combined load failure criterion
     """
-    print("warning: this criteria for combined loading is deprecated")
-    return (R_a + R_b/K)**2 + R_s**3 
+    warnings.warn(
+        "this criteria for combined loading is deprecated",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # explicit multiplies: ** on floats dispatches through libm pow
+    t = R_a + R_b / K
+    return t * t + R_s * R_s * R_s
 
 
 ########################################################
@@ -442,9 +751,11 @@ def bolt_bending_margin(
     """Calculate margin of safety for bolt bending failure.
     
     NSTS 08307 Rev A, pg 3-11
-    
+
     For bending load only and ductile material.
-    
+
+    Accepts scalars or shape-compatible NumPy arrays (broadcasting).
+
     Args:
         MA: Bending load allowable of bolt
         K_p: plastic bending factor
@@ -453,7 +764,8 @@ def bolt_bending_margin(
     Returns:
         float: margin of safety for bolt bending failure
     """
-    assert SF >= 1.0, "error: SF must be >= 1.0"
+    if __debug__:
+        assert np.all(np.greater_equal(SF, 1.0)), "error: SF must be >= 1.0"
     MS = (MA * K_p) / (SF * M) - 1.0
     return MS
 
@@ -482,8 +794,12 @@ def combined_load_margin2(
     Returns:
         float: combined load failure criterion
     """
-    print("warning: this criteria for combined loading is deprecated")
-    return R_a**2 + R_b + R_s**3 
+    warnings.warn(
+        "this criteria for combined loading is deprecated",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return R_a * R_a + R_b + R_s * R_s * R_s
 
 
 ########################################################
@@ -511,7 +827,8 @@ def bolt_axial_load_for_separation(
     Returns:
         float: bolt axial load (used for joint separation margin)
     """
-    assert 0.0 <= n <= 1.0
+    if __debug__:
+        assert 0.0 <= n <= 1.0
     P_b = PLD_min + n * phi * P_sep
     return P_b
 
@@ -527,7 +844,8 @@ def joint_separation_load(P: float, SF_sep: float) -> float:
     Returns:
         float: joint separation load
     """
-    assert SF_sep >= 1.0, "error: SF_sep must be >= 1.0"
+    if __debug__:
+        assert SF_sep >= 1.0, "error: SF_sep must be >= 1.0"
     P_sep = P * SF_sep
     return P_sep
 
@@ -540,21 +858,87 @@ def joint_separation_margin_of_safety(
     """Calculate margin of safety for joint separation, MS_sep.
     
     NSTS 08307 Rev A, pg 3-12
-    
+
     Only for P_b < tensile yield allowable of the bolt.
-    
+
+    Accepts scalars or shape-compatible NumPy arrays (broadcasting).
+
     Args:
         PLD_min: minimum preload
-        n: loading plane factor 
+        n: loading plane factor
         phi: stiffness factor
     Returns:
         float: margin of safety for joint separation
     """
-    assert 0.0 <= n <= 1.0
+    if __debug__:
+        assert np.all(np.greater_equal(n, 0.0)) and np.all(np.less_equal(n, 1.0))
     MS_sep = PLD_min / (1.0 - n * phi) - 1.0
     return MS_sep
 
 
+# fused per-bolt pipelines: the usual call sequences (preload -> bolt
+# axial load -> margin) cost a Python call per hop when chained from
+# the granular functions above; these run the same formulas
+# back-to-back in one compiled kernel, with the intermediates in
+# registers.  The granular functions stay as the documented reference.
+
+
+@njit(cache=True, fastmath=True)
+def tensile_margin_pipeline(gamma, T_max, K_typ, D, n, phi, SF, P, PA_t,
+                            P_thr_pos=0.0):
+    """Fused max_preload -> bolt_axial_load_for_strength -> bolt_tensile_margin.
+
+    Returns:
+        tuple: (PLD_max, P_b, MS_crit1, MS_crit2)
+    """
+    PLD_max = (1.0 + gamma) * T_max / (K_typ * D) + P_thr_pos
+    P_b = PLD_max + n * phi * (SF * P)
+    MS_crit1 = PA_t / (SF * P) - 1.0
+    MS_crit2 = PA_t / P_b - 1.0
+    return PLD_max, P_b, MS_crit1, MS_crit2
+
+
+@njit(cache=True, fastmath=True)
+def separation_margin_pipeline(gamma, T_min, T_p, K_typ, D, n, phi,
+                               SF_sep, P, relaxation_ratio=0.05,
+                               P_thr_neg=0.0):
+    """Fused min_preload -> joint_separation_load ->
+    bolt_axial_load_for_separation -> joint_separation_margin_of_safety.
+
+    Returns:
+        tuple: (PLD_min, P_sep, P_b, MS_sep)
+    """
+    PLD_min = (((1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg)
+               / (1.0 + relaxation_ratio))
+    P_sep = P * SF_sep
+    P_b = PLD_min + n * phi * P_sep
+    MS_sep = PLD_min / (1.0 - n * phi) - 1.0
+    return PLD_min, P_sep, P_b, MS_sep
+
+
+@njit(cache=True, fastmath=True)
+def compute_all_margins(PA_t, P_si, P_se, VA, MA, SF, P, P_b_str, V, M):
+    """All five strength margins for one load case in a single kernel.
+
+    Fuses bolt_tensile_margin, both thread_shear_pull_out_margin calls,
+    shear_margin and bending_margin: one compiled call per case instead
+    of five Python dispatches, with the shared 1/(SF*P) and 1/P_b
+    reciprocals evaluated once.  The tensile and pull-out entries are
+    the worst of their two criteria.
+
+    Returns:
+        tuple: (MS_tensile, MS_pull_out_i, MS_pull_out_e, MS_shear,
+        MS_bend)
+    """
+    inv_SFP = 1.0 / (SF * P)
+    inv_Pb = 1.0 / P_b_str
+    MS_tensile = min(PA_t * inv_SFP, PA_t * inv_Pb) - 1.0
+    MS_pull_out_i = min(P_si * inv_SFP, P_si * inv_Pb) - 1.0
+    MS_pull_out_e = min(P_se * inv_SFP, P_se * inv_Pb) - 1.0
+    MS_shear = VA / (SF * V) - 1.0
+    MS_bend = MA / (SF * M) - 1.0
+    return MS_tensile, MS_pull_out_i, MS_pull_out_e, MS_shear, MS_bend
+
 
 ########################################################
 # 3.10 Preloaded Bolt Fatigue & Fracture Criteria: pg 3-12
@@ -584,16 +968,18 @@ def joint_separation_margin_of_safety(
 
 
 def tensile_axial_load_allowable_yield(
-        F_ty: float, 
+        F_ty: float,
         F_tu: float,
+        minimum_ultimate_tensile_load: float,
     ) -> float:
     """Calculate tensile axial load allowable, PA_t_yield
-    
+
     NSTS 08307 Rev A, pg A-4
-    
+
     Args:
         F_ty: Minimum tensile yield strength of bolt
         F_tu: Minimum tensile ultimate strength of bolt
+        minimum_ultimate_tensile_load: rated ultimate tensile load of the bolt
     Returns:
         float: allowable yield tensile load
     """
@@ -634,7 +1020,8 @@ def tensile_axial_load_allowable_yield(
     Returns:
         float: allowable yield tensile load
     """
-    assert A_t > 0.0
+    if __debug__:
+        assert A_t > 0.0
     PA_t_yield = A_t * F_ty
     return PA_t_yield
 
@@ -653,13 +1040,39 @@ def tensile_axial_load_allowable_ultimate(
     Returns:
         float: tensile allowable load against ultimate failure
     """
-    assert A_t > 0.0
+    if __debug__:
+        assert A_t > 0.0
     PA_t_ultimate = A_t * F_tu
     return PA_t_ultimate
 
 
+# a bolt population reuses the same handful of (diameter, tpi,
+# tolerance) combinations across every load case, so the pure area
+# formulas memoize well -- repeats become a dict hit instead of
+# arithmetic.  The wrappers normalize pitch -> n_0 before the cache
+# boundary and keep a direct path for array inputs (unhashable):
+
+@lru_cache(maxsize=256)
+def _tensile_stress_area_cached(D_e_bsc, n_0):
+    inv_n0 = 1.0 / n_0
+    x = D_e_bsc - 0.9743 * inv_n0
+    return 0.7854 * x * x
+
+
+@lru_cache(maxsize=256)
+def _external_thread_shear_area_cached(L_e, K_i_max, n_0, TK_i, TE_e, G_e):
+    c = INV_SQRT3 * n_0
+    return PI * L_e * K_i_max * (0.750 - c * (TK_i + TE_e + G_e))
+
+
+@lru_cache(maxsize=256)
+def _internal_thread_shear_area_cached(L_e, D_e_min, n_0, TD_e, TE_i, G_e):
+    c = INV_SQRT3 * n_0
+    return PI * L_e * D_e_min * (0.875 - c * (TD_e + TE_i + G_e))
+
+
 def bolt_tensile_stress_area(
-        D_e_bsc: float, 
+        D_e_bsc: float,
         n_0: float,
         pitch: float=None,
     ) -> float:
@@ -678,9 +1091,14 @@ def bolt_tensile_stress_area(
     """
     if n_0 is None:
         assert pitch is not None
-        n_0 = 25.4 / pitch 
-    A_t = 0.7854 * (D_e_bsc - 0.9743 / n_0)**2
-    return A_t
+        n_0 = 25.4 / pitch
+    if isinstance(D_e_bsc, np.ndarray) or isinstance(n_0, np.ndarray):
+        # one reciprocal, then multiplies only; explicit square instead
+        # of the ** dispatch:
+        inv_n0 = 1.0 / n_0
+        x = D_e_bsc - 0.9743 * inv_n0
+        return 0.7854 * x * x
+    return _tensile_stress_area_cached(D_e_bsc, n_0)
 
 
 ########################################################
@@ -704,7 +1122,8 @@ def external_thread_shear_load_allowable(
     Returns:
         float: external thread shear load allowable
     """
-    assert A_se > 0.0
+    if __debug__:
+        assert A_se > 0.0
     P_se = A_se * F_su_bolt
     return P_se
 
@@ -723,7 +1142,8 @@ def internal_thread_shear_load_allowable(
     Returns:
         float: internal thread shear load allowable
     """
-    assert A_si > 0.0
+    if __debug__:
+        assert A_si > 0.0
     P_si = A_si * F_su_nut
     return P_si
 
@@ -762,10 +1182,14 @@ def external_thread_shear_area(
     if n_0 is None:
         assert pitch is not None
         n_0 = 25.4 / pitch 
-    assert L_e > 0.0
-    assert K_i_max > 0.0
-    A_se = np.pi * L_e * K_i_max * (0.750 - 0.57735 * n_0 * (TK_i + TE_e + G_e))
-    return A_se
+    if __debug__:
+        assert np.all(np.greater(L_e, 0.0))
+        assert np.all(np.greater(K_i_max, 0.0))
+    if isinstance(L_e, np.ndarray) or isinstance(K_i_max, np.ndarray):
+        c = INV_SQRT3 * n_0
+        return PI * L_e * K_i_max * (0.750 - c * (TK_i + TE_e + G_e))
+    return _external_thread_shear_area_cached(L_e, K_i_max, n_0,
+                                              TK_i, TE_e, G_e)
 
 
 def internal_thread_shear_area(
@@ -799,29 +1223,418 @@ def internal_thread_shear_area(
     if n_0 is None:
         assert pitch is not None
         n_0 = 25.4 / pitch 
-    assert L_e > 0.0
-    assert D_e_min > 0.0
-    A_si = np.pi * L_e * D_e_min * (0.875 - 0.57735 * n_0 * (TD_e + TE_i + G_e))
-    return A_si
+    if __debug__:
+        assert np.all(np.greater(L_e, 0.0))
+        assert np.all(np.greater(D_e_min, 0.0))
+    if isinstance(L_e, np.ndarray) or isinstance(D_e_min, np.ndarray):
+        c = INV_SQRT3 * n_0
+        return PI * L_e * D_e_min * (0.875 - c * (TD_e + TE_i + G_e))
+    return _internal_thread_shear_area_cached(L_e, D_e_min, n_0,
+                                              TD_e, TE_i, G_e)
+
+
+########################################################
+# Batched Analysis: struct-of-arrays bolt catalog
+########################################################
+
+
+@dataclass
+class BoltCatalog:
+    """Struct-of-arrays container for a catalog of bolt designs.
+
+    Each field is a parallel 1-D contiguous float64 array of length
+    n_bolts, so the allowable / margin relations evaluate over the
+    whole catalog as unit-stride vector expressions instead of a
+    Python loop of scalar calls.
+
+    Fields follow the symbols of NSTS 08307 Rev A, Appendix A.
+    """
+    D_e_bsc: np.ndarray  # basic major diameter of external threads
+    D_e_min: np.ndarray  # minimum major diameter of external threads
+    K_i_max: np.ndarray  # maximum minor diameter of internal threads
+    n_0: np.ndarray      # threads per inch
+    L_e: np.ndarray      # length of thread engagement
+    TK_i: np.ndarray     # tolerance on minor diameter of internal threads
+    TD_e: np.ndarray     # tolerance on major diameter of external threads
+    TE_e: np.ndarray     # tolerance on pitch diameter of external threads
+    TE_i: np.ndarray     # tolerance on pitch diameter of internal threads
+    G_e: np.ndarray      # allowance on external threads
+    F_ty: np.ndarray     # minimum tensile yield strength of bolt
+    F_tu: np.ndarray     # minimum tensile ultimate strength of bolt
+    F_su_bolt: np.ndarray  # minimum shear ultimate strength of bolt
+    F_su_nut: np.ndarray   # minimum shear ultimate strength of nut
+
+    def __post_init__(self):
+        for f in dataclasses.fields(self):
+            setattr(self, f.name, np.ascontiguousarray(
+                getattr(self, f.name), dtype=np.float64))
+
+
+@dataclass
+class Allowables:
+    """Per-bolt areas and load allowables of BoltCatalog via compute_allowables."""
+    A_t: np.ndarray       # tensile stress area
+    A_se: np.ndarray      # external thread shear area
+    A_si: np.ndarray      # internal thread shear area
+    PA_t_yld: np.ndarray  # tensile axial load allowable, yield
+    PA_t_ult: np.ndarray  # tensile axial load allowable, ultimate
+    P_se: np.ndarray      # external thread shear load allowable
+    P_si: np.ndarray      # internal thread shear load allowable
+    PA_s: np.ndarray      # thread shear allowable, min(P_se, P_si)
+
+
+def compute_allowables(cat: BoltCatalog) -> Allowables:
+    """Evaluate the Appendix A areas and load allowables over a catalog.
+
+    One pass of whole-array expressions: areas from the thread
+    geometry, then the yield / ultimate tensile and thread-shear load
+    allowables, including the governing (smaller) thread-shear value.
+
+    Args:
+        cat: SoA catalog of bolt designs
+    Returns:
+        Allowables: parallel result arrays, one entry per bolt
+    """
+    A_t = bolt_tensile_stress_area(cat.D_e_bsc, cat.n_0)
+    A_se = external_thread_shear_area(
+        cat.L_e, cat.K_i_max, cat.n_0, cat.TK_i, cat.TE_e, cat.G_e)
+    A_si = internal_thread_shear_area(
+        cat.L_e, cat.D_e_min, cat.n_0, cat.TD_e, cat.TE_i, cat.G_e)
+    P_se = A_se * cat.F_su_bolt
+    P_si = A_si * cat.F_su_nut
+    return Allowables(
+        A_t=A_t,
+        A_se=A_se,
+        A_si=A_si,
+        PA_t_yld=A_t * cat.F_ty,
+        PA_t_ult=A_t * cat.F_tu,
+        P_se=P_se,
+        P_si=P_si,
+        PA_s=np.minimum(P_se, P_si),
+    )
+
+
+########################################################
+# Compiled kernels
+########################################################
+
+# assert-free cores of the hot margin / area relations: the validated
+# Python wrappers above stay the readable reference, while these
+# compile to ufuncs under numba for Monte-Carlo and catalog sweeps
+# (input validation is the caller's job, once per batch).
+
+
+def nut_factor_core(
+        R_t: float,
+        R_e: float,
+        mu_t: float,
+        mu_b: float,
+        alpha: float,
+        beta: float,
+        D: float,
+    ) -> float:
+    """Nut factor for one friction sample (compiled elementwise core)."""
+    return (R_t * (math.tan(alpha) + mu_t / math.cos(beta)) + R_e * mu_b) / D
+
+
+def margin_core(allowable: float, SF: float, load: float) -> float:
+    """MS = allowable / (SF * load) - 1, the shared margin form.
+
+    Covers shear_margin, bending_margin (allowable = MA * K_p) and the
+    first criterion of the tensile / pull-out margins.
+    """
+    return allowable / (SF * load) - 1.0
+
+
+def bolt_axial_load_core(
+        PLD_max: float,
+        n: float,
+        phi: float,
+        SF: float,
+        P: float,
+    ) -> float:
+    """P_b = PLD_max + n * phi * SF * P (compiled elementwise core)."""
+    return PLD_max + n * phi * (SF * P)
+
 
+def load_ratio_core(SF: float, load: float, allowable: float) -> float:
+    """R = SF * load / allowable, the shared load-ratio form.
+
+    Covers shear_load_ratio and bending_load_ratio (allowable =
+    MA * K_p) as a broadcasting ufunc with out= support under numba.
+    """
+    return SF * load / allowable
+
+
+def separation_margin_core(PLD_min: float, n: float, phi: float) -> float:
+    """MS_sep = PLD_min / (1 - n * phi) - 1 (compiled elementwise core)."""
+    return PLD_min / (1.0 - n * phi) - 1.0
+
+
+def tensile_stress_area_core(D_e_bsc: float, n_0: float) -> float:
+    """A_t = 0.7854 * (D_e_bsc - 0.9743 / n_0)^2 (compiled core)."""
+    x = D_e_bsc - 0.9743 / n_0
+    return 0.7854 * x * x
+
+
+if HAVE_NUMBA:
+    nut_factor_core = vectorize(
+        ['float32(float32, float32, float32, float32, float32, float32, float32)',
+         'float64(float64, float64, float64, float64, float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(nut_factor_core)
+    margin_core = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(margin_core)
+    bolt_axial_load_core = vectorize(
+        ['float32(float32, float32, float32, float32, float32)',
+         'float64(float64, float64, float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(bolt_axial_load_core)
+    load_ratio_core = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(load_ratio_core)
+    separation_margin_core = vectorize(
+        ['float32(float32, float32, float32)', 'float64(float64, float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(separation_margin_core)
+    tensile_stress_area_core = vectorize(
+        ['float32(float32, float32)', 'float64(float64, float64)'],
+        target='parallel',
+        fastmath=True,
+    )(tensile_stress_area_core)
+
+# without the JIT compiler, prefer the prebuilt compiled kernels
+# (scalar closed forms, no warmup) over the interpreted ones; the numba
+# AOT build wins over the Cython build when both are present:
+if _aot is None and _cy is not None:
+    _max_preload_typ = _cy.max_preload_typ
+    _min_preload_relax = _cy.min_preload_relax
+    _min_preload_loss = _cy.min_preload_loss
+    tensile_margin_pipeline = _cy.tensile_margin_pipeline
+    separation_margin_pipeline = _cy.separation_margin_pipeline
+    nut_factor_core = _cy.nut_factor_core
+    margin_core = _cy.margin_core
+    load_ratio_core = _cy.load_ratio_core
+    bolt_axial_load_core = _cy.bolt_axial_load_core
+    separation_margin_core = _cy.separation_margin_core
+    tensile_stress_area_core = _cy.tensile_stress_area_core
+
+if _aot is not None:
+    _max_preload_typ = _aot.max_preload_typ
+    _min_preload_relax = _aot.min_preload_relax
+    _min_preload_loss = _aot.min_preload_loss
+    nut_factor_core = _aot.nut_factor_core
+    margin_core = _aot.margin_core
+    load_ratio_core = _aot.load_ratio_core
+    bolt_axial_load_core = _aot.bolt_axial_load_core
+    separation_margin_core = _aot.separation_margin_core
+    tensile_stress_area_core = _aot.tensile_stress_area_core
+
+
+def margin_mask(
+        allowable: np.ndarray,
+        SF: float,
+        P: np.ndarray,
+        P_b: np.ndarray,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
+    """Branchless fail mask for catalog screening.
+
+    A bolt fails when either margin criterion is negative, i.e. when
+    the allowable is below SF*P or below P_b.  Comparing the loads
+    directly skips forming the signed margins and encodes pass/fail as
+    an int8 mask in one fused compare+or pass — no data-dependent
+    branches, so mixed-design populations don't thrash the predictor.
+
+    Args:
+        allowable: load allowable (PA_t or PA_s)
+        SF: safety factor
+        P: external axial load at the bolt location
+        P_b: bolt axial load
+        out: optional preallocated int8 output array
+    Returns:
+        np.ndarray: int8 mask, 1 where the bolt fails either criterion
+    """
+    fail = np.logical_or(
+        np.less(allowable, SF * np.asarray(P)),
+        np.less(allowable, P_b),
+    )
+    if out is None:
+        return fail.astype(np.int8)
+    np.copyto(out, fail, casting='unsafe')
+    return out
+
+
+# tile size for the no-numba fallback of bolt_mc_pipeline: 8192 f8
+# samples keep the handful of per-stage intermediates within L1/L2:
+_MC_BLOCK = 8192
+
+
+def _bolt_mc_loop(mu_t, mu_b, R_t, R_e, alpha, beta, D, gamma,
+                  T_max, T_min, T_p, relaxation_ratio, n, phi, SF, P,
+                  PA_t, PA_s,
+                  out_ms_tension, out_ms_pullout, out_ms_sep):
+    """Parallel per-sample loop behind bolt_mc_pipeline."""
+    tan_alpha = math.tan(alpha)
+    sec_beta = 1.0 / math.cos(beta)
+    inv_D = 1.0 / D
+    inv_SFP = 1.0 / (SF * P)
+    inv_relax = 1.0 / (1.0 + relaxation_ratio)
+    sep_denom = 1.0 / (1.0 - n * phi)
+    for i in prange(mu_t.shape[0]):
+        K = (R_t * (tan_alpha + mu_t[i] * sec_beta) + R_e * mu_b[i]) * inv_D
+        inv_KD = 1.0 / (K * D)
+        PLD_max = (1.0 + gamma) * T_max * inv_KD
+        PLD_min = (1.0 - gamma) * (T_min - T_p) * inv_KD * inv_relax
+        P_b = PLD_max + n * phi * (SF * P)
+        ms1 = PA_t * inv_SFP - 1.0
+        ms2 = PA_t / P_b - 1.0
+        out_ms_tension[i] = ms1 if ms1 < ms2 else ms2
+        ms1 = PA_s * inv_SFP - 1.0
+        ms2 = PA_s / P_b - 1.0
+        out_ms_pullout[i] = ms1 if ms1 < ms2 else ms2
+        out_ms_sep[i] = PLD_min * sep_denom - 1.0
+
+
+if HAVE_NUMBA:
+    _bolt_mc_loop = njit(
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )(_bolt_mc_loop)
+
+
+def bolt_mc_pipeline(
+        mu_t: np.ndarray,
+        mu_b: np.ndarray,
+        R_t: float,
+        R_e: float,
+        alpha: float,
+        beta: float,
+        D: float,
+        gamma: float,
+        T_max: float,
+        T_min: float,
+        T_p: float,
+        relaxation_ratio: float,
+        n: float,
+        phi: float,
+        SF: float,
+        P: float,
+        PA_t: float,
+        PA_s: float,
+        dtype=None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fused Monte-Carlo chain: nut factor -> preloads -> margins.
+
+    One compiled prange loop per friction sample instead of chaining
+    nut_factor / max_preload / min_preload / the margin functions as
+    separate array passes: the per-sample intermediates (K, PLD_max,
+    PLD_min, P_b) stay in registers, so only the friction inputs and
+    the three margin outputs touch memory.
 
-def main() -> None:
+    Args:
+        mu_t: thread-interface friction samples, shape (N,)
+        mu_b: bearing-interface friction samples, shape (N,)
+        R_t: Effective radius of thread forces
+        R_e: Effective radius of torqued element-to-joint bearing forces
+        alpha: Thread lead angle
+        beta: Thread half angle
+        D: Basic major diameter of external threads (bolt)
+        gamma: preload uncertainty factor
+        T_max: maximum applied torque
+        T_min: minimum applied torque
+        T_p: prevailing torque
+        relaxation_ratio: assumed preload percentage loss due to relaxation
+        n: loading plane factor
+        phi: stiffness parameter
+        SF: bolt strength factor of safety
+        P: external axial load at the bolt location
+        PA_t: bolt tensile load allowable
+        PA_s: thread shear load allowable (min of external / internal)
+        dtype: working dtype (default: PRECISION); np.float32 halves
+            memory traffic and doubles SIMD width, well within the
+            scatter of the friction inputs
+    Returns:
+        tuple: (MS_tension, MS_pullout, MS_sep) arrays, each the worst
+        of the applicable criteria per sample
+    """
+    if __debug__:
+        assert SF >= 1.0, "error: SF must be >= 1.0"
+        assert 0.0 <= n <= 1.0
+    if dtype is None:
+        dtype = PRECISION
+    mu_t = np.ascontiguousarray(mu_t, dtype=dtype)
+    mu_b = np.ascontiguousarray(mu_b, dtype=dtype)
+    out_ms_tension = np.empty_like(mu_t)
+    out_ms_pullout = np.empty_like(mu_t)
+    out_ms_sep = np.empty_like(mu_t)
+    if HAVE_NUMBA:
+        _bolt_mc_loop(mu_t, mu_b, R_t, R_e, alpha, beta, D, gamma,
+                      T_max, T_min, T_p, relaxation_ratio, n, phi, SF, P,
+                      PA_t, PA_s,
+                      out_ms_tension, out_ms_pullout, out_ms_sep)
+    elif _cy is not None and mu_t.dtype == np.float64:
+        # compiled single pass from the Cython build (f8 only: the
+        # memoryview kernel is typed double):
+        _cy.bolt_mc_margins(mu_t, mu_b, R_t, R_e, alpha, beta, D, gamma,
+                            T_max, T_min, T_p, relaxation_ratio, n, phi,
+                            SF, P, PA_t, PA_s,
+                            out_ms_tension, out_ms_pullout, out_ms_sep)
+    else:
+        # blocked NumPy fallback: whole-array expressions one tile at a
+        # time, so the per-stage intermediates stay cache-resident
+        # instead of spilling length-N temporaries to DRAM
+        tan_alpha = math.tan(alpha)
+        sec_beta = 1.0 / math.cos(beta)
+        inv_D = 1.0 / D
+        inv_SFP = 1.0 / (SF * P)
+        inv_relax = 1.0 / (1.0 + relaxation_ratio)
+        sep_denom = 1.0 / (1.0 - n * phi)
+        N = mu_t.shape[0]
+        for s in range(0, N, _MC_BLOCK):
+            e = min(s + _MC_BLOCK, N)
+            K = (R_t * (tan_alpha + mu_t[s:e] * sec_beta)
+                 + R_e * mu_b[s:e]) * inv_D
+            inv_KD = 1.0 / (K * D)
+            PLD_max = (1.0 + gamma) * T_max * inv_KD
+            PLD_min = (1.0 - gamma) * (T_min - T_p) * inv_KD * inv_relax
+            P_b = PLD_max + n * phi * (SF * P)
+            out_ms_tension[s:e] = np.minimum(
+                PA_t * inv_SFP - 1.0, PA_t / P_b - 1.0)
+            out_ms_pullout[s:e] = np.minimum(
+                PA_s * inv_SFP - 1.0, PA_s / P_b - 1.0)
+            out_ms_sep[s:e] = PLD_min * sep_denom - 1.0
+    return out_ms_tension, out_ms_pullout, out_ms_sep
+
+
+def main(verbose: bool = False) -> None:
     from thread_fast.threads.iso_68_1998 import eq_H
     from thread_fast.threads.iso_724_1993 import eq_d_1
-    
-    # conversion factors:
-    deg_to_rad = np.pi / 180.0
-    psi_to_MPa = 0.00689476
-    
+
+    # verbose output is accumulated and written once at the end, so the
+    # driver does a single stdout write instead of one flush per value:
+    lines = []
+
     # [mm/thread], screw pitch: for M5 coarse thread
     pitch = 0.8
-    print(f"pitch = {pitch} [mm/thread]")
+    if verbose:
+        lines.append(f"pitch = {pitch} [mm/thread]\n")
     
     # To convert thread pitch to threads per inch (TPI), divide 25.4 (millimeters per inch) by the thread pitch in millimeters.
     
     # threads/inch:
     n_0 = 25.4 / pitch
-    print(f"n_0 = {n_0} [thread/in]")
+    if verbose:
+        lines.append(f"n_0 = {n_0} [thread/in]\n")
     
     # bolt strength factor of safety:
     SF = 1.2
@@ -843,7 +1656,8 @@ def main() -> None:
     
     # height of fundamental triangle:
     H = eq_H(pitch)
-    print(f"H = {H} [mm]")
+    if verbose:
+        lines.append(f"H = {H} [mm]\n")
     
     # Basic major diameter of external threads (bolt):
     D = 5.0
@@ -853,13 +1667,17 @@ def main() -> None:
     
     # [mm], fastener minor diameter (basic):
     D_minor = 4.134
-    print(f"D_minor = {D_minor}")
+    if verbose:
+        lines.append(f"D_minor = {D_minor}\n")
     D_minor = eq_d_1(d=D, H=None, P=pitch)
-    print(f"D_minor = {D_minor}")
+    if verbose:
+        lines.append(f"D_minor = {D_minor}\n")
     D_minor = eq_d_1(d=D, H=H)
-    print(f"D_minor = {D_minor}")
+    if verbose:
+        lines.append(f"D_minor = {D_minor}\n")
     D_minor = D - (5.0/4.0)*H
-    print(f"D_minor = {D_minor}")
+    if verbose:
+        lines.append(f"D_minor = {D_minor}\n")
     
     # Major diameter of external threads (basic (nominal) dimension):
     D_e_bsc = D_major
@@ -877,31 +1695,41 @@ def main() -> None:
     # [mm], mean thread (pitch?) diameter:
     # Basic pitch diameter of external threads (bolt)
     E = (D_major + D_minor) / 2.0
-    print(f"E = {E} [mm]")
+    if verbose:
+        lines.append(f"E = {E} [mm]\n")
     
     # pitch diameter in inches:
     E_in = E / 25.4
     
     # [mm], mean radius of the screw thread:
     r_m = E / 2.0
-    print(f"r_m = {r_m} [mm]")
+    if verbose:
+        lines.append(f"r_m = {r_m} [mm]\n")
     
     
     # [rad], thread lead angle:
-    psi = np.arctan(pitch / (2.0 * np.pi * r_m))
-    print(f"psi = {psi} [rad]")
-    print(f"psi = {psi / deg_to_rad} [deg]")
-    alpha = np.arctan(1.0 / (n_0 * np.pi * E_in))
-    print(f"alpha = {alpha} [rad]")
-    print(f"alpha = {alpha / deg_to_rad} [deg]")
+    # math.atan2 on the scalar pair: no ufunc dispatch, and no
+    # intermediate ratio to round:
+    psi = math.atan2(pitch, 2.0 * PI * r_m)
+    if verbose:
+        lines.append(f"psi = {psi} [rad]\n")
+    if verbose:
+        lines.append(f"psi = {psi / deg_to_rad} [deg]\n")
+    alpha = math.atan2(1.0, n_0 * PI * E_in)
+    if verbose:
+        lines.append(f"alpha = {alpha} [rad]\n")
+    if verbose:
+        lines.append(f"alpha = {alpha / deg_to_rad} [deg]\n")
     
     # [rad], thread half angle:
     beta = 30.0 * deg_to_rad
-    print(f"beta = {beta} [rad]")
+    if verbose:
+        lines.append(f"beta = {beta} [rad]\n")
     
     # Effective radius of torqued element-to-joint bearing forces = 1/2 x (Ro + Ri)
     R_e = 0.5 * (D / 2.0 + 8.5 / 2.0)
-    print(f"R_e = {R_e} [mm]")
+    if verbose:
+        lines.append(f"R_e = {R_e} [mm]\n")
     
     # Allowance on external threads:
     G_e = 0.01
@@ -944,8 +1772,7 @@ def main() -> None:
     
     # stiffness factor:
     phi = 0.75
-    phi = k_b / (k_b + k_j)
-    
+
     
     # Preload Plan:
     
@@ -969,7 +1796,8 @@ def main() -> None:
         beta=beta, 
         D=D,
     )
-    print(f"nut factor, K = {K}")
+    if verbose:
+        lines.append(f"nut factor, K = {K}\n")
     
     # Tensile Area:
     
@@ -978,14 +1806,16 @@ def main() -> None:
         n_0=n_0,
         pitch=None,
     )
-    print(f"A_t = {A_t} [mm^2]")
+    if verbose:
+        lines.append(f"A_t = {A_t} [mm^2]\n")
     
     A_t = bolt_tensile_stress_area(
         D_e_bsc=D_e_bsc, 
         n_0=None,
         pitch=pitch,
     )
-    print(f"A_t = {A_t} [mm^2]")
+    if verbose:
+        lines.append(f"A_t = {A_t} [mm^2]\n")
     
     # Thread Shear Area:
     
@@ -998,7 +1828,8 @@ def main() -> None:
         G_e=G_e,
         pitch=None,
     )
-    print(f"A_se = {A_se} [mm^2]")
+    if verbose:
+        lines.append(f"A_se = {A_se} [mm^2]\n")
     
     A_se = external_thread_shear_area(
         L_e=L_e,
@@ -1009,7 +1840,8 @@ def main() -> None:
         G_e=G_e,
         pitch=pitch,
     )
-    print(f"A_se = {A_se} [mm^2]")
+    if verbose:
+        lines.append(f"A_se = {A_se} [mm^2]\n")
     
     A_si = internal_thread_shear_area(
         L_e=L_e,
@@ -1020,7 +1852,8 @@ def main() -> None:
         G_e=G_e,
         pitch=None,
     )
-    print(f"A_si = {A_si} [mm^2]")
+    if verbose:
+        lines.append(f"A_si = {A_si} [mm^2]\n")
     
     A_si = internal_thread_shear_area(
         L_e=L_e,
@@ -1031,7 +1864,8 @@ def main() -> None:
         G_e=G_e,
         pitch=pitch,
     )
-    print(f"A_si = {A_si} [mm^2]")
+    if verbose:
+        lines.append(f"A_si = {A_si} [mm^2]\n")
     
     
     # Estimated Preload:
@@ -1043,7 +1877,8 @@ def main() -> None:
         P_thr_pos=0.0,
         K_min=None,
     )
-    print(f"PLD_max = {PLD_max} [??]")
+    if verbose:
+        lines.append(f"PLD_max = {PLD_max} [??]\n")
     
     PLD_min = min_preload(
         gamma=gamma, 
@@ -1056,7 +1891,8 @@ def main() -> None:
         P_loss=None,
         K_max=None,
     )
-    print(f"PLD_min = {PLD_min} [??]")
+    if verbose:
+        lines.append(f"PLD_min = {PLD_min} [??]\n")
     
     
     # Bolt Axial Load: 
@@ -1068,7 +1904,8 @@ def main() -> None:
         SF=SF, 
         P=P,
     )
-    print(f"P_b_str = {P_b_str} [??]")
+    if verbose:
+        lines.append(f"P_b_str = {P_b_str} [??]\n")
     
     P_sep = joint_separation_load(
         P=P, 
@@ -1081,7 +1918,8 @@ def main() -> None:
         phi=phi,
         P_sep=P_sep,
     )
-    print(f"P_b_sep = {P_b_sep} [??]")
+    if verbose:
+        lines.append(f"P_b_sep = {P_b_sep} [??]\n")
     
     
     # Allowables:
@@ -1090,63 +1928,62 @@ def main() -> None:
         A_t=A_t, 
         F_tu=F_tu,
     )
-    print(f"PA_t = {PA_t} [??]")
+    if verbose:
+        lines.append(f"PA_t = {PA_t} [??]\n")
     
     P_se = external_thread_shear_load_allowable(
         A_se=A_se,
         F_su_bolt=F_su_bolt,
     )
-    print(f"P_se = {P_se} [N]")
+    if verbose:
+        lines.append(f"P_se = {P_se} [N]\n")
     
     P_si = internal_thread_shear_load_allowable(
         A_si=A_si, 
         F_su_nut=F_su_nut,
     )
-    print(f"P_si = {P_si} [N]")
-    
-    
-    # Margins of Safety:
-    
-    MS_tensile = bolt_tensile_margin(
-        PA_t=PA_t, 
-        SF=SF, 
-        P=P, 
-        P_b=P_b_str,
-    )
-    print(f"MS_tensile = {MS_tensile} [-]")
-    
-    MS_pull_out_i = thread_shear_pull_out_margin(
-        PA_s=P_si, 
-        SF=SF, 
-        P=P, 
-        P_b=P_b_str,
-    )
-    print(f"MS_pull_out_i = {MS_pull_out_i} [-]")
-    
-    MS_pull_out_e = thread_shear_pull_out_margin(
-        PA_s=P_se, 
-        SF=SF, 
-        P=P, 
-        P_b=P_b_str,
-    )
-    print(f"MS_pull_out_e = {MS_pull_out_e} [-]")
+    if verbose:
+        lines.append(f"P_si = {P_si} [N]\n")
     
-    MS_shear = shear_margin(
-        VA=VA, 
-        SF=SF, 
-        V=V,
-    )
-    print(f"MS_shear = {MS_shear} [-]")
     
-    MS_bend = bending_margin(
-        MA=MA, 
-        SF=SF, 
-        M=M,
+    # Margins of Safety: one compiled call instead of five Python-level
+    # margin dispatches per case:
+
+    (MS_tensile, MS_pull_out_i, MS_pull_out_e,
+     MS_shear, MS_bend) = compute_all_margins(
+        PA_t, P_si, P_se, VA, MA, SF, P, P_b_str, V, M)
+    if verbose:
+        lines.append(f"MS_tensile = {MS_tensile} [-]\n")
+        lines.append(f"MS_pull_out_i = {MS_pull_out_i} [-]\n")
+        lines.append(f"MS_pull_out_e = {MS_pull_out_e} [-]\n")
+        lines.append(f"MS_shear = {MS_shear} [-]\n")
+        lines.append(f"MS_bend = {MS_bend} [-]\n")
+
+
+    # Qualification sweep: margins over a preload-uncertainty x
+    # applied-load grid in one broadcast pass -- the margin functions
+    # are plain arithmetic, so an (nU, 1) x (1, nF) mesh flows through
+    # as a single C-level pass instead of nested Python loops:
+
+    U_grid, P_grid = np.ix_(
+        np.linspace(0.2, 0.5, 16),
+        np.linspace(0.5 * P, 2.0 * P, 32),
     )
-    
+    PLD_max_grid = max_preload(gamma=U_grid, T_max=T_max, K_typ=K[1], D=D)
+    P_b_grid = bolt_axial_load_for_strength(
+        PLD_max=PLD_max_grid, n=n, phi=phi, SF=SF, P=P_grid)
+    MS_grid = np.minimum(
+        *bolt_tensile_margin(PA_t=PA_t, SF=SF, P=P_grid, P_b=P_b_grid))
+    if verbose:
+        lines.append(f"sweep: worst MS_tensile = {MS_grid.min()} "
+                     f"over {MS_grid.shape} (gamma, P) grid\n")
+
+    if lines:
+        sys.stdout.write("".join(lines))
+
 
 
 
 if __name__ == "__main__":
-    main()
+    main(verbose=True)
     
\ No newline at end of file
@@ -0,0 +1,139 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Cython mirror of the NSTS 08307A scalar kernels and MC pipeline.
+
+Same fast-path idea as aot_build.py, but built with Cython instead of
+numba.pycc: no LLVM dependency, for hosts where numba cannot be
+installed (offline / constrained analysis environments).  Build via:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+nsts_08307a.py picks these kernels up automatically when neither
+numba nor the AOT module is available.
+
+The exported kernels are the pure-arithmetic closed forms; input
+validation stays in the Python wrappers.
+"""
+from libc.math cimport cos, tan
+
+
+cpdef double nut_factor_core(double R_t, double R_e, double mu_t,
+                             double mu_b, double alpha, double beta,
+                             double D) nogil:
+    """Nut factor for one friction sample."""
+    return (R_t * (tan(alpha) + mu_t / cos(beta)) + R_e * mu_b) / D
+
+
+cpdef double margin_core(double allowable, double SF, double load) nogil:
+    """MS = allowable / (SF * load) - 1."""
+    return allowable / (SF * load) - 1.0
+
+
+cpdef double load_ratio_core(double SF, double load, double allowable) nogil:
+    """R = SF * load / allowable."""
+    return SF * load / allowable
+
+
+cpdef double bolt_axial_load_core(double PLD_max, double n, double phi,
+                                  double SF, double P) nogil:
+    """P_b = PLD_max + n * phi * SF * P."""
+    return PLD_max + n * phi * (SF * P)
+
+
+cpdef double separation_margin_core(double PLD_min, double n,
+                                    double phi) nogil:
+    """MS_sep = PLD_min / (1 - n * phi) - 1."""
+    return PLD_min / (1.0 - n * phi) - 1.0
+
+
+cpdef double max_preload_typ(double gamma, double T_max, double K_typ,
+                             double D, double P_thr_pos) nogil:
+    """Max preload, typical coefficient method."""
+    return (1.0 + gamma) * T_max / (K_typ * D) + P_thr_pos
+
+
+cpdef double min_preload_relax(double gamma, double T_min, double T_p,
+                               double K_typ, double D, double P_thr_neg,
+                               double inv_relax) nogil:
+    """Min preload with the relaxation-ratio model.
+
+    inv_relax is the precomputed 1/(1 + relaxation_ratio).
+    """
+    return (((1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg)
+            * inv_relax)
+
+
+cpdef double min_preload_loss(double gamma, double T_min, double T_p,
+                              double K_typ, double D, double P_thr_neg,
+                              double P_loss) nogil:
+    """Min preload with an explicit preload loss."""
+    return (1.0 - gamma) * (T_min - T_p) / (K_typ * D) + P_thr_neg - P_loss
+
+
+cpdef (double, double, double, double) tensile_margin_pipeline(
+        double gamma, double T_max, double K_typ, double D, double n,
+        double phi, double SF, double P, double PA_t,
+        double P_thr_pos=0.0) nogil:
+    """Fused max preload -> bolt axial load -> tensile margins."""
+    cdef double PLD_max = (1.0 + gamma) * T_max / (K_typ * D) + P_thr_pos
+    cdef double P_b = PLD_max + n * phi * (SF * P)
+    cdef double MS_crit1 = PA_t / (SF * P) - 1.0
+    cdef double MS_crit2 = PA_t / P_b - 1.0
+    return PLD_max, P_b, MS_crit1, MS_crit2
+
+
+cpdef (double, double, double, double) separation_margin_pipeline(
+        double gamma, double T_min, double T_p, double K_typ, double D,
+        double n, double phi, double SF_sep, double P,
+        double relaxation_ratio=0.05, double P_thr_neg=0.0) nogil:
+    """Fused min preload -> separation load -> separation margin."""
+    cdef double PLD_min = (((1.0 - gamma) * (T_min - T_p) / (K_typ * D)
+                            + P_thr_neg) / (1.0 + relaxation_ratio))
+    cdef double P_sep = P * SF_sep
+    cdef double P_b = PLD_min + n * phi * P_sep
+    cdef double MS_sep = PLD_min / (1.0 - n * phi) - 1.0
+    return PLD_min, P_sep, P_b, MS_sep
+
+
+cpdef double tensile_stress_area_core(double D_e_bsc, double n_0) nogil:
+    """A_t = 0.7854 * (D_e_bsc - 0.9743 / n_0)^2."""
+    cdef double x = D_e_bsc - 0.9743 / n_0
+    return 0.7854 * x * x
+
+
+cpdef void bolt_mc_margins(double[::1] mu_t, double[::1] mu_b,
+                           double R_t, double R_e, double alpha,
+                           double beta, double D, double gamma,
+                           double T_max, double T_min, double T_p,
+                           double relaxation_ratio, double n, double phi,
+                           double SF, double P, double PA_t, double PA_s,
+                           double[::1] out_ms_tension,
+                           double[::1] out_ms_pullout,
+                           double[::1] out_ms_sep) nogil:
+    """Fused Monte-Carlo chain: nut factor -> preloads -> margins.
+
+    Compiled mirror of _bolt_mc_loop: the per-sample intermediates
+    stay in registers, only the friction inputs and the three margin
+    outputs touch memory.
+    """
+    cdef Py_ssize_t i, N = mu_t.shape[0]
+    cdef double tan_alpha = tan(alpha)
+    cdef double sec_beta = 1.0 / cos(beta)
+    cdef double inv_D = 1.0 / D
+    cdef double inv_SFP = 1.0 / (SF * P)
+    cdef double inv_relax = 1.0 / (1.0 + relaxation_ratio)
+    cdef double sep_denom = 1.0 / (1.0 - n * phi)
+    cdef double K, inv_KD, PLD_max, PLD_min, P_b, ms1, ms2
+    for i in range(N):
+        K = (R_t * (tan_alpha + mu_t[i] * sec_beta) + R_e * mu_b[i]) * inv_D
+        inv_KD = 1.0 / (K * D)
+        PLD_max = (1.0 + gamma) * T_max * inv_KD
+        PLD_min = (1.0 - gamma) * (T_min - T_p) * inv_KD * inv_relax
+        P_b = PLD_max + n * phi * (SF * P)
+        ms1 = PA_t * inv_SFP - 1.0
+        ms2 = PA_t / P_b - 1.0
+        out_ms_tension[i] = ms1 if ms1 < ms2 else ms2
+        ms1 = PA_s * inv_SFP - 1.0
+        ms2 = PA_s / P_b - 1.0
+        out_ms_pullout[i] = ms1 if ms1 < ms2 else ms2
+        out_ms_sep[i] = PLD_min * sep_denom - 1.0
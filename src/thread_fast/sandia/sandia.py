@@ -1,105 +1,157 @@
-import json
+"""Inputs for bolted joint analysis per Sandia Report SAND2008-0371.
+
+Guidelines for Bolted Joint Design and Analysis
+"""
+from dataclasses import dataclass, field
+
 import numpy as np
 
 
-inputs = {
-    'bolt': {
-        'bolt_diameter': 5.0/8.0,
-        'head_diameter': 1.0,
-        'elastic_modulus': 30.0e6,
-        'yield_strength': 1.0,
-        'ultimate_strength': 1.0,
-        'tensile_area': 1.0,
-        'min_pitch_diameter_external': 1.0,
-        'min_major_diameter_external': 1.0,
-        'coefficient_thermal_expansion': 0.0000096,
-    },
-    'thread': {
-        'threads_per_inch': 11,
-        'lead_angle': 1.0,
-        'half_angle': 1.0,  # 30 degrees for unified threads
-    },
-    'joint': {
-        'n_layers': 2,
-        'use_shigley': False,
-        'threaded_layer': False,  # is bottom layer threaded or through?
-    },
-    'top_layer': {
-        'elastic_modulus': 30.0e6,
-        'yield_strength': 100000.0,
-        'ultimate_strength': 1.0,
-        'thickness': 1.0,
-        'coefficient_thermal_expansion': 0.0000096,
-    },
-    'middle_layer': {
-        'elastic_modulus': 30.0e6,
-        'yield_strength': 100000.0,
-        'ultimate_strength': 1.0,
-        'thickness': 1.0,
-        'coefficient_thermal_expansion': 1.0,
-    },
-    'bottom_layer': {
-        'elastic_modulus': 30.0e6,
-        'yield_strength': 100000.0,
-        'ultimate_strength': 1.0,
-        'thickness': 1.0,
-        'coefficient_thermal_expansion': 1.0,
-    },
-    
-    'preload': {
-        'torque': 1.0,
-        'uncertainty': 0.35,
-        'preload_loss_percent': 0.05,
-        'nut_factor_method': 'manual',
-        'nut_factor_manual': 0.2,
-    },
-    'applied_load': {
-        'F_axial': 0.0,
-        'F_shear': 0.0,
-        'M_bending': 0.0,
-    },
-    'environment': {
-        'T_ambient': 20.0,
-        'T_hot': 60.0,
-        'T_cold': -24.0,
-    },
-    'factors_of_safety': {
-        'fs_yield': 1.2,
-        'ultimate': 1.5,
-    },
-    'friction': {
-        'mu_thread': 0.15,  # friction between threads
-        'mu_head': 0.15,  # bearing surface on bolt head or nut
-    },
-}
-
-
-def check_inputs(inputs):
+# typed input groups: each group of the old module-level dict becomes a
+# frozen slotted dataclass, so a typo'd field name raises instead of
+# silently creating a new key, and attribute access skips the per-level
+# dict hashing:
+
+@dataclass(frozen=True, slots=True)
+class BoltSpec:
+    bolt_diameter: float = 5.0 / 8.0
+    head_diameter: float = 1.0
+    elastic_modulus: float = 30.0e6
+    yield_strength: float = 1.0
+    ultimate_strength: float = 1.0
+    tensile_area: float = 1.0
+    min_pitch_diameter_external: float = 1.0
+    min_major_diameter_external: float = 1.0
+    coefficient_thermal_expansion: float = 0.0000096
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadSpec:
+    threads_per_inch: float = 11
+    lead_angle: float = 1.0
+    half_angle: float = 1.0  # 30 degrees for unified threads
+
+
+@dataclass(frozen=True, slots=True)
+class JointSpec:
+    n_layers: int = 2
+    use_shigley: bool = False
+    threaded_layer: bool = False  # is bottom layer threaded or through?
+
+
+@dataclass(frozen=True, slots=True)
+class LayerSpec:
+    elastic_modulus: float = 30.0e6
+    yield_strength: float = 100000.0
+    ultimate_strength: float = 1.0
+    thickness: float = 1.0
+    coefficient_thermal_expansion: float = 0.0000096
+
+
+@dataclass(frozen=True, slots=True)
+class PreloadSpec:
+    torque: float = 1.0
+    uncertainty: float = 0.35
+    preload_loss_percent: float = 0.05
+    nut_factor_method: str = 'manual'
+    nut_factor_manual: float = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSpec:
+    F_axial: float = 0.0
+    F_shear: float = 0.0
+    M_bending: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class EnvSpec:
+    T_ambient: float = 20.0
+    T_hot: float = 60.0
+    T_cold: float = -24.0
+
+
+@dataclass(frozen=True, slots=True)
+class SFSpec:
+    fs_yield: float = 1.2
+    ultimate: float = 1.5
+
+
+@dataclass(frozen=True, slots=True)
+class FrictionSpec:
+    mu_thread: float = 0.15  # friction between threads
+    mu_head: float = 0.15  # bearing surface on bolt head or nut
+
+
+@dataclass(frozen=True, slots=True)
+class JointInputs:
+    bolt: BoltSpec = field(default_factory=BoltSpec)
+    thread: ThreadSpec = field(default_factory=ThreadSpec)
+    joint: JointSpec = field(default_factory=JointSpec)
+    top_layer: LayerSpec = field(default_factory=LayerSpec)
+    middle_layer: LayerSpec = field(default_factory=LayerSpec)
+    bottom_layer: LayerSpec = field(default_factory=LayerSpec)
+    preload: PreloadSpec = field(default_factory=PreloadSpec)
+    applied_load: LoadSpec = field(default_factory=LoadSpec)
+    environment: EnvSpec = field(default_factory=EnvSpec)
+    factors_of_safety: SFSpec = field(default_factory=SFSpec)
+    friction: FrictionSpec = field(default_factory=FrictionSpec)
+
+
+# struct-of-arrays view of a bolt population: one contiguous structured
+# array instead of N BoltSpec objects, so batch margin passes read
+# unit-stride columns:
+BOLT_DTYPE = np.dtype([
+    ('bolt_diameter', np.float64),
+    ('head_diameter', np.float64),
+    ('elastic_modulus', np.float64),
+    ('yield_strength', np.float64),
+    ('ultimate_strength', np.float64),
+    ('tensile_area', np.float64),
+    ('min_pitch_diameter_external', np.float64),
+    ('min_major_diameter_external', np.float64),
+    ('coefficient_thermal_expansion', np.float64),
+])
+
+
+def bolt_array(bolts) -> np.ndarray:
+    """Pack a sequence of BoltSpec into one BOLT_DTYPE structured array.
+
+    Args:
+        bolts: iterable of BoltSpec
+    Returns:
+        np.ndarray: shape-(N,) structured array, one row per bolt
+    """
+    bolts = list(bolts)
+    arr = np.empty(len(bolts), dtype=BOLT_DTYPE)
+    for name in BOLT_DTYPE.names:
+        arr[name] = [getattr(b, name) for b in bolts]
+    return arr
+
+
+inputs = JointInputs()
+
+
+def check_inputs(inputs: JointInputs) -> None:
     """Validate inputs.
-    
+
     """
-    print(inputs['friction'])
-    
     # check temperatures:
-    T_amb = inputs['environment']['T_ambient']
-    T_hot = inputs['environment']['T_hot']
-    T_cold = inputs['environment']['T_cold']
+    T_amb = inputs.environment.T_ambient
+    T_hot = inputs.environment.T_hot
+    T_cold = inputs.environment.T_cold
 
     assert T_hot >= T_amb
     assert T_amb >= T_cold
-    
-    # SF_yield = inputs.factors_of_safety.fs_yield
-    # SF_ultimate = inputs.factors_of_safety.ultimate
-    # 
-    # assert SF_yield > 1.0
-    # assert SF_ultimate > 1.0
-    
-    
+
+    assert inputs.factors_of_safety.fs_yield > 1.0
+    assert inputs.factors_of_safety.ultimate > 1.0
+
+
 def main() -> None:
-    
+
     check_inputs(inputs)
 
 
 if __name__ == "__main__":
     main()
-    
\ No newline at end of file
@@ -50,8 +50,6 @@ C = portion of clamped joint relieved in loaded part 2
 
 D = portion of clamped joint compressed in loaded part 2
 """
-import numpy as np
-
 
 
 def check_abcd(a: float,b: float,c: float,d: float) -> float:
@@ -59,10 +57,11 @@ def check_abcd(a: float,b: float,c: float,d: float) -> float:
     
     Result should equal 1.0
     """
-    assert a >= 1.0
-    assert b >= 1.0
-    assert c >= 1.0
-    assert d >= 1.0
+    if __debug__:
+        assert a >= 1.0
+        assert b >= 1.0
+        assert c >= 1.0
+        assert d >= 1.0
     return 1.0/a + 1.0/b + 1.0/c + 1.0/d
 
 
@@ -1,9 +1,21 @@
 """Thread class."""
 import json
+import math
+
 import numpy as np
 
+# height of the fundamental triangle per unit pitch; hoisted so
+# construction does a plain float multiply instead of a NumPy ufunc
+# dispatch per instance:
+_SQRT3_2 = math.sqrt(3.0) / 2.0
+
 
 class Thread:
+    # fixed attribute set: no per-instance __dict__, which matters when
+    # building a catalog of hundreds of Thread objects
+    __slots__ = ('d_major_basic', 'pitch', 'es', 'd_major_max', 'H',
+                 'd_minor_basic', 'd_pitch_basic', 'r_min')
+
     def __init__(
             self, 
             diameter: float,
@@ -32,7 +44,7 @@ class Thread:
         self.d_major_max = self.d_major_basic - self.es
         
         # [mm], fundamental triangle height:
-        self.H = np.sqrt(3.0) / 2.0 * pitch
+        self.H = _SQRT3_2 * pitch
         
         # [mm], minor diameter:
         self.d_minor_basic = self.d_major_basic - self.H * (5.0/8.0)
@@ -51,6 +63,67 @@ class Thread:
         ])
 
 
+# one row per thread, same fields as the Thread attributes:
+THREAD_DTYPE = np.dtype([
+    ('d_major_basic', np.float64),
+    ('pitch', np.float64),
+    ('es', np.float64),
+    ('d_major_max', np.float64),
+    ('H', np.float64),
+    ('d_minor_basic', np.float64),
+    ('d_pitch_basic', np.float64),
+    ('r_min', np.float64),
+])
+
+
+class ThreadTable:
+    """Struct-of-arrays catalog of threads.
+
+    Building a catalog as N Thread instances costs N Python objects
+    with scattered float attributes; this stores the whole catalog in
+    one contiguous structured array and computes every derived column
+    with a single broadcast expression, so downstream ISO-724 style
+    diameter math runs vectorized over the table.
+
+    Columns are indexed by name: table['H'], table['d_minor_basic'].
+    """
+
+    __slots__ = ('arr',)
+
+    def __init__(self, diameters, pitches, es):
+        """
+        Args:
+            diameters: basic major diameters, shape (N,)
+            pitches: thread pitches [mm/thread], shape (N,)
+            es: external thread upper deviations, shape (N,)
+        """
+        arr = np.empty(len(diameters), dtype=THREAD_DTYPE)
+        arr['d_major_basic'] = diameters
+        arr['pitch'] = pitches
+        arr['es'] = es
+        arr['d_major_max'] = arr['d_major_basic'] - arr['es']
+        arr['H'] = _SQRT3_2 * arr['pitch']
+        arr['d_minor_basic'] = arr['d_major_basic'] - arr['H'] * (5.0 / 8.0)
+        arr['d_pitch_basic'] = arr['d_major_basic'] - 0.5 * arr['H']
+        arr['r_min'] = 0.125 * arr['pitch']
+        self.arr = arr
+
+    def __len__(self) -> int:
+        return self.arr.shape[0]
+
+    def __getitem__(self, key):
+        return self.arr[key]
+
+    def thread(self, i: int) -> Thread:
+        """Materialize row i as a scalar Thread instance."""
+        row = self.arr[i]
+        return Thread(
+            diameter=float(row['d_major_basic']),
+            pitch=float(row['pitch']),
+            es=float(row['es']),
+        )
+
+
 def main() -> None:
     
     m4x0_7 = Thread(
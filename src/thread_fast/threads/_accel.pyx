@@ -0,0 +1,39 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Compiled scalar kernels for the threads package.
+
+Optional Cython mirrors of the hot scalar equation functions in
+machinery_handbook_29ed.py and torsion_tightening_stress.py: the
+constants are folded into the generated C and the arithmetic runs on
+unboxed doubles. The pure-Python definitions remain the fallback when
+this extension is not built.
+"""
+from libc.math cimport sqrt
+
+# cos(30 deg):
+cdef double COS30 = 0.8660254037844387
+
+# 1/pi:
+cdef double INV_PI = 0.3183098861837907
+
+# constant for 60 degree thread profile:
+cdef double C_60 = 1.155
+
+
+cpdef double eq_d(double p) nogil:
+    """V-thread, sharp V-thread: machinery handbook 29th ed, pg 1806."""
+    return p * COS30
+
+
+cpdef double eq_d_max(double d_bsc, double es) nogil:
+    """Max external major diameter: machinery handbook 29th ed, pg 1869."""
+    return d_bsc - es
+
+
+cpdef double eq_d_min(double d_max, double Td) nogil:
+    """Min external major diameter: machinery handbook 29th ed, pg 1869."""
+    return d_max - Td
+
+
+cpdef double kappa_scalar(double d_As, double P, double mu_t, double d_2) nogil:
+    """Effective-stress / preload-stress ratio (Bulten), scalar core."""
+    return sqrt(1.0 + (12.0 / (d_As * d_As)) * (P * INV_PI + C_60 * mu_t * d_2))
@@ -21,36 +21,54 @@ Symbols:
 
 #TODO: add figure
 """
-import numpy as np
+import math
+import sys
+
+# sqrt(3)/2, the height of the fundamental triangle per unit pitch:
+_SQRT3_2 = math.sqrt(3.0) / 2.0
+
+# the standard pitch series is a small finite set, so H is tabulated
+# once at import and eq_H becomes a dict probe for tabulated pitches:
+_H_TABLE = {
+    p: _SQRT3_2 * p
+    for p in (0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.6, 0.7, 0.75,
+              0.8, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5, 3.0, 3.5, 4.0,
+              4.5, 5.0, 5.5, 6.0)
+}
 
 
 def eq_H(P: float) -> float:
     """Calculate height of fundamental triangle, H.
-    
+
     ISO 68
-    
+
     Args:
         P: thread pitch
     Returns:
         float: height of fundamental triangle
     """
+    H = _H_TABLE.get(P)
+    if H is not None:
+        return H
     assert P > 0.0
-    H = (np.sqrt(3.0) / 2.0) * P
-    return H
+    return _SQRT3_2 * P
 
 
 def main() -> None:
     # [mm/thread], thread pitch:
     pitch = 1.0
-    
+
     # [mm], height of fundamental triangle:
     H = eq_H(pitch)
-    print(f"H = {H} [mm]")
-    
-    print(f"5/8H = {(5.0/8.0)*H}")
-    print(f"3/8H = {(3.0/8.0)*H}")
-    print(f"H/4 = {H/4.0}")
-    print(f"H/8 = {H/8.0}")
+
+    # one buffered write instead of a flush per line:
+    sys.stdout.write("".join([
+        f"H = {H} [mm]\n",
+        f"5/8H = {(5.0/8.0)*H}\n",
+        f"3/8H = {(3.0/8.0)*H}\n",
+        f"H/4 = {H/4.0}\n",
+        f"H/8 = {H/8.0}\n",
+    ]))
 
 
 if __name__ == "__main__":
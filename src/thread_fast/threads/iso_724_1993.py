@@ -14,7 +14,13 @@ Symbols:
 -H: height of fundamental triangle
 -P: pitch
 """
+import hashlib
+import sys
+from pathlib import Path
+
 import numpy as np
+
+from thread_fast.jit_helpers import njit
 from thread_fast.threads.iso_68_1998 import eq_H
 
 # list of metric diameter and pitch combinations:
@@ -153,16 +159,77 @@ def eq_d_1(d: float, H: float, P: float=None) -> float:
     return d_1
 
 
+@njit(cache=True, fastmath=True)
+def compute_all_diameters(dp: np.ndarray) -> np.ndarray:
+    """Basic pitch and minor diameters for a whole (N, 2) catalog.
+
+    One compiled loop over [diameter, pitch] rows instead of per-row
+    Python calls into eq_d_2 / eq_d_1: H is computed once per row and
+    the None-sentinel branches of the scalar functions disappear.
+    Internal and external threads share the basic formulas, so two
+    columns cover all four eq_* functions.
+
+    Args:
+        dp: array of [basic major diameter, pitch] rows, shape (N, 2)
+    Returns:
+        np.ndarray: shape (N, 2) array of [d_2, d_1] per row
+    """
+    out = np.empty((dp.shape[0], 2), dtype=np.float64)
+    for i in range(dp.shape[0]):
+        # height of the fundamental triangle, sqrt(3)/2 * P:
+        H = 0.8660254037844386 * dp[i, 1]
+        d = dp[i, 0]
+        out[i, 0] = d - 0.75 * H
+        out[i, 1] = d - 1.25 * H
+    return out
+
+
+# on-disk memo of the catalog's derived diameters, keyed on a hash of
+# the input table so edits to metric_thread_list invalidate it:
+_CACHE_PATH = Path(__file__).parent / 'data' / 'iso_724_1993_diameters.npz'
+
+
+def cached_diameter_table() -> np.ndarray:
+    """compute_all_diameters over the catalog, memoized to disk.
+
+    The derived table is deterministic in metric_thread_list, so after
+    the first run it loads from a small .npz instead of recomputing;
+    the stored key (a hash of the input rows) guards against a stale
+    cache when the catalog changes.
+
+    Returns:
+        np.ndarray: shape (N, 2) array of [d_2, d_1] per catalog row
+    """
+    dp = np.ascontiguousarray(metric_thread_list, dtype=np.float64)
+    key = hashlib.blake2b(dp.tobytes()).hexdigest()[:16]
+    if _CACHE_PATH.exists():
+        with np.load(_CACHE_PATH) as npz:
+            if str(npz['key']) == key:
+                return npz['out']
+    out = compute_all_diameters(dp)
+    try:
+        np.savez_compressed(_CACHE_PATH, key=key, out=out)
+    except OSError:
+        # read-only install: serve the computed table without caching
+        pass
+    return out
+
+
 def main() -> None:
-    print(metric_thread_list)
-    print(metric_thread_dict)
-    
-    for thread in metric_thread_list:
-        print(f"thread = {thread}")
-        d2 = eq_d_2(thread[0], None, thread[1])
-        print(f"d2 = {d2}")
-    
-    
+    lines = [f"{metric_thread_list}\n", f"{metric_thread_dict}\n"]
+
+    # whole-catalog pass: one compiled call instead of a Python loop
+    # of scalar eq_d_2 / eq_d_1 invocations
+    dp = np.asarray(metric_thread_list, dtype=np.float64)
+    diameters = compute_all_diameters(dp)
+    for thread, (d2, d1) in zip(metric_thread_list, diameters):
+        lines.append(f"thread = {thread}: d2 = {d2}, d1 = {d1}\n")
+
+    # one buffered write for the whole catalog instead of a flush per row:
+    sys.stdout.write("".join(lines))
+
+
+
 if __name__ == "__main__":
     main()
     
\ No newline at end of file
@@ -28,8 +28,13 @@ EI + T = ES
 es + T = ei ???
 
 """
+import math
+
 import numpy as np
 
+# sin(pi/3), for the expanded root-truncation formula below:
+_SQRT3_2 = 0.8660254037844386
+
 
 ###################################
 # Table 1: Fundamental deviations for internal threads and external threads, pg 8
@@ -70,13 +75,26 @@ import numpy as np
 
 
 def eq_C_max(H: float, R_min: float, T_d2: float) -> float:
+    """Maximum root truncation of the external thread, C_max.
+
+    The printed form is H/4 - R_min*(1 - cos(pi/3 - acos(x))) + T_d2/2
+    with x = 1 - T_d2/(4*R_min); the angle-difference identity gives
+    cos(pi/3 - acos(x)) = 0.5*x + sin(pi/3)*sqrt(1 - x^2), so one sqrt
+    replaces the cos/arccos pair.
     """
-    
-    """
-    C_max = H/4.0 - R_min * (1.0 - np.cos(np.pi/3.0 - np.arccos(1.0 - T_d2 / (4.0*R_min)))) + T_d2 / 2.0
+    x = 1.0 - T_d2 / (4.0 * R_min)
+    y = 0.5 * x + _SQRT3_2 * math.sqrt(1.0 - x * x)
+    C_max = 0.25 * H - R_min * (1.0 - y) + 0.5 * T_d2
     return C_max
 
 
+def eq_C_max_arr(H, R_min, T_d2):
+    """eq_C_max over arrays, for batch generation of the Table 7 grid."""
+    x = 1.0 - T_d2 / (4.0 * R_min)
+    y = 0.5 * x + _SQRT3_2 * np.sqrt(1.0 - x * x)
+    return 0.25 * H - R_min * (1.0 - y) + 0.5 * T_d2
+
+
 def eq_C_min(P: float) -> float:
     """
     
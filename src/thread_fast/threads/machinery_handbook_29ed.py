@@ -3,76 +3,96 @@
 
 
 """
+import math
+from pathlib import Path as _Path
+from typing import Final
+
 import numpy as np
 
 # conversion factors:
-deg_to_rad = np.pi / 180.0
+DEG_TO_RAD: Final[float] = math.pi / 180.0
+
+# constants: cos(30 deg) as a plain Python float, so scalar callers of
+# eq_d stay on CPython's C-float fast path instead of paying np.float64
+# operator dispatch per multiply. Final lets an AOT compiler (Cython
+# pure-Python mode / mypyc) fold these into the generated C:
+COS30: Final[float] = math.cos(math.pi / 6.0)
+
+# np.float64 alias for explicitly vectorized paths:
+COS30_NP = np.float64(COS30)
 
-# constants:
-cos30 = np.cos(30.0 * deg_to_rad)
+# backwards-compatible names:
+cos30 = COS30
+deg_to_rad = DEG_TO_RAD
 
 
 # standard unified thread diameter pitch combinations (UN/UNR):
-# [diameter in inches, threads per inch]:
-# pg 1816:
-unc_diam_pitch_list = [
-    [0.073, 64.0],  # size 1, coarse
-    [0.086, 56.0],  # size 2, coarse
-    [0.099, 48.0],  # size 3, coarse
-    [0.112, 40.0],  # size 4, coarse
-    [0.125, 40.0],  # size 5, coarse
-    [0.138, 32.0],  # size 6, coarse
-    [0.164, 32.0],  # size 8, coarse
-    [0.190, 24.0],  # size 10, coarse
-    [0.216, 24.0],  # size 12, coarse
-    [0.250, 20.0],  # size 1/4, coarse
-    [0.3125, 18.0],  # size 5/16, coarse
-    [0.3750, 16.0],  # size 3/8, coarse
-    [0.4375, 14.0],  # size 7/16, coarse
-    [0.5000, 13.0],  # size 1/2, coarse
-    [0.5625, 12.0],  # size 9/16, coarse
-    [0.6250, 11.0],  # size 5/8, coarse
-    [0.7500, 10.0],  # size 3/4, coarse
-    [0.8750, 9.0],  # size 7/8, coarse
-    #TODO: finish...
-]
+# the diameter and pitch columns are parallel sorted float64 arrays
+# (struct-of-arrays) so a pitch lookup is one binary search in C and a
+# whole-series sweep is a contiguous vector scan. The tables ship as
+# structured .npy assets brought in by one memory-mapped np.load each
+# (read-only, shared across processes) instead of parsing ~50 list
+# literals per import; the literal source of truth lives in
+# scripts/gen_thread_tables.py -- rerun it after editing a series.
+
+# coarse threads, UNC, UNRC:
+# [diameter in inches], [threads per inch]:
+# machinery handbook 29th ed, pg 1816
+_unc = np.load(_Path(__file__).parent / 'data' / 'unc.npy', mmap_mode='r')
+DIAMS_UNC = _unc['d']
+PITCHES_UNC = _unc['tpi']
 
 # fine threads, UNF, UNRF:
-unf_diam_pitch_list = [
-    [0.0600, 80.0],  # size 0, fine
-    [0.0730, 72.0],  # size 1, fine
-    [0.0860, 64.0],  # size 2, fine
-    [0.0990, 56.0],  # size 3, fine
-    [0.1120, 48.0],  # size 4, fine
-    [0.1250, 44.0],  # size 5, fine
-    [0.1380, 40.0],  # size 6, fine
-    [0.1640, 36.0],  # size 8, fine
-    [0.1900, 32.0],  # size 10, fine
-    [0.2160, 28.0],  # size 12, fine
-    [0.2500, 28.0],  # size 1/4, fine
-    [0.3125, 24.0],  # size 5/16, fine
-    [0.3750, 24.0],  # size 3/8, fine
-    [0.4375, 20.0],  # size 7/16, fine
-    [0.5000, 20.0],  # size 1/2, fine
-    [0.5625, 18.0],  # size 9/16, fine
-    [0.6250, 18.0],  # size 5/8, fine
-    [0.7500, 16.0],  # size 3/4, fine
-    [0.8750, 14.0],  # size 7/8, fine
-    [1.0000, 12.0],  # size 1", fine
-    [1.1250, 12.0],  # size 1 1/8, fine
-    [1.2500, 12.0],  # size 1 1/4, fine
-    [1.3750, 12.0],  # size 1 3/8, fine
-    [1.5000, 12.0],  # size 1 1/2, fine
-    #TODO: finish...
-]
+_unf = np.load(_Path(__file__).parent / 'data' / 'unf.npy', mmap_mode='r')
+DIAMS_UNF = _unf['d']
+PITCHES_UNF = _unf['tpi']
 
 # extra fine threads, UNEF, UNREF: Table 4c. pg 1846
-unef_diam_pitch_list = [
-    [0.2160, 32.0],  # size 12, extra fine
-    [0.2500, 32.0],  # size 1/4, extra fine
-    [0.3125, 32.0],  # size 5/16, extra fine
-    #TODO: finish...
-]
+_unef = np.load(_Path(__file__).parent / 'data' / 'unef.npy', mmap_mode='r')
+DIAMS_UNEF = _unef['d']
+PITCHES_UNEF = _unef['tpi']
+
+
+# one-slot last-query cache for lookup_pitch: real analyses query the
+# same size many times in a row (load-case loops over one bolt), and a
+# tuple compare is cheaper than even the binary search. Not re-entrant
+# across threads; a stale read just falls through to the search.
+_last_lookup_key = None
+_last_lookup_tpi = 0.0
+
+
+def lookup_pitch(diams: np.ndarray, pitches: np.ndarray, d: float) -> float:
+    """Look up threads-per-inch for a diameter in one of the series tables.
+
+    O(log N) binary search over the sorted diameter column instead of a
+    Python-level linear scan of [d, tpi] pairs; consecutive queries for
+    the same size skip the search via a one-slot cache.
+
+    Args:
+        diams: sorted diameter column, e.g. DIAMS_UNC
+        pitches: matching pitch column, e.g. PITCHES_UNC
+        d: basic major diameter to look up
+    Returns:
+        float: threads per inch for diameter d
+    """
+    global _last_lookup_key, _last_lookup_tpi
+    key = (id(diams), d)
+    if key == _last_lookup_key:
+        return _last_lookup_tpi
+    i = np.searchsorted(diams, d)
+    if i == diams.shape[0] or diams[i] != d:
+        raise ValueError(f"diameter {d} is not in the series table")
+    tpi = float(pitches[i])
+    _last_lookup_key = key
+    _last_lookup_tpi = tpi
+    return tpi
+
+
+# backwards-compatible names; now (N, 2) arrays rather than lists of
+# lists -- row iteration and [i][j] indexing still work:
+unc_diam_pitch_list = np.column_stack((DIAMS_UNC, PITCHES_UNC))
+unf_diam_pitch_list = np.column_stack((DIAMS_UNF, PITCHES_UNF))
+unef_diam_pitch_list = np.column_stack((DIAMS_UNEF, PITCHES_UNEF))
 
 
 
@@ -102,7 +122,7 @@ def eq_d(p: float) -> float:
     
     machinery handbook 29th ed, pg 1806
     """
-    d = p * cos30
+    d = p * COS30
     return d
 
 
@@ -159,8 +179,20 @@ def eq_d_min(d_max: float, Td: float) -> float:
 
 
 
+# compiled versions of the scalar equation functions (_accel.pyx),
+# when the optional Cython extension was built; same signatures, with
+# the __debug__ checks compiled out:
+try:
+    from thread_fast.threads import _accel
+    eq_d = _accel.eq_d
+    eq_d_max = _accel.eq_d_max
+    eq_d_min = _accel.eq_d_min
+except ImportError:
+    pass
+
+
 def main() -> None:
-    
+
     # cosine of 30 degrees:
     print(f"cos30 = {cos30}")
     
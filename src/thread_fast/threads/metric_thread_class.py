@@ -39,17 +39,23 @@ Symbols:
 -LH: left hand thread
 
 """
+from functools import lru_cache
+from pathlib import Path as _Path
+
 import numpy as np
 
 # coarse pitch metric thread M profile series:
-# [diameter, pitch], 
+# parallel sorted diameter / pitch columns so a lookup is one binary
+# search (see machinery_handbook_29ed.lookup_pitch); shipped as a
+# structured .npy asset, regenerated by scripts/gen_thread_tables.py:
 # machinery handbook 29th ed, pg 1880
-mc_thread_list = [
-    [1.6, 0.35],
-    [2.0, 0.4],
-    [2.5, 0.45],
-    #TODO: finish...
-]
+_mc = np.load(_Path(__file__).parent / 'data' / 'mc.npy', mmap_mode='r')
+DIAMS_MC = _mc['d']
+PITCHES_MC = _mc['P']
+
+# backwards-compatible name; now an (N, 2) array rather than a list of
+# lists:
+mc_thread_list = np.column_stack((DIAMS_MC, PITCHES_MC))
 
 
 # TODO: need to encode table 6, pg 1886
@@ -67,15 +73,22 @@ mc_thread_list = [
 
 
 class MetricThread:
+    # fixed attribute set: no per-instance __dict__, which halves the
+    # footprint when sweeps build many fasteners and makes attribute
+    # access a slot index instead of a dict probe
+    __slots__ = ('external', 'internal', 'name', 'd', 'D', 'pitch',
+                 'tolerance_grade', 'tolerance_position', 'profile',
+                 'EI', 'D_min')
+
     def __init__(
-            self, 
+            self,
             name: str,
             basic_major_diameter: float,
             pitch: float,
             tolerance_grade: int,  # [3,4,5,6,7,8,9]
             tolerance_position: str,  # [e, f, g, h, G, H]
             external: bool=True,
-            intneral: bool=False,
+            internal: bool=False,
             profile: str='M',  # [M, MJ]
         ):
             
@@ -110,9 +123,37 @@ class MetricThread:
         
         # min major diameter:
         self.D_min = self.D + self.EI
-        
-        
-        
+
+
+
+
+
+@lru_cache(maxsize=1024)
+def _build_metric(
+        name: str,
+        basic_major_diameter: float,
+        pitch: float,
+        tolerance_grade: int,
+        tolerance_position: str,
+        external: bool,
+        internal: bool,
+        profile: str,
+    ) -> MetricThread:
+    """Memoized MetricThread construction.
+
+    Parametric studies rebuild the same bolt definition many times;
+    keying on the full argument tuple returns the already-built object
+    instead of recomputing the derived dimensions. lru_cache is
+    thread-safe, and callers must treat cached instances as immutable
+    since they are shared.
+    """
+    return MetricThread(name, basic_major_diameter, pitch,
+                        tolerance_grade, tolerance_position,
+                        external, internal, profile)
+
+
+# memoized constructor entry point, e.g. MetricThread.get('M6x1.0', ...):
+MetricThread.get = staticmethod(_build_metric)
 
 
 def main() -> None:
@@ -21,17 +21,81 @@ Symbols:
 -TD2: external pitch diameter tolerance
 
 """
+from functools import lru_cache
+
 import numpy as np
 
+from thread_fast.threads.machinery_handbook_29ed import (
+    DIAMS_UNC, PITCHES_UNC,
+    DIAMS_UNF, PITCHES_UNF,
+    DIAMS_UNEF, PITCHES_UNEF,
+)
+
+# placeholder tolerances shared by __init__ and the precomputed tables
+# below (the handbook tolerance tables are not encoded yet):
+_TD2 = 1.0
+_TD2_INT = 1.0
+_ES = 0.3 * _TD2
+_TD = 1.0
+_H_B = 1.0
+
+# derived dimensions per standard size, one row per table entry:
+DERIVED_DTYPE = np.dtype([
+    ('d', np.float64),
+    ('P', np.float64),
+    ('d_max', np.float64),
+    ('d_min', np.float64),
+    ('D2_min', np.float64),
+    ('D2_max', np.float64),
+])
+
+
+def _derived_table(diams: np.ndarray, tpi: np.ndarray) -> np.ndarray:
+    """Precompute the __init__ arithmetic for a whole series at import.
+
+    The UNC/UNF/UNEF tables are static, so the derived dimensions are
+    computed once here with broadcast expressions; from_standard then
+    fills a new instance by struct copy with no per-construction math.
+    """
+    table = np.zeros(diams.shape[0], dtype=DERIVED_DTYPE)
+    table['d'] = diams
+    table['P'] = 1.0 / tpi
+    table['d_max'] = diams - _ES
+    table['d_min'] = table['d_max'] - _TD
+    table['D2_min'] = diams - _H_B
+    table['D2_max'] = table['D2_min'] + _TD2_INT
+    return table
+
+
+# sorted diameter column plus derived rows, per thread series:
+UN_TABLES = {
+    'UNC': (DIAMS_UNC, _derived_table(DIAMS_UNC, PITCHES_UNC)),
+    'UNF': (DIAMS_UNF, _derived_table(DIAMS_UNF, PITCHES_UNF)),
+    'UNEF': (DIAMS_UNEF, _derived_table(DIAMS_UNEF, PITCHES_UNEF)),
+}
+
+# one-slot last-query cache for from_standard's row lookup, mirroring
+# machinery_handbook_29ed.lookup_pitch: load-case loops rebuild the
+# same size repeatedly, so consecutive hits skip the binary search.
+# Not re-entrant across threads; a stale read falls through.
+_last_std_key = None
+_last_std_row = None
+
 
 class UnifiedThread:
+    # fixed attribute set, as for MetricThread: smaller instances and
+    # slot-descriptor attribute access
+    __slots__ = ('external', 'internal', 'name', 'd_bsc', 'D_bsc',
+                 'pitch', 'Td2', 'TD2', 'es', 'Td', 'd_max', 'd_min',
+                 'h_b', 'D2_min', 'D2_max')
+
     def __init__(
-            self, 
+            self,
             name: str,
             basic_major_diameter: float,
             pitch: float,
             external: bool=True,
-            intneral: bool=False,
+            internal: bool=False,
         ):
             
         if internal is True:
@@ -52,6 +116,10 @@ class UnifiedThread:
         
         # pitch diameter tolerance:
         self.Td2 = 1.0
+
+        # internal pitch diameter tolerance (was read below but never
+        # assigned, so construction raised AttributeError):
+        self.TD2 = 1.0
         
         # basic allowance:
         self.es = 0.3 * self.Td2
@@ -74,6 +142,87 @@ class UnifiedThread:
         # maximum internal pitch diameter:
         self.D2_max = self.D2_min + self.TD2
 
+    @classmethod
+    def from_standard(
+            cls,
+            name: str,
+            basic_major_diameter: float,
+            series: str='UNC',
+            external: bool=True,
+            internal: bool=False,
+        ) -> 'UnifiedThread':
+        """Build a standard-size thread from the precomputed tables.
+
+        Looks the diameter up in the series table with a binary search
+        and fills the instance from the precomputed record, so no
+        dimension arithmetic runs per construction. Non-standard
+        diameters are not in the tables; build those through the
+        regular constructor with an explicit pitch.
+
+        Args:
+            name: designation, e.g. 'un_1_4_20'
+            basic_major_diameter: [in], basic major diameter
+            series: 'UNC', 'UNF' or 'UNEF'
+            external: external or internal thread?
+            internal: external or internal thread?
+        Returns:
+            UnifiedThread:
+        """
+        global _last_std_key, _last_std_row
+        key = (series, basic_major_diameter)
+        if key == _last_std_key:
+            row = _last_std_row
+        else:
+            diams, table = UN_TABLES[series]
+            i = np.searchsorted(diams, basic_major_diameter)
+            if i == diams.shape[0] or diams[i] != basic_major_diameter:
+                raise ValueError(
+                    f"diameter {basic_major_diameter} is not in the "
+                    f"{series} table")
+            row = table[i]
+            _last_std_key = key
+            _last_std_row = row
+        if internal is True:
+            external = False
+        self = cls.__new__(cls)
+        self.external = external
+        self.internal = internal
+        self.name = name
+        self.d_bsc = float(row['d'])
+        self.D_bsc = float(row['d'])
+        self.pitch = float(row['P'])
+        self.Td2 = _TD2
+        self.TD2 = _TD2_INT
+        self.es = _ES
+        self.Td = _TD
+        self.d_max = float(row['d_max'])
+        self.d_min = float(row['d_min'])
+        self.h_b = _H_B
+        self.D2_min = float(row['D2_min'])
+        self.D2_max = float(row['D2_max'])
+        return self
+
+
+@lru_cache(maxsize=1024)
+def _build_unified(
+        name: str,
+        basic_major_diameter: float,
+        pitch: float,
+        external: bool,
+        internal: bool,
+    ) -> UnifiedThread:
+    """Memoized UnifiedThread construction.
+
+    Same rationale as metric_thread_class._build_metric: repeated
+    construction of an identical fastener returns the cached object,
+    which callers must treat as immutable since it is shared.
+    """
+    return UnifiedThread(name, basic_major_diameter, pitch,
+                         external, internal)
+
+
+# memoized constructor entry point:
+UnifiedThread.get = staticmethod(_build_unified)
 
 
 def main() -> None:
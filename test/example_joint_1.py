@@ -39,12 +39,12 @@ print("yield clamping force = ", Fycl, " N")
 
 # [N], desired preload = tension, 80% of yield capability
 Pdes = 0.8 * Fycl
-Treq = M5bolt.torque_for_tension(prld=Pdes, k=kest)
+Treq = M5bolt.torque_for_tension(preload=Pdes, k=kest)
 print("Required Torque = ", Treq, " N-mm")
 
 # Turn of the nut method to get preload:
 theta = M5bolt.nut_turns_for_tension(
-    prld=Pdes, 
+    preload=Pdes, 
     lj=50.0, 
     hn=5.0, 
     hb=5.0,
@@ -53,7 +53,7 @@ print("nut turns for preload = ", theta, " deg")
 print("nut turns for preload = ", theta / 360.0, " revs")
 
 # [mm], bolt stretch (change in length) due to preload:
-delta = M5bolt.length_change(prld=Pdes, lj=50.0)
+delta = M5bolt.length_change(preload=Pdes, lj=50.0)
 print("Bolt Stretch = ", delta, " mm")
 
 Tp = M5bolt.tension_torque_t1(Pdes)
@@ -107,7 +107,7 @@ print("yield clamping force = ", Fycl, " N")
 
 # [N], desired preload = tension
 Pdes = Fycl
-Treq = M10bolt.torque_for_tension(prld=Pdes, k=kest)
+Treq = M10bolt.torque_for_tension(preload=Pdes, k=kest)
 print("Required Torque = ", Treq, " N-mm")
 
 Ttf = M10bolt.thread_friction_torque_t2(mu_s, Pdes)
@@ -118,10 +118,22 @@ print("thread cross section stress = ", sigma, " MPa  < ", M10bolt.sigma_y, " MP
 
 # Turn of the nut method to get preload:
 theta = M10bolt.nut_turns_for_tension(
-    prld=Pdes, 
+    preload=Pdes, 
     lj=30.0, 
     hn=10.0, 
     hb=10.0,
 )
 print("nut turns for preload = ", theta, " deg")
 print("nut turns for preload = ", theta / 360.0, " revs")
+
+
+# Friction sensitivity sweep: the analysis above, batched over a range
+# of friction coefficients in one vectorized pass instead of a Python
+# loop of scalar method calls:
+print("\n\nFriction sensitivity sweep (M5):")
+mu = np.linspace(0.08, 0.20, 64)
+res = M5bolt.analyze(mu_s=mu, mu_w=mu)
+print("over ", mu.size, " friction points mu = 0.08 .. 0.20:")
+print("nut factor k = ", res['k'].min(), " .. ", res['k'].max())
+print("required torque = ", res['Treq'].min(), " .. ", res['Treq'].max(), " N-mm")
+print("thread stress = ", res['sigma'].min(), " .. ", res['sigma'].max(), " MPa")
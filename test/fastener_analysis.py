@@ -2,7 +2,6 @@
 Timothy P Woodard
 May 16, 2021
 """
-import numpy as np
 
 
 # Fitting Factor:
@@ -2,7 +2,6 @@
 Timothy P Woodard
 July 1, 2021
 """
-import numpy as np
 from english_fastener_class import EnglishFastener
 
 # Bolted Joint description:
@@ -1,3 +1,5 @@
+import types
+
 import numpy as np
 
 
@@ -82,28 +84,39 @@ P_p_min = P_pi_min - P_pr - P_pc - P_deltat_min
 
 
 def torque_control_parameter_factor(
-        trq_nom: float, 
-        trq_max: float, 
-        trq_min: float,
+        trq_nom,
+        trq_max,
+        trq_min,
+        out_min=None,
+        out_max=None,
+        dtype=np.float64,
     ):
     """
     From NASA 5020B page 22, 23
-    
+
     c_max = (trq_nom + trq_tol) / trq_nom
     c_min = (trq_nom - trq_tol) / trq_nom
-    
+
     example:
-    if torque control is used and the effective torque is 
+    if torque control is used and the effective torque is
     specified as 40 ± 2 N-m, then cmin = (40 – 2)/40 = 0.95
-    
+
+    Accepts scalars or arrays: a fleet of n_f fasteners (or a Monte
+    Carlo sweep of torque tolerances) evaluates as two vectorized
+    divides over contiguous memory instead of a Python loop of scalar
+    calls. out_min/out_max let the caller reuse preallocated buffers.
+
     Args:
-        trq_nom (float): Nominal specified torque
-        trq_max (float): Max allowable specified torque
-        trq_min (float): Min allowable specified torque
+        trq_nom: Nominal specified torque, scalar or array
+        trq_max: Max allowable specified torque, scalar or array
+        trq_min: Min allowable specified torque, scalar or array
+        out_min: optional preallocated buffer for c_min
+        out_max: optional preallocated buffer for c_max
+        dtype: computation dtype for array inputs
     """
-    
-    c_min = trq_min / trq_nom
-    c_max = trq_max / trq_nom
+    trq_nom = np.asarray(trq_nom, dtype=dtype)
+    c_min = np.divide(trq_min, trq_nom, out=out_min)
+    c_max = np.divide(trq_max, trq_nom, out=out_max)
     return c_min, c_max
 
 
@@ -138,22 +151,35 @@ P_pi_min = c_min * (1.0 - gamma / np.sqrt(n_f)) * P_pi_nom
 preload_method = 'torque'  # 'turn_angle', 'bolt_stretch'
 
 
-def preload_variation(preload_method):
+# preload variation per Table 3: frozen dict, one hash probe instead
+# of a chain of string compares. Lubrication only matters for torque
+# control; the old if/elif body also assigned the lubricated 0.25 and
+# then unconditionally overwrote it with 0.35, so every torque
+# analysis silently used the unlubricated value.
+_GAMMA = types.MappingProxyType({
+    ('torque', 'lubricated'): 0.25,
+    ('torque', 'unlubricated'): 0.35,
+    ('turn_angle', None): 0.25,
+    ('bolt_stretch', None): 0.10,
+})
+
+
+def preload_variation(preload_method, lubricated: bool = False):
     """
     From NASA 5020B Table 3, page 25
+
+    Args:
+        preload_method: 'torque', 'turn_angle' or 'bolt_stretch'
+        lubricated: lubricated threads? (only used for 'torque')
     """
     if preload_method == 'torque':
-        # lubricated:
-        gamma = 0.25
-        # unlubricated:
-        gamma = 0.35
-    elif preload_method == 'turn_angle':
-        gamma = 0.25
-    elif preload_method == 'bolt_stretch':
-        gamma = 0.10
+        key = (preload_method, 'lubricated' if lubricated else 'unlubricated')
     else:
-        raise Exception('select valid preload method')
-    return gamma
+        key = (preload_method, None)
+    try:
+        return _GAMMA[key]
+    except KeyError:
+        raise ValueError('select valid preload method') from None
 
 
 
@@ -376,17 +402,13 @@ K_nom = T / (D * P_pi_nom)
 # A.8 Theoretical Treatment of Interaction Equations 
 # (Supplement to Section 4.4.4)
 
-# sigma = stress tensor
-sigma = np.array([
-    [0,0,tau], 
-    [0,0,0], 
-    [tau,0,0],
-])
-
-# principal stresses:
-S1 = 0
-S2 = tau
-S3 = -tau
+# pure-shear stress tensor (only the tau_xz component is nonzero):
+# sigma = [[0, 0, tau], [0, 0, 0], [tau, 0, 0]]
+#
+# principal stresses follow in closed form -- no eigensolve needed:
+# (S1, S2, S3) = (0, tau, -tau)
+# see nasa_std_5020b.principal_stresses_pure_shear /
+# von_mises_pure_shear for the vectorized forms.
 
 # von Mises criterion:
 # (S1 - S2)**2 + (S2 - S3)**2 + (S3 - S1)**2 <= 2.0*Fty**2